@@ -0,0 +1,70 @@
+"""
+GRINDER 모터 제어 패키지
+
+    from grinder import MotorController     # pymodbus 만 불러온다
+    from grinder import LivePlot            # 이때 matplotlib 을 불러온다
+
+이름은 처음 쓸 때 해당 모듈을 불러온다 (import grinder 자체는 아무것도 불러오지 않음).
+"""
+import importlib
+
+_EXPORTS = {
+    # 제어 (pymodbus)
+    "MotorController": "controller",
+    "MotorCore": "controller",
+    "AsyncMotorController": "async_control",
+    "DriverProfile": "drivers",
+    "get_driver": "drivers",
+    "StateTransaction": "motor_state",
+    "TelemetrySnapshot": "telemetry",
+    "read_snapshot": "telemetry",
+    "CachedClient": "register_cache",
+    "ResilientClient": "transport",
+    "RtuClient": "rtu",
+    "BusMetrics": "metrics",
+    "serve_metrics": "metrics",
+    "BusArbiter": "bus_arbiter",
+    "TelemetryPoller": "telemetry_poller",
+    "AdaptivePoller": "scheduler",
+    "PollGroup": "scheduler",
+    "Ticker": "scheduler",
+    "StallReversal": "reversal",
+    "Fleet": "fleet",
+    "Profile": "motion",
+    "ProfileExecutor": "motion",
+    "run_profile": "motion",
+    "Step": "sequence",
+    "run_sequence": "sequence",
+    "run_sequence_async": "sequence",
+    "start_steps": "sequence",
+    "stop_steps": "sequence",
+    # 시뮬레이션 / 재생
+    "MotorSimulator": "simulator",
+    "ReplayController": "replay",
+    # 데이터 (numpy)
+    "TimeSeriesBuffer": "timeseries",
+    "Recorder": "recorder",
+    "RecordingReader": "recorder",
+    "FrameDecoder": "binary_frames",
+    "SerialReader": "serial_reader",
+    "SliderCrank": "kinematics",
+    "KinematicsTable": "kinematics",
+    # 화면 (matplotlib)
+    "LivePlot": "live_plot",
+    "run": "ui",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module 'grinder' has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value  # 다음부터는 바로 찾도록
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,10 @@
+import os
+import sys
+
+from .cli import main
+
+code = main()
+sys.stdout.flush()
+sys.stderr.flush()
+# input() 에 막혀 있는 키보드 입력 스레드가 인터프리터 종료를 막지 않도록 바로 종료
+os._exit(code or 0)
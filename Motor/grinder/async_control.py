@@ -0,0 +1,287 @@
+import asyncio
+import sys
+import threading
+import time
+from collections import deque
+
+from pymodbus.client import AsyncModbusSerialClient
+
+from .controller import MotorCore
+from .telemetry import DEFAULT_TELEMETRY, TelemetrySnapshot, fill_block, plan_block_reads
+from .reversal import StallReversal, feedback_registers, logical_direction, reverse_fields
+from .sequence import run_sequence_async
+
+
+class AsyncMotorController(MotorCore):
+    """
+    asyncio 기반 모터 컨트롤러
+    스레드 대신 하나의 이벤트 루프에서 폴링, 명령, UI 를 같이 돌린다.
+    드라이버 프로파일 / max_speed 는 MotorController 와 같은 MotorCore 를 쓰고, 버스 I/O 와 set_* 만 코루틴이다.
+    """
+    def __init__(self, port="/dev/ttyUSB0", baudrate=None, device_id=None, timeout=None, max_speed=None,
+                 driver=None):
+        """
+        :param baudrate: 통신 속도 (None 이면 드라이버 프로파일 값)
+        :param device_id: Device ID (None 이면 드라이버 프로파일 값)
+        :param timeout: 응답 대기 시간 (초, None 이면 드라이버 프로파일 값)
+        :param max_speed: set_speed 상한 (None 이면 MAX_SPEED)
+        :param driver: 드라이버 프로파일 (drivers.get_driver 인자, 기본 "grinder")
+        """
+        super().__init__(driver, max_speed, device_id)
+        settings = self.driver.client_settings()
+        if baudrate is not None:
+            settings["baudrate"] = baudrate
+        if timeout is not None:
+            settings["timeout"] = timeout
+        self.client = AsyncModbusSerialClient(port=port, **settings)
+        self.lock = asyncio.Lock()  # 버스 트랜잭션 순서 보장 (await 중에도 다른 태스크는 진행)
+        self.tasks = set()
+
+    async def connect(self):
+        return await self.client.connect()
+
+    async def close(self):
+        await self.cancel_tasks()
+        await self.set_speed(0)
+        self.client.close()
+
+    async def read_register(self, address, count=1, fresh=False):
+        # 캐시가 없으므로 fresh 와 상관없이 항상 버스에서 읽는다 (MotorController 와 같은 시그니처)
+        try:
+            async with self.lock:
+                response = await self.client.read_holding_registers(
+                    address=address, count=count, slave=self.device_id
+                )
+            if response and not response.isError():
+                return response.registers
+            return None
+        except Exception:
+            return None
+
+    async def write_register(self, address, value):
+        try:
+            async with self.lock:
+                response = await self.client.write_register(
+                    address=address, value=value, slave=self.device_id
+                )
+            if response and not response.isError():
+                self.state[address] = value
+                return True
+            return False
+        except Exception:
+            return False
+
+    async def write_registers(self, address, values):
+        try:
+            async with self.lock:
+                response = await self.client.write_registers(
+                    address=address, values=values, slave=self.device_id
+                )
+            if response and not response.isError():
+                for offset, value in enumerate(values):
+                    self.state[address + offset] = value
+                return True
+            return False
+        except Exception:
+            return False
+
+    async def set_field(self, name, value):
+        write = self.field_write(name, value)
+        return await self.write_register(*write) if write is not None else False
+
+    async def set_speed(self, speed):
+        return await self.set_field("speed", speed)
+
+    async def set_cw_ccw(self, direction):
+        return await self.set_field("direction", direction)
+
+    async def set_enable(self, enable):
+        return await self.set_field("enable", enable)
+
+    async def set_brake(self, brake):
+        return await self.set_field("brake", brake)
+
+    async def get_current_RPM(self):
+        address = self.driver.address("rpm")
+        return await self.read_register(address) if address is not None else None
+
+    async def read_snapshot(self, registers=DEFAULT_TELEMETRY, max_gap=0):
+        snapshot = TelemetrySnapshot(timestamp=time.time(), monotonic=time.monotonic())
+        wanted = set(registers)
+        for start, count in plan_block_reads(wanted, max_gap=max_gap):
+            fill_block(snapshot, wanted, start, count, await self.read_register(start, count))
+        return snapshot
+
+    async def apply_state(self, speed=None, direction=None, enable=None, brake=None):
+        writes = self.state_writes(speed=speed, direction=direction, enable=enable, brake=brake)
+        if writes is None:
+            return False
+        for address, values in writes:
+            if len(values) == 1:
+                ok = await self.write_register(address, values[0])
+            else:
+                ok = await self.write_registers(address, values)
+            if not ok:
+                return False
+        return True
+
+    def transaction(self):
+        raise NotImplementedError("StateTransaction is synchronous; use await apply_state(...)")
+
+    async def start_motor(self, speed, direction=None, confirm_rpm=None, timeout=0.5):
+        steps, abort = self.start_plan(speed, direction, confirm_rpm, timeout)
+        return await run_sequence_async(self, steps, abort=abort)
+
+    async def stop_motor(self, confirm_rpm=None, timeout=0.5):
+        return await run_sequence_async(self, self.stop_plan(confirm_rpm, timeout))
+
+    def every(self, interval, func, *args):
+        """func(*args) 를 interval 초마다 실행하는 태스크 (close/cancel_tasks 로 취소)"""
+        task = asyncio.get_running_loop().create_task(periodic(interval, func, *args))
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+        return task
+
+    async def cancel_tasks(self):
+        tasks = list(self.tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def periodic(interval, func, *args):
+    # 작업 시간과 관계없이 시작 시각 기준으로 주기 유지, 밀리면 다음 주기부터 다시 맞춘다
+    # 한 번 실패해도 (예외) 로그만 남기고 다음 주기에 다시 실행 (취소는 그대로 전파)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time()
+    while True:
+        try:
+            await func(*args)
+        except Exception as e:
+            print(f"[오류] 주기 작업 {getattr(func, '__name__', func)} 실패: {type(e).__name__}: {e}", file=sys.stderr)
+        deadline += interval
+        delay = deadline - loop.time()
+        if delay < 0:
+            deadline = loop.time()
+            delay = 0
+        await asyncio.sleep(delay)
+
+
+def start_input_reader(loop, input_queue):
+    # input() 은 블로킹이라 데몬 스레드에서 읽고 이벤트 루프 큐로 넘긴다
+    def reader():
+        for line in sys.stdin:
+            loop.call_soon_threadsafe(input_queue.put_nowait, line.strip())
+        loop.call_soon_threadsafe(input_queue.put_nowait, None)
+
+    thread = threading.Thread(target=reader, daemon=True)
+    thread.start()
+    return thread
+
+
+async def user_input_handler(motor, stop_event, input_queue):
+    while not stop_event.is_set():
+        user_input = await input_queue.get()
+        if user_input is not None and user_input.isdigit():
+            user_speed = int(user_input)
+            if 0 <= user_speed <= motor.max_speed:
+                await motor.set_speed(user_speed)
+        else:
+            stop_event.set()  # 숫자가 아닌 입력은 종료
+
+
+class ControlState:
+    def __init__(self, direction=0, suspect_time=0.15):
+        self.reversal = StallReversal(direction=direction, suspect_time=suspect_time)
+        self.samples = deque(maxlen=10000)  # (경과 시간, rpm, direction)
+        self.start_time = time.monotonic()
+
+    @property
+    def direction(self):
+        return self.reversal.direction
+
+
+async def control_step(motor, state):
+    rpm_register, direction_register = feedback_registers(motor)  # motor.driver 의 주소
+    if rpm_register is None:
+        return  # RPM 을 읽을 수 없는 드라이버 -> 자동 방향 전환 없음
+    snapshot = await motor.read_snapshot([reg for reg in (direction_register, rpm_register) if reg is not None])
+    rpm = snapshot.get(rpm_register)
+    if rpm is None:
+        return
+    direction = logical_direction(motor, snapshot.get(direction_register))
+    state.samples.append((snapshot.monotonic - state.start_time, rpm, direction))
+    # 방향 레지스터 읽은 값으로 전환 명령이 반영됐는지도 확인 (타이머는 monotonic 기준)
+    new_direction = state.reversal.update(snapshot.monotonic, rpm, direction)
+    if new_direction is not None:
+        if not await motor.apply_state(**reverse_fields(motor, new_direction)):
+            state.reversal.command_failed(snapshot.monotonic)
+
+
+async def plot_rpm_and_direction(state, stop_event, run_time=10, interval=0.1):
+    # matplotlib 은 플로팅이 필요할 때만 불러온다
+    import matplotlib.pyplot as plt
+
+    plt.ion()
+    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(10, 8))
+    line_rpm, = ax1.plot([], [], 'b-', label="RPM")
+    line_direction, = ax2.plot([], [], 'r-', label="Direction")
+    ax1.set_ylim(-10, 3000)
+    ax1.set_ylabel("RPM")
+    ax1.legend(loc="upper right")
+    ax2.set_ylim(-0.5, 1.5)
+    ax2.set_yticks([0, 1])
+    ax2.set_xlabel("Time (sec)")
+    ax2.set_ylabel("Direction")
+    plt.show(block=False)
+
+    while not stop_event.is_set():
+        if not plt.fignum_exists(fig.number):  # 창을 닫으면 종료
+            stop_event.set()
+            break
+        if state.samples:
+            x_data, rpm_data, direction_data = zip(*state.samples)
+            line_rpm.set_data(x_data, rpm_data)
+            line_direction.set_data(x_data, direction_data)
+            current_time = x_data[-1]
+            left = max(0, current_time - run_time)
+            ax1.set_xlim(left, left + run_time)
+            ax2.set_xlim(left, left + run_time)
+        fig.canvas.draw_idle()
+        fig.canvas.flush_events()
+        await asyncio.sleep(interval)
+    plt.close(fig)
+
+
+async def main(port="/dev/ttyUSB0", speed=100, poll_interval=0.03, plot=True):
+    motor = AsyncMotorController(port=port, timeout=poll_interval)
+    if not await motor.connect():
+        print("[오류] Modbus 연결 실패")
+        return
+    print("모터 연결 성공")
+
+    if not await motor.apply_state(speed=speed, brake=0):
+        print("[오류] 속도 설정 / 브레이크 해제 실패")
+
+    stop_event = asyncio.Event()
+    input_queue = asyncio.Queue()
+    state = ControlState()
+    start_input_reader(asyncio.get_running_loop(), input_queue)
+
+    motor.every(poll_interval, control_step, motor, state)
+    workers = [asyncio.create_task(user_input_handler(motor, stop_event, input_queue))]
+    if plot:
+        workers.append(asyncio.create_task(plot_rpm_and_direction(state, stop_event)))
+
+    try:
+        await stop_event.wait()
+    finally:
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        await motor.close()
+    print("프로세스 종료")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(plot="--no-plot" not in sys.argv))
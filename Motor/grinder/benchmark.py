@@ -0,0 +1,274 @@
+"""
+Modbus 왕복 지연 벤치마크 (보율 x 타임아웃 x 레지스터 개수 x 쓰기 비율 스윕)
+
+    python -m grinder.benchmark --simulate --baud 9600 115200 --timeout 0.03 0.1 --count 1 2 8
+    python -m grinder.benchmark --port /dev/ttyUSB0 --baud 115200 --output results.json
+    python -m grinder.benchmark --simulate --baud 9600 --backend pymodbus rtu --timeout 0.1 auto --sim-drop 0.2
+
+결과는 JSON 으로 저장되어 실행 간 비교에 쓸 수 있다.
+"""
+import argparse
+import itertools
+import json
+import math
+import platform
+import random
+import time
+
+from pymodbus.client import ModbusSerialClient
+from pymodbus.exceptions import ModbusIOException
+from pymodbus.pdu import ExceptionResponse
+
+from .rtu import RtuClient
+from .telemetry import REG_SPEED
+from .transport import EXCEPTION
+
+# 지연 히스토그램 구간 경계 (ms, 로그 간격)
+HISTOGRAM_EDGES_MS = [0.5, 1, 2, 3, 5, 7.5, 10, 15, 20, 30, 50, 75, 100, 150, 200, 300, 500, 1000]
+
+
+def percentile(sorted_values, q):
+    """선형 보간 백분위수 (sorted_values 는 정렬된 리스트)"""
+    if not sorted_values:
+        return None
+    position = (len(sorted_values) - 1) * q / 100.0
+    low = math.floor(position)
+    high = math.ceil(position)
+    if low == high:
+        return sorted_values[low]
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (position - low)
+
+
+class LatencyHistogram:
+    def __init__(self, edges_ms=HISTOGRAM_EDGES_MS):
+        self.edges_ms = list(edges_ms)
+        self.counts = [0] * (len(self.edges_ms) + 1)  # 마지막 칸은 overflow
+        self.samples = []
+
+    def add(self, seconds):
+        ms = seconds * 1000.0
+        self.samples.append(ms)
+        for index, edge in enumerate(self.edges_ms):
+            if ms <= edge:
+                self.counts[index] += 1
+                return
+        self.counts[-1] += 1
+
+    def summary(self):
+        values = sorted(self.samples)
+        return {
+            "count": len(values),
+            "min_ms": values[0] if values else None,
+            "p50_ms": percentile(values, 50),
+            "p90_ms": percentile(values, 90),
+            "p99_ms": percentile(values, 99),
+            "max_ms": values[-1] if values else None,
+            "mean_ms": sum(values) / len(values) if values else None,
+            "buckets_ms": self.edges_ms + ["inf"],
+            "bucket_counts": self.counts,
+        }
+
+
+def classify(response, error):
+    """트랜잭션 결과 분류: ok / timeout / exception / error"""
+    if error is not None:
+        return "timeout" if isinstance(error, ModbusIOException) else "error"
+    if response is None:
+        return "timeout"
+    if isinstance(response, ExceptionResponse) or getattr(response, "kind", None) == EXCEPTION:
+        return "exception"
+    if isinstance(response, ModbusIOException) or response.isError():
+        return "timeout"
+    return "ok"
+
+
+def read_baseline(client, slave, count, attempts=5):
+    """
+    쓰기에 쓸 현재 상태 레지스터 값 (응답 누락이 있는 버스에서도 한 번의 실패로 포기하지 않게 재시도)
+    :return: (값 리스트 또는 None, 재시도 횟수)
+    """
+    for attempt in range(attempts):
+        try:
+            response = client.read_holding_registers(address=REG_SPEED, count=count, slave=slave)
+        except Exception as e:
+            response, error = None, e
+        else:
+            error = None
+        if classify(response, error) == "ok":
+            return list(response.registers), attempt
+    return None, attempts - 1
+
+
+def run_case(client, slave, address, count, write_ratio, transactions, seed=0):
+    """
+    한 조건에서 transactions 번 요청을 보내고 통계 반환
+    쓰기는 처음 읽어 둔 값을 그대로 다시 써서 모터 상태를 바꾸지 않는다 (읽기만 하는 조건은 읽어 두지 않음).
+    """
+    rng = random.Random(seed)
+    write_count = min(count, 4)  # 쓰기는 상태 레지스터(0x0001~0x0004) 범위 안에서만
+    write_values, baseline_retries = None, 0
+    if write_ratio > 0:
+        write_values, baseline_retries = read_baseline(client, slave, write_count)
+        if write_values is None:
+            return {"error": f"baseline read failed ({baseline_retries + 1} attempts)"}
+
+    reads = LatencyHistogram()
+    writes = LatencyHistogram()
+    outcomes = {"ok": 0, "timeout": 0, "exception": 0, "error": 0}
+    started = time.perf_counter()
+    for _ in range(transactions):
+        is_write = rng.random() < write_ratio
+        error = None
+        response = None
+        t0 = time.perf_counter()
+        try:
+            if not is_write:
+                response = client.read_holding_registers(address=address, count=count, slave=slave)
+            elif write_count == 1:
+                response = client.write_register(address=REG_SPEED, value=write_values[0], slave=slave)
+            else:
+                response = client.write_registers(address=REG_SPEED, values=write_values, slave=slave)
+        except Exception as e:
+            error = e
+        elapsed = time.perf_counter() - t0
+        outcome = classify(response, error)
+        outcomes[outcome] += 1
+        if outcome == "ok":
+            (writes if is_write else reads).add(elapsed)
+    duration = time.perf_counter() - started
+
+    return {
+        "transactions": transactions,
+        "duration_s": duration,
+        "tps": transactions / duration if duration else None,
+        "ok_tps": outcomes["ok"] / duration if duration else None,
+        "timeout_rate": outcomes["timeout"] / transactions,
+        "outcomes": outcomes,
+        "read_latency": reads.summary(),
+        "write_latency": writes.summary(),
+        "baseline_retries": baseline_retries,
+    }
+
+
+def make_client(port, baudrate, timeout, backend="pymodbus"):
+    # 재시도는 끄고 한 번의 왕복만 측정한다 (timeout=None 은 rtu 에서 보율로 계산)
+    if backend == "rtu":
+        return RtuClient(port, baudrate=baudrate, timeout=timeout)
+    return ModbusSerialClient(
+        port=port,
+        baudrate=baudrate,
+        bytesize=8,
+        parity="N",
+        stopbits=1,
+        timeout=timeout,
+        retries=0,
+    )
+
+
+def sweep(bauds, timeouts, counts, write_ratios, transactions=200, port=None,
+          slave=100, address=REG_SPEED, simulator_options=None, progress=print, backends=("pymodbus",)):
+    """
+    모든 조합을 돌며 결과 리스트 반환
+    port 가 None 이면 보율마다 시뮬레이터를 띄운다 (simulator_options 는 MotorSimulator 인자)
+    """
+    results = []
+    for baud in bauds:
+        simulator = None
+        target = port
+        if port is None:
+            from .simulator import MotorModel, MotorSimulator
+            options = dict(simulator_options or {})
+            model = MotorModel(register_space=max(256, address + max(counts)))
+            simulator = MotorSimulator(slave_id=slave, baudrate=baud, model=model, **options)
+            target = simulator.start()
+        try:
+            for backend, timeout, count, write_ratio in itertools.product(backends, timeouts, counts, write_ratios):
+                if timeout is None and backend != "rtu":
+                    continue  # 보율 기반 타임아웃은 rtu 백엔드만
+                client = make_client(target, baud, timeout, backend)
+                if not client.connect():
+                    progress(f"[오류] {target} 연결 실패")
+                    continue
+                try:
+                    result = run_case(client, slave, address, count, write_ratio, transactions)
+                finally:
+                    client.close()
+                result.update({
+                    "backend": backend,
+                    "baudrate": baud,
+                    "timeout": timeout,
+                    "count": count,
+                    "write_ratio": write_ratio,
+                    "target": "simulator" if simulator else target,
+                })
+                results.append(result)
+                progress(format_row(result))
+        finally:
+            if simulator:
+                simulator.stop()
+    return results
+
+
+def format_row(result):
+    timeout = "auto" if result["timeout"] is None else result["timeout"]
+    if "error" in result:
+        return (f"{result.get('backend', 'pymodbus'):<8} baud={result['baudrate']:>6} timeout={timeout:<5} "
+                f"count={result['count']:>3} write={result['write_ratio']:<4} -> {result['error']}")
+    read = result["read_latency"]
+    p50 = read["p50_ms"] if read["p50_ms"] is not None else float("nan")
+    p99 = read["p99_ms"] if read["p99_ms"] is not None else float("nan")
+    return (
+        f"{result.get('backend', 'pymodbus'):<8} baud={result['baudrate']:>6} timeout={timeout:<5} "
+        f"count={result['count']:>3} "
+        f"write={result['write_ratio']:<4} tps={result['tps']:7.1f} "
+        f"read p50={p50:6.2f}ms p99={p99:6.2f}ms timeout_rate={result['timeout_rate']:.3f}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Modbus RTU 왕복 지연 벤치마크")
+    parser.add_argument("--port", default=None, help="실제 포트 (생략 시 --simulate 필요)")
+    parser.add_argument("--simulate", action="store_true", help="pty 시뮬레이터로 측정")
+    parser.add_argument("--slave", type=int, default=100)
+    parser.add_argument("--address", type=lambda v: int(v, 0), default=REG_SPEED)
+    parser.add_argument("--baud", type=int, nargs="+", default=[115200])
+    parser.add_argument("--timeout", type=lambda v: None if v == "auto" else float(v), nargs="+",
+                        default=[0.03, 0.05, 0.1, 0.2, 0.5, 1.0], help="초, auto = 보율 기반 (rtu 백엔드)")
+    parser.add_argument("--backend", nargs="+", choices=("pymodbus", "rtu"), default=["pymodbus"])
+    parser.add_argument("--count", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--write-ratio", type=float, nargs="+", default=[0.0])
+    parser.add_argument("--transactions", type=int, default=200)
+    parser.add_argument("--sim-latency", type=float, default=0.002)
+    parser.add_argument("--sim-drop", type=float, default=0.0)
+    parser.add_argument("--output", default=None, help="결과 JSON 파일")
+    args = parser.parse_args()
+
+    if args.port is None and not args.simulate:
+        parser.error("--port 또는 --simulate 중 하나가 필요합니다.")
+
+    simulator_options = None
+    if args.simulate:
+        from .simulator import FaultInjector
+        simulator_options = {"latency": args.sim_latency, "faults": FaultInjector(drop_rate=args.sim_drop)}
+
+    results = sweep(
+        args.baud, args.timeout, args.count, args.write_ratio,
+        transactions=args.transactions,
+        port=None if args.simulate else args.port,
+        slave=args.slave,
+        address=args.address,
+        simulator_options=simulator_options,
+        backends=args.backend,
+    )
+
+    if args.output:
+        report = {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "host": platform.node(),
+            "python": platform.python_version(),
+            "args": vars(args),
+            "results": results,
+        }
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"결과 저장: {args.output}")
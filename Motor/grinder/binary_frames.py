@@ -0,0 +1,123 @@
+"""
+펌웨어(PlatformIO_motor/src/main.cpp) 바이너리 텔레메트리 프레임 디코더
+
+프레임 (little-endian, 15 bytes)
+    sync(0xA5 0x5A) | seq(u16) | timestamp_us(u32) | hallA,B,C(u16 x3) | checksum(u8)
+    checksum = seq ~ hallC 바이트 합 (mod 256)
+"""
+from collections import namedtuple
+
+import numpy as np
+
+SYNC = b"\xa5\x5a"
+SYNC_WORD = 0x5AA5  # little-endian u16 로 읽었을 때
+CHANNELS = ("hall_a", "hall_b", "hall_c")
+
+FRAME_DTYPE = np.dtype([
+    ("sync", "<u2"),
+    ("seq", "<u2"),
+    ("timestamp_us", "<u4"),
+    ("channels", "<u2", (len(CHANNELS),)),
+    ("checksum", "u1"),
+])
+FRAME_SIZE = FRAME_DTYPE.itemsize
+
+Frames = namedtuple("Frames", ["seq", "t", "channels"])  # t: 초 (펌웨어 시계), channels: (3, n)
+
+
+def checksum(raw):
+    """raw: (n, FRAME_SIZE) uint8 -> (n,) uint8"""
+    return (raw[:, 2:FRAME_SIZE - 1].sum(axis=1, dtype=np.uint32) & 0xFF).astype(np.uint8)
+
+
+def encode_frames(seq, timestamp_us, channels):
+    """테스트/시뮬레이션용 프레임 생성 (channels: (3, n))"""
+    channels = np.asarray(channels)
+    frames = np.zeros(channels.shape[1], dtype=FRAME_DTYPE)
+    frames["sync"] = SYNC_WORD
+    frames["seq"] = np.asarray(seq) & 0xFFFF
+    frames["timestamp_us"] = np.asarray(timestamp_us) & 0xFFFFFFFF
+    frames["channels"] = channels.T
+    raw = frames.view(np.uint8).reshape(-1, FRAME_SIZE)
+    frames["checksum"] = checksum(raw)
+    return frames.tobytes()
+
+
+class FrameDecoder:
+    """
+    들어온 바이트를 큰 덩어리째 받아 numpy.frombuffer 로 한 번에 해석한다.
+    정렬된 구간은 벡터 연산으로 검사하고, 깨진 프레임을 만나면 그 자리에서만 다시 동기를 잡는다.
+    seq 가 건너뛴 만큼 dropped 로 센다.
+    """
+    def __init__(self):
+        self.buffer = b""
+        self.last_seq = None
+        self.last_timestamp = None
+        self.wraps = 0  # micros() 32비트 오버플로 횟수
+        self.frames = 0
+        self.dropped = 0
+        self.bad_frames = 0
+        self.skipped_bytes = 0
+
+    def decode(self, data):
+        """
+        :param data: 새로 읽은 바이트
+        :return: Frames (새 프레임이 없으면 길이 0 배열)
+        """
+        buf = self.buffer + bytes(data)
+        pos = 0
+        chunks = []
+        while len(buf) - pos >= FRAME_SIZE:
+            if buf[pos:pos + 2] != SYNC:
+                found = buf.find(SYNC, pos + 1)
+                if found < 0:
+                    # 마지막 바이트는 다음 sync 의 앞 절반일 수 있어 남겨 둔다
+                    self.skipped_bytes += len(buf) - 1 - pos
+                    pos = len(buf) - 1
+                    break
+                self.skipped_bytes += found - pos
+                pos = found
+                continue
+            n = (len(buf) - pos) // FRAME_SIZE
+            frames = np.frombuffer(buf, dtype=FRAME_DTYPE, count=n, offset=pos)
+            raw = np.frombuffer(buf, dtype=np.uint8, count=n * FRAME_SIZE, offset=pos).reshape(n, FRAME_SIZE)
+            valid = (frames["sync"] == SYNC_WORD) & (checksum(raw) == frames["checksum"])
+            bad = np.flatnonzero(~valid)
+            good = n if not len(bad) else int(bad[0])
+            if good:
+                chunks.append(frames[:good])
+                pos += good * FRAME_SIZE
+            if good < n:
+                if frames["sync"][good] == SYNC_WORD:
+                    self.bad_frames += 1  # sync 는 맞는데 checksum 이 틀림
+                self.skipped_bytes += 1
+                pos += 1
+        self.buffer = buf[pos:]
+
+        if not chunks:
+            empty = np.zeros(0)
+            return Frames(np.zeros(0, dtype=np.uint16), empty, np.zeros((len(CHANNELS), 0)))
+        frames = np.concatenate(chunks) if len(chunks) > 1 else chunks[0]
+        self.frames += len(frames)
+        self._count_dropped(frames["seq"])
+        return Frames(frames["seq"].copy(), self._unwrap_time(frames["timestamp_us"]),
+                      frames["channels"].T.astype(np.float64))
+
+    def _count_dropped(self, seq):
+        seq = seq.astype(np.int64)
+        if self.last_seq is not None:
+            seq_all = np.concatenate(([self.last_seq], seq))
+        else:
+            seq_all = seq
+        steps = np.diff(seq_all) % 0x10000
+        self.dropped += int(np.sum(steps[steps > 0] - 1))
+        self.last_seq = int(seq[-1])
+
+    def _unwrap_time(self, timestamp_us):
+        timestamp_us = timestamp_us.astype(np.int64)
+        previous = self.last_timestamp if self.last_timestamp is not None else timestamp_us[0]
+        steps = np.diff(np.concatenate(([previous], timestamp_us)))
+        wraps = self.wraps + np.cumsum(steps < 0)
+        self.wraps = int(wraps[-1])
+        self.last_timestamp = int(timestamp_us[-1])
+        return (timestamp_us + wraps * (1 << 32)) / 1e6
@@ -0,0 +1,304 @@
+import threading
+import time
+from collections import OrderedDict, deque
+
+from pymodbus.client import ModbusSerialClient
+
+from .rtu import send_frame
+from .telemetry import REG_SPEED, REG_ENABLE, REG_BRAKE
+from .transport import SUPERSEDED, TransportError
+
+# 우선순위 (작을수록 먼저)
+PRIORITY_STOP = 0        # 정지 / 브레이크
+PRIORITY_SETPOINT = 1    # 속도, 방향 등 설정값
+PRIORITY_TELEMETRY = 2   # 폴링
+PRIORITY_NAMES = {
+    PRIORITY_STOP: "stop",
+    PRIORITY_SETPOINT: "setpoint",
+    PRIORITY_TELEMETRY: "telemetry",
+}
+
+
+def classify_write(address, values):
+    """쓰기 명령의 우선순위 판단 (정지 계열이면 PRIORITY_STOP)"""
+    for offset, value in enumerate(values):
+        reg = address + offset
+        if (reg == REG_BRAKE and value == 1) or (reg == REG_ENABLE and value == 0) \
+                or (reg == REG_SPEED and value == 0):
+            return PRIORITY_STOP
+    return PRIORITY_SETPOINT
+
+
+class Transaction:
+    """큐에 들어간 Modbus 요청 하나 (wait() 로 결과 대기)"""
+    def __init__(self, device_id, function, address, payload, priority):
+        self.device_id = device_id
+        self.function = function  # "read" / "write" / "write_many" / "frame"
+        self.address = address
+        self.payload = payload    # read: count, write: value, write_many: values, frame: rtu.CompiledFrame
+        self.priority = priority
+        self.submitted = time.monotonic()
+        self.started = None
+        self.finished = None
+        self.response = None
+        self.error = None
+        self.cancelled = False
+        self.waiters = 1          # 합쳐진 폴링 요청을 기다리는 호출자 수
+        self._done = threading.Event()
+
+    def done(self):
+        return self._done.is_set()
+
+    def wait(self, timeout=None):
+        if not self._done.wait(timeout):
+            return None
+        if self.error is not None:
+            raise self.error
+        return self.response
+
+    def _finish(self, response=None, error=None):
+        self.finished = time.monotonic()
+        self.response = response
+        self.error = error
+        self._done.set()
+
+    @property
+    def latency(self):
+        if self.finished is None:
+            return None
+        return self.finished - self.submitted
+
+
+class BusArbiter:
+    """
+    RS-485 버스 하나(시리얼 포트 하나)를 여러 device_id 가 같이 쓰도록 중재한다.
+    - 우선순위: 정지/브레이크 > 설정값 > 텔레메트리
+    - 같은 우선순위 안에서는 슬레이브별 라운드 로빈
+    - 같은 텔레메트리 요청이 이미 대기 중이면 새로 쌓지 않고 합친다
+    """
+    def __init__(self, port="/dev/ttyUSB0", baudrate=115200, timeout=0.1, client=None):
+        self.client = client or ModbusSerialClient(
+            port=port,
+            baudrate=baudrate,
+            bytesize=8,
+            parity="N",
+            stopbits=1,
+            timeout=timeout,
+        )
+        # 우선순위별로 {device_id: deque[Transaction]}, OrderedDict 순서가 라운드 로빈 순서
+        self.queues = {priority: OrderedDict() for priority in PRIORITY_NAMES}
+        self.condition = threading.Condition()
+        self.running = False
+        self.worker = None
+        self.completed = 0
+        self.max_wait = {priority: 0.0 for priority in PRIORITY_NAMES}
+
+    def connect(self):
+        if not self.client.connect():
+            return False
+        self.start()
+        return True
+
+    def start(self):
+        with self.condition:
+            if self.running:
+                return
+            self.running = True
+        self.worker = threading.Thread(target=self._run, daemon=True)
+        self.worker.start()
+
+    def close(self):
+        with self.condition:
+            self.running = False
+            self.condition.notify_all()
+        if self.worker:
+            self.worker.join()
+        # 남은 요청은 실패 처리
+        with self.condition:
+            for per_device in self.queues.values():
+                for queue in per_device.values():
+                    for transaction in queue:
+                        transaction.cancelled = True
+                        transaction._finish(error=ConnectionError("bus arbiter closed"))
+                per_device.clear()
+        self.client.close()
+
+    # ---- 요청 등록 ----
+    def submit(self, transaction):
+        with self.condition:
+            if not self.running:
+                transaction._finish(error=ConnectionError("bus arbiter not running"))
+                return transaction
+            per_device = self.queues[transaction.priority]
+            queue = per_device.setdefault(transaction.device_id, deque())
+            if transaction.function == "read":
+                for pending in queue:
+                    if pending.address == transaction.address and pending.payload == transaction.payload:
+                        pending.waiters += 1
+                        return pending  # 같은 폴링 요청은 합친다
+            if transaction.priority == PRIORITY_STOP:
+                self._drop_setpoints(transaction.device_id)
+            queue.append(transaction)
+            self.condition.notify()
+        return transaction
+
+    def _drop_setpoints(self, device_id):
+        # 정지 명령이 먼저 나가므로, 그 전에 쌓인 설정값이 정지를 덮어쓰지 않게 취소한다
+        # (버스 장애가 아니므로 타임아웃과 구분되는 superseded 응답으로 끝낸다)
+        queue = self.queues[PRIORITY_SETPOINT].pop(device_id, None)
+        for transaction in queue or ():
+            transaction.cancelled = True
+            transaction._finish(response=TransportError(SUPERSEDED, "superseded by a stop command"))
+
+    def cancel(self, transaction):
+        """
+        아직 버스에 나가지 않은 요청을 큐에서 뺀다 (기다리다 포기한 호출자용)
+        :return: 취소했으면 True, 이미 보내는 중/끝났거나 합쳐진 다른 호출자가 기다리면 False
+        """
+        with self.condition:
+            if transaction.started is not None or transaction.done():
+                return False
+            transaction.waiters -= 1
+            if transaction.waiters > 0:
+                return False
+            per_device = self.queues[transaction.priority]
+            queue = per_device.get(transaction.device_id)
+            if queue is not None and transaction in queue:
+                queue.remove(transaction)
+                if not queue:
+                    del per_device[transaction.device_id]
+            transaction.cancelled = True
+            transaction._finish(response=None)
+            return True
+
+    def read(self, device_id, address, count=1, priority=PRIORITY_TELEMETRY):
+        return self.submit(Transaction(device_id, "read", address, count, priority))
+
+    def write(self, device_id, address, value, priority=None):
+        if priority is None:
+            priority = classify_write(address, [value])
+        return self.submit(Transaction(device_id, "write", address, value, priority))
+
+    def write_many(self, device_id, address, values, priority=None):
+        values = list(values)
+        if priority is None:
+            priority = classify_write(address, values)
+        return self.submit(Transaction(device_id, "write_many", address, values, priority))
+
+    def frame(self, device_id, frame, priority=None):
+        if priority is None:
+            priority = classify_write(frame.address, frame.values)
+        return self.submit(Transaction(device_id, "frame", frame.address, frame, priority))
+
+    def client_for(self, timeout=None):
+        """MotorController(client=...) 로 넣는 어댑터 (캐시/재연결/계측 계층 아래에 들어간다)"""
+        return ArbitratedClient(self, timeout)
+
+    # ---- 상태 ----
+    def queue_depth(self):
+        with self.condition:
+            depth = {
+                PRIORITY_NAMES[priority]: sum(len(queue) for queue in per_device.values())
+                for priority, per_device in self.queues.items()
+            }
+        depth["total"] = sum(depth.values())
+        return depth
+
+    def depth_by_device(self):
+        depth = {}
+        with self.condition:
+            for per_device in self.queues.values():
+                for device_id, queue in per_device.items():
+                    depth[device_id] = depth.get(device_id, 0) + len(queue)
+        return depth
+
+    # ---- 워커 ----
+    def _next(self):
+        for priority in sorted(self.queues):
+            per_device = self.queues[priority]
+            for device_id in list(per_device):
+                queue = per_device[device_id]
+                if not queue:
+                    del per_device[device_id]
+                    continue
+                transaction = queue.popleft()
+                transaction.started = time.monotonic()  # 락 안에서 표시해야 cancel() 과 엇갈리지 않는다
+                # 처리한 슬레이브는 맨 뒤로 -> 같은 우선순위에서 라운드 로빈
+                per_device.move_to_end(device_id)
+                if not queue:
+                    del per_device[device_id]
+                return transaction
+        return None
+
+    def _run(self):
+        while True:
+            with self.condition:
+                transaction = self._next()
+                while transaction is None and self.running:
+                    self.condition.wait()
+                    transaction = self._next()
+                if transaction is None:
+                    return
+            self._execute(transaction)
+
+    def _execute(self, transaction):
+        waited = transaction.started - transaction.submitted
+        if waited > self.max_wait[transaction.priority]:
+            self.max_wait[transaction.priority] = waited
+        try:
+            if transaction.function == "read":
+                response = self.client.read_holding_registers(
+                    address=transaction.address, count=transaction.payload, slave=transaction.device_id
+                )
+            elif transaction.function == "write":
+                response = self.client.write_register(
+                    address=transaction.address, value=transaction.payload, slave=transaction.device_id
+                )
+            elif transaction.function == "write_many":
+                response = self.client.write_registers(
+                    address=transaction.address, values=transaction.payload, slave=transaction.device_id
+                )
+            else:
+                send = getattr(self.client, "send_frame", None)  # RtuClient
+                response = send(transaction.payload) if send else send_frame(self.client, transaction.payload)
+            transaction._finish(response=response)
+        except Exception as e:
+            transaction._finish(error=e)
+        self.completed += 1
+
+
+class ArbitratedClient:
+    """
+    ModbusSerialClient 와 같은 모양의 메서드를 BusArbiter 큐로 넘기는 어댑터
+        motor = MotorController(client=arbiter.client_for(), device_id=101)
+    """
+    def __init__(self, arbiter, timeout=None):
+        self.arbiter = arbiter
+        self.timeout = timeout
+
+    def connect(self):
+        return self.arbiter.running
+
+    def close(self):
+        pass  # 포트는 arbiter 가 관리
+
+    def _wait(self, transaction):
+        response = transaction.wait(self.timeout)
+        if response is None and not transaction.done():
+            # 실패로 돌려주는 요청이 나중에 버스에 나가 더 새로운 명령을 덮어쓰지 않게 큐에서 뺀다
+            # (이미 보내는 중이면 그대로 늦게 끝난다)
+            self.arbiter.cancel(transaction)
+        return response
+
+    def read_holding_registers(self, address, count=1, slave=0, **kwargs):
+        return self._wait(self.arbiter.read(slave, address, count))
+
+    def write_register(self, address, value, slave=0, **kwargs):
+        return self._wait(self.arbiter.write(slave, address, value))
+
+    def write_registers(self, address, values, slave=0, **kwargs):
+        return self._wait(self.arbiter.write_many(slave, address, values))
+
+    def send_frame(self, frame):
+        # 미리 만든 RTU 프레임 (frame.request 의 slave 주소 그대로)
+        return self._wait(self.arbiter.frame(frame.slave, frame))
@@ -0,0 +1,214 @@
+"""
+화면 없이 쓸 수 있는 명령줄 도구
+
+    python -m grinder status --port /dev/ttyUSB0
+    python -m grinder --driver hoder --port /dev/ttyUSB2 status
+    python -m grinder set --speed 80 --direction 1 --enable 1 --brake 0
+    python -m grinder start --speed 70 --direction 1 --confirm-rpm 30   # 단계마다 읽어서 확인
+    python -m grinder stop --confirm-rpm 10
+    python -m grinder --driver hoder --port /dev/ttyUSB2 command brake_off
+    python -m grinder profile schedule.json   # [{"set": {"speed": 40, "brake": 0}}, {"hold": 2}, ...]
+    python -m grinder run --speed 70                       # 키보드 제어 + 자동 방향 전환 (플롯 없음)
+    python -m grinder run --speed 70 --plot rpm-direction --mpl-backend TkAgg  # 플롯은 matplotlib 이 있을 때만
+    python -m grinder fleet fleet.json --speed 50  # [{"name": "rig1", "port": "/dev/ttyUSB0"}, ...] 포트당 프로세스
+"""
+import argparse
+import json
+import sys
+import time
+
+from .controller import MotorController
+
+
+def _connect(args):
+    motor = MotorController(port=args.port, baudrate=args.baud, device_id=args.device_id, timeout=args.timeout,
+                            max_speed=args.max_speed, driver=args.driver, backend=args.backend)
+    if not motor.connect():
+        print(f"[오류] Modbus 연결 실패 ({args.port})", file=sys.stderr)
+        sys.exit(1)
+    return motor
+
+
+def cmd_status(args):
+    motor = _connect(args)
+    try:
+        # 드라이버 프로파일의 레지스터 전부 (인접한 것은 한 번에)
+        registers = motor.driver.registers.values()
+        snapshot = motor.read_snapshot([reg.address for reg in registers])
+        values = {reg.name: (None if snapshot.get(reg.address) is None else reg.decode(snapshot.get(reg.address)))
+                  for reg in registers}
+        print(json.dumps({"timestamp": snapshot.timestamp, **values}))
+        return 0 if snapshot.complete else 1
+    finally:
+        motor.client.close()  # close() 는 속도를 0 으로 쓰므로 읽기만 할 때는 포트만 닫는다
+
+
+def cmd_set(args):
+    motor = _connect(args)
+    try:
+        ok = motor.apply_state(speed=args.speed, direction=args.direction, enable=args.enable, brake=args.brake)
+        print("ok" if ok else "[오류] 쓰기 실패")
+        return 0 if ok else 1
+    finally:
+        motor.client.close()
+
+
+def _print_sequence(result):
+    for step in result.steps:
+        print(step)
+    if result.aborted:
+        print("[정지 시퀀스]")
+        _print_sequence(result.aborted)
+
+
+def cmd_command(args):
+    motor = _connect(args)
+    try:
+        if args.name not in motor.frames:
+            print(f"[오류] 명령 없음: {args.name} (가능: {', '.join(motor.frames)})", file=sys.stderr)
+            return 1
+        ok = motor.initialize() and motor.command(args.name)
+        print("ok" if ok else "[오류] 명령 실패")
+        return 0 if ok else 1
+    finally:
+        motor.client.close()
+
+
+def cmd_start(args):
+    motor = _connect(args)
+    try:
+        result = motor.start_motor(args.speed, args.direction, args.confirm_rpm, args.step_timeout)
+        _print_sequence(result)
+        print(f"{'ok' if result.ok else '[오류] 시동 실패'} ({result.elapsed * 1000:.0f}ms)")
+        return 0 if result.ok else 1
+    finally:
+        motor.client.close()
+
+
+def cmd_stop(args):
+    motor = _connect(args)
+    try:
+        result = motor.stop_motor(args.confirm_rpm, args.step_timeout)
+        _print_sequence(result)
+        print(f"{'ok' if result.ok else '[오류] 정지 명령 실패'} ({result.elapsed * 1000:.0f}ms)")
+        return 0 if result.ok else 1
+    finally:
+        motor.client.close()
+
+
+def cmd_profile(args):
+    from .motion import Profile, run_profile
+
+    profile = Profile.load(args.schedule)
+    motor = _connect(args)
+    try:
+        report = run_profile(motor, profile)
+    finally:
+        motor.client.close()
+    for timing in report.timings:
+        status = "ok" if timing.ok else "FAILED"
+        print(f"{timing.target:8.3f}s {timing.command.label:<40} {status:<6} {timing.error * 1000:+7.2f}ms")
+    print(json.dumps(report.summary()))
+    return 0 if report.ok else 1
+
+
+def cmd_run(args):
+    from .ui import run
+
+    motor = _connect(args)
+    try:
+        stats = run(motor, speed=args.speed, plot=args.plot, run_time=args.window, metrics_port=args.metrics_port,
+                    duration=args.duration, backend=args.mpl_backend, verbose=args.verbose)
+    finally:
+        motor.close()
+    if args.verbose:
+        print(json.dumps(stats, default=str))
+    return 0
+
+
+def cmd_fleet(args):
+    from .fleet import Fleet
+
+    fleet = Fleet.load(args.config, pin=not args.no_pin).start()
+    try:
+        for name, connected in fleet.connected.items():
+            if not connected:
+                print(f"[경고] {name}: 연결 실패 (워커가 계속 재시도)", file=sys.stderr)
+        if args.speed is not None:
+            for ack in fleet.apply_state(speed=args.speed, brake=0).values():
+                print(ack)
+        deadline = time.monotonic() + args.duration if args.duration else None
+        while deadline is None or time.monotonic() < deadline:
+            time.sleep(args.refresh)
+            print(fleet.view(), end="\n\n", flush=True)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        fleet.stop()  # 워커가 속도 0 을 쓰고 포트를 닫는다
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m grinder", description="GRINDER 모터 드라이버 제어")
+    parser.add_argument("--port", default="/dev/ttyUSB0")
+    parser.add_argument("--driver", default="grinder", help="드라이버 프로파일 (grinder, hoder 또는 JSON 경로)")
+    parser.add_argument("--backend", choices=("pymodbus", "rtu"), default="pymodbus",
+                        help="rtu: pyserial 직접 사용, 타임아웃은 보율로 계산")
+    parser.add_argument("--baud", type=int, default=None, help="기본값은 드라이버 프로파일")
+    parser.add_argument("--device-id", type=int, default=None, help="기본값은 드라이버 프로파일")
+    parser.add_argument("--timeout", type=float, default=None, help="기본값은 드라이버 프로파일")
+    parser.add_argument("--max-speed", type=int, default=MotorController.MAX_SPEED)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("status", help="드라이버 레지스터 한 번 읽기 (JSON)").set_defaults(func=cmd_status)
+
+    set_parser = commands.add_parser("set", help="속도/방향/활성화/브레이크 쓰기")
+    set_parser.add_argument("--speed", type=int)
+    set_parser.add_argument("--direction", type=int, choices=(0, 1))
+    set_parser.add_argument("--enable", type=int, choices=(0, 1))
+    set_parser.add_argument("--brake", type=int, choices=(0, 1))
+    set_parser.set_defaults(func=cmd_set)
+
+    command_parser = commands.add_parser("command", help="드라이버 프로파일의 고정 명령 (brake_on, cw 등)")
+    command_parser.add_argument("name")
+    command_parser.set_defaults(func=cmd_command)
+
+    start_parser = commands.add_parser("start", help="속도 -> 방향 -> 브레이크 해제 -> 활성화 (단계마다 확인)")
+    start_parser.add_argument("--speed", type=int, required=True)
+    start_parser.add_argument("--direction", type=int, choices=(0, 1))
+    start_parser.add_argument("--confirm-rpm", type=int, default=None, help="RPM 이 이 값 이상이 될 때까지 대기")
+    start_parser.add_argument("--step-timeout", type=float, default=0.5)
+    start_parser.set_defaults(func=cmd_start)
+
+    stop_parser = commands.add_parser("stop", help="속도 0 -> 비활성화 -> 브레이크 (단계마다 확인)")
+    stop_parser.add_argument("--confirm-rpm", type=int, default=None, help="RPM 이 이 값 이하가 될 때까지 대기")
+    stop_parser.add_argument("--step-timeout", type=float, default=0.5)
+    stop_parser.set_defaults(func=cmd_stop)
+
+    profile_parser = commands.add_parser("profile", help="JSON 모션 프로파일을 정해진 시각에 실행")
+    profile_parser.add_argument("schedule")
+    profile_parser.set_defaults(func=cmd_profile)
+
+    run_parser = commands.add_parser("run", help="키보드 제어 + 자동 방향 전환")
+    run_parser.add_argument("--speed", type=int, default=None, help="시작 속도 (브레이크 해제)")
+    run_parser.add_argument("--plot", choices=("rpm", "rpm-direction"), default=None)
+    run_parser.add_argument("--mpl-backend", dest="mpl_backend", default=None, help="matplotlib 백엔드 (예: TkAgg)")
+    run_parser.add_argument("--window", type=float, default=20, help="플롯 시간 폭 (초)")
+    run_parser.add_argument("--duration", type=float, default=None, help="이 시간(초) 뒤 종료")
+    run_parser.add_argument("--metrics-port", type=int, default=None)
+    run_parser.add_argument("--verbose", action="store_true")
+    run_parser.set_defaults(func=cmd_run)
+
+    fleet_parser = commands.add_parser("fleet", help="여러 포트의 모터를 포트당 프로세스로 폴링/제어")
+    fleet_parser.add_argument("config", help="JSON [{\"name\", \"port\", \"driver\", \"backend\", ...}]")
+    fleet_parser.add_argument("--speed", type=int, default=None, help="시작할 때 모든 모터에 쓸 속도 (브레이크 해제)")
+    fleet_parser.add_argument("--refresh", type=float, default=0.5, help="표 갱신 간격 (초)")
+    fleet_parser.add_argument("--duration", type=float, default=None, help="이 시간(초) 뒤 종료")
+    fleet_parser.add_argument("--no-pin", action="store_true", help="워커를 CPU 에 고정하지 않음")
+    fleet_parser.set_defaults(func=cmd_fleet)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
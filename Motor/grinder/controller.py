@@ -0,0 +1,251 @@
+"""
+MotorController - Modbus RTU 모터 드라이버 제어 (pymodbus 만 필요, matplotlib/numpy 불필요)
+
+    from grinder import MotorController
+    motor = MotorController(port="/dev/ttyUSB0", max_speed=300)
+    motor.connect()
+    motor.apply_state(speed=100, brake=0, enable=1)
+
+    hoder = MotorController(port="/dev/ttyUSB2", driver="hoder")  # 레지스터 맵/통신 설정은 drivers.py
+    hoder.initialize()
+    hoder.command("brake_off")
+
+클라이언트는 아래처럼 쌓여 있다
+    CachedClient(설정 레지스터 캐시) -> ResilientClient(재연결) -> MeteredClient(계측) -> ModbusSerialClient
+맨 아래는 backend="rtu" 로 rtu.RtuClient (pyserial 직접, 보율로 계산한 타임아웃) 로 바꿀 수 있고,
+client= 로 직접 넣을 수도 있다 (예: 한 버스를 나눠 쓸 때 bus_arbiter.BusArbiter.client_for()).
+"""
+from pymodbus.client import ModbusSerialClient
+
+from .metrics import BusMetrics, MeteredClient, TimedLock, flatten_stats, serve_metrics
+from .drivers import get_driver
+from .motor_state import StateTransaction, plan_state_writes
+from .register_cache import CachedClient
+from .rtu import RtuClient
+from .sequence import run_sequence, start_steps, stop_steps
+from .telemetry import DEFAULT_TELEMETRY, read_snapshot
+from .transport import ResilientClient
+
+
+class MotorCore:
+    """
+    컨트롤러 공통 부분 - 드라이버 프로파일 / 속도 상한 / device_id / 마지막으로 쓴 상태
+    MotorController, async_control.AsyncMotorController, replay.ReplayController 가 이것을 상속하고
+    read_register / write_register / write_registers 만 각자 구현한다 (async 는 set_* 도 코루틴으로 덮어씀)
+    """
+    MAX_SPEED = 100
+
+    def __init__(self, driver=None, max_speed=None, device_id=None):
+        """
+        :param driver: 드라이버 프로파일 (drivers.get_driver 인자, 기본 "grinder")
+        :param max_speed: set_speed 상한 (None 이면 MAX_SPEED)
+        :param device_id: Device ID (None 이면 드라이버 프로파일 값)
+        """
+        self.driver = get_driver(driver)
+        self.max_speed = self.MAX_SPEED if max_speed is None else max_speed
+        self.device_id = self.driver.slave if device_id is None else device_id
+        self.state = {}  # 마지막으로 쓴 상태 레지스터 값 {주소: raw}
+
+    @property
+    def limits(self):
+        return {"speed": (0, self.max_speed)}
+
+    def field_write(self, name, value):
+        """필드 하나 -> (주소, raw), 범위를 벗어나면 None"""
+        pending = self.driver.encode_state(self.limits, **{name: value})
+        if not pending:
+            return None
+        (address, raw), = pending.items()
+        return address, raw
+
+    def state_writes(self, **fields):
+        """apply_state 의 쓰기 계획 [(시작 주소, [값, ...])], 범위를 벗어난 값이 있으면 None"""
+        pending = self.driver.encode_state(self.limits, **fields)
+        if pending is None:
+            return None
+        return plan_state_writes(pending, self.state)
+
+    def start_plan(self, speed, direction=None, confirm_rpm=None, timeout=0.5):
+        """(시동 단계, 실패 시 정지 단계)"""
+        if self.driver.encode_state(self.limits, speed=speed, direction=direction) is None:
+            raise ValueError(f"invalid start state: speed={speed}, direction={direction}")
+        return start_steps(speed, direction, confirm_rpm, timeout, driver=self.driver), stop_steps(driver=self.driver)
+
+    def stop_plan(self, confirm_rpm=None, timeout=0.5):
+        return stop_steps(confirm_rpm, timeout, driver=self.driver)
+
+    def set_field(self, name, value):
+        write = self.field_write(name, value)
+        return self.write_register(*write) if write is not None else False
+
+    def set_speed(self, speed):
+        return self.set_field("speed", speed)
+
+    def set_cw_ccw(self, direction):
+        return self.set_field("direction", direction)
+
+    def set_enable(self, enable):
+        return self.set_field("enable", enable)
+
+    def set_brake(self, brake):
+        return self.set_field("brake", brake)
+
+    def get_current_RPM(self):
+        address = self.driver.address("rpm")
+        return self.read_register(address) if address is not None else None
+
+    def apply_state(self, speed=None, direction=None, enable=None, brake=None):
+        # 속도/방향/활성화/브레이크를 FC16 한 번으로 쓴다 (None 은 변경 안 함)
+        writes = self.state_writes(speed=speed, direction=direction, enable=enable, brake=brake)
+        if writes is None:
+            return False
+        for address, values in writes:
+            if len(values) == 1:
+                ok = self.write_register(address, values[0])
+            else:
+                ok = self.write_registers(address, values)
+            if not ok:
+                return False
+        return True
+
+    def transaction(self):
+        return StateTransaction(self)
+
+
+class MotorController(MotorCore):
+    def __init__(self, port="/dev/ttyUSB0", baudrate=None, device_id=None, timeout=None, max_speed=None,
+                 verify_interval=1.0, driver=None, backend="pymodbus", client=None):
+        """
+        :param port: USB 포트 경로
+        :param baudrate: 통신 속도 (None 이면 드라이버 프로파일 값)
+        :param device_id: Device ID (None 이면 드라이버 프로파일 값)
+        :param timeout: 응답 대기 시간 (초, None 이면 드라이버 프로파일 값)
+        :param max_speed: set_speed 상한 (None 이면 MAX_SPEED)
+        :param verify_interval: 캐시된 설정 레지스터를 실제로 다시 읽어 확인하는 주기 (초)
+        :param driver: 드라이버 프로파일 (drivers.get_driver 인자, 기본 "grinder")
+        :param backend: "pymodbus" (ModbusSerialClient) 또는 "rtu" (RtuClient, timeout=None 이면 보율로 계산)
+        :param client: 맨 아래 버스 클라이언트를 직접 지정 (지정하면 port/baudrate/timeout/backend 는 쓰지 않음)
+        """
+        super().__init__(driver, max_speed, device_id)
+        settings = self.driver.client_settings()
+        if baudrate is not None:
+            settings["baudrate"] = baudrate
+        if timeout is not None:
+            settings["timeout"] = timeout
+        if client is not None:
+            serial_client = client
+        elif backend == "rtu":
+            if timeout is None:
+                settings.pop("timeout", None)  # 프로파일의 고정 타임아웃 대신 보율/프레임 길이로 계산
+            serial_client = RtuClient(port, **settings)
+        elif backend == "pymodbus":
+            serial_client = ModbusSerialClient(port=port, **settings)
+        else:
+            raise ValueError(f"unknown backend: {backend}")
+        self.metrics = BusMetrics()  # 요청마다 시간/오류/바이트 기록
+        # 끊기면 백오프로 다시 연결하고 마지막으로 쓴 상태를 복원
+        self.transport = ResilientClient(MeteredClient(serial_client, self.metrics))
+        # 설정 레지스터는 캐시해서 같은 값 쓰기/읽기는 버스로 보내지 않는다
+        self.client = CachedClient(self.transport, policies=self.driver.policies, verify_interval=verify_interval)
+        self.transport.on_reconnect.append(self.client.invalidate)
+        self.frames = self.driver.frames(self.device_id)  # 고정 명령의 RTU 프레임 (미리 인코딩)
+        self.lock = TimedLock(self.metrics)  # 락 대기 시간도 기록
+
+    def connect(self):
+        return self.client.connect()
+
+    def close(self):
+        self.set_speed(0)
+        self.client.close()
+
+    def read_register(self, address, count=1, fresh=False):
+        # fresh=True 면 캐시된 설정 레지스터도 실제로 읽는다
+        try:
+            with self.lock:
+                response = self.client.read_holding_registers(
+                    address=address, count=count, slave=self.device_id, fresh=fresh
+                )
+            if response and not response.isError():
+                return response.registers
+            return None
+        except:
+            return None
+
+    def write_register(self, address, value):
+        try:
+            with self.lock:
+                response = self.client.write_register(
+                    address=address, value=value, slave=self.device_id
+                )
+            if response and not response.isError():
+                self.state[address] = value
+                return True
+            return False
+        except:
+            return False
+
+    def write_registers(self, address, values):
+        # FC16: 연속 레지스터를 한 번에 쓰기
+        try:
+            with self.lock:
+                response = self.client.write_registers(
+                    address=address, values=values, slave=self.device_id
+                )
+            if response and not response.isError():
+                for offset, value in enumerate(values):
+                    self.state[address + offset] = value
+                return True
+            return False
+        except:
+            return False
+
+    def send_frame(self, frame):
+        # 미리 만든 RTU 프레임 (rtu.CompiledFrame) 전송, 인코딩 없음
+        try:
+            with self.lock:
+                response = self.client.send_frame(frame)
+            if response and not response.isError():
+                for offset, value in enumerate(frame.values):
+                    self.state[frame.address + offset] = value
+                return True
+            return False
+        except:
+            return False
+
+    def command(self, name):
+        """드라이버 프로파일의 고정 명령 (예: "brake_on", "cw") 전송"""
+        return all(self.send_frame(frame) for frame in self.frames[name])
+
+    def initialize(self):
+        """드라이버 프로파일의 초기화 순서 실행 (예: hoder 통신 모드 기동)"""
+        if not self.driver.init:
+            return True
+        from .motion import Profile, run_profile
+        return run_profile(self, Profile.from_list(self.driver.init, self.driver.fields)).ok
+
+    def read_snapshot(self, registers=DEFAULT_TELEMETRY, max_gap=0):
+        # 인접한 레지스터는 한 번의 FC3 요청으로 묶어서 읽는다
+        return read_snapshot(self.read_register, registers, max_gap=max_gap)
+
+    def start_motor(self, speed, direction=None, confirm_rpm=None, timeout=0.5):
+        # 단계마다 드라이버 값을 읽어 확인하고 바로 다음 단계로 (실패하면 정지 시퀀스)
+        steps, abort = self.start_plan(speed, direction, confirm_rpm, timeout)
+        return run_sequence(self, steps, abort=abort)
+
+    def stop_motor(self, confirm_rpm=None, timeout=0.5):
+        return run_sequence(self, self.stop_plan(confirm_rpm, timeout))
+
+    def stats(self):
+        # 버스 계측 / 재연결 / 캐시 통계
+        return {
+            "bus": self.metrics.stats(),
+            "transport": self.transport.stats(),
+            "cache": self.client.stats(),
+        }
+
+    def start_metrics_server(self, port=9105):
+        # http://127.0.0.1:<port>/metrics 로 Prometheus 형식 통계 제공
+        return serve_metrics(self.metrics, port, extra=lambda: {
+            **flatten_stats("cache", self.client.stats()),
+            **flatten_stats("transport", self.transport.stats()),
+        })
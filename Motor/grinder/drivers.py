@@ -0,0 +1,202 @@
+"""
+드라이버 프로파일 - 레지스터 맵 / 스케일 / 범위 / 초기화 순서 / 통신 설정을 데이터로 기술
+
+    driver = get_driver("hoder")            # 내장 프로파일 또는 JSON 파일 경로
+    motor = MotorController(port="/dev/ttyUSB2", driver=driver)   # 9600bps, slave 1
+    motor.initialize()                      # 통신 모드 기동 (init 순서)
+    motor.command("brake_off")              # 미리 만든 RTU 프레임을 그대로 전송
+
+새 드라이버는 아래 GRINDER/HODER 와 같은 모양의 dict(또는 JSON)만 추가하면 된다.
+    registers: {이름: {"address", "access": "rw"|"r", "range": [lo, hi] | "values": [...],
+                       "scale": 1 (값 = raw * scale), "unit", "cache": "host"|"volatile"}}
+    init: motion.Profile.from_list 형식 ([{"set": {...}}, {"hold": 초}, ...])
+    commands: {이름: {필드: 값, ...}} -> 불러올 때 RTU 프레임/CRC 까지 미리 만든다
+"""
+import json
+
+from .motor_state import plan_state_writes
+from .register_cache import HOST, VOLATILE
+from .rtu import compile_write
+
+GRINDER = {
+    "name": "grinder",
+    "link": {"baudrate": 115200, "bytesize": 8, "parity": "N", "stopbits": 1, "slave": 100, "timeout": 0.1},
+    "registers": {
+        "speed": {"address": 0x0001, "range": [0, 300], "cache": "host"},
+        "direction": {"address": 0x0002, "values": [0, 1], "cache": "host"},
+        "enable": {"address": 0x0003, "values": [0, 1], "cache": "host"},
+        "brake": {"address": 0x0004, "values": [0, 1], "cache": "host"},
+        "rpm": {"address": 0x0015, "access": "r", "unit": "rpm"},
+        "current": {"address": 0x0016, "access": "r"},
+    },
+    "init": [],
+    "commands": {
+        "brake_on": {"brake": 1},
+        "brake_off": {"brake": 0},
+        "enable": {"enable": 1},
+        "disable": {"enable": 0},
+        "forward": {"direction": 0},
+        "reverse": {"direction": 1},
+        "stop": {"speed": 0},
+    },
+}
+
+HODER = {
+    "name": "hoder",
+    "link": {"baudrate": 9600, "bytesize": 8, "parity": "N", "stopbits": 1, "slave": 1, "timeout": 1.0},
+    "registers": {
+        "mode": {"address": 0x0023, "values": [0, 1], "cache": "host"},       # 0 = RS-485 통신 모드
+        "speed": {"address": 0x0024, "range": [0, 100], "unit": "%", "cache": "host"},  # PWM
+        "direction": {"address": 0x0025, "values": [1, 2], "cache": "host"},  # 1 = CW, 2 = CCW
+        "brake": {"address": 0x0026, "values": [0, 1], "cache": "host"},
+    },
+    "init": [{"set": {"mode": 0}}, {"hold": 0.1}],  # 통신 모드 기동 후 전환 대기
+    "commands": {
+        "comm_mode": {"mode": 0},
+        "brake_on": {"brake": 1},
+        "brake_off": {"brake": 0},
+        "cw": {"direction": 1},
+        "ccw": {"direction": 2},
+        "stop": {"speed": 0},
+    },
+}
+
+
+class Register:
+    def __init__(self, name, address, access="rw", scale=1, range=None, values=None, unit="", cache=VOLATILE):
+        if access not in ("r", "rw"):
+            raise ValueError(f"{name}: access must be 'r' or 'rw'")
+        if cache not in (HOST, VOLATILE):
+            raise ValueError(f"{name}: cache must be '{HOST}' or '{VOLATILE}'")
+        self.name = name
+        self.address = address
+        self.access = access
+        self.scale = scale
+        self.range = tuple(range) if range is not None else None
+        self.values = tuple(values) if values is not None else None
+        self.unit = unit
+        self.cache = cache
+
+    @property
+    def writable(self):
+        return self.access == "rw"
+
+    def valid(self, value, limit=None):
+        if self.values is not None and value not in self.values:
+            return False
+        # limit (예: 컨트롤러 max_speed) 는 레지스터 범위를 좁히기만 한다
+        for low, high in (self.range or (None, None), limit or (None, None)):
+            if low is not None and value < low:
+                return False
+            if high is not None and value > high:
+                return False
+        return True
+
+    def encode(self, value):
+        raw = int(round(value / self.scale))
+        if not 0 <= raw <= 0xFFFF:
+            raise ValueError(f"{self.name}={value} does not fit in a register")
+        return raw
+
+    def decode(self, raw):
+        return raw * self.scale if self.scale != 1 else raw
+
+
+class DriverProfile:
+    """
+    :param spec: GRINDER / HODER 와 같은 모양의 dict
+    """
+    def __init__(self, spec):
+        self.spec = spec
+        self.name = spec["name"]
+        self.link = dict(spec.get("link", {}))
+        self.registers = {name: Register(name, **fields) for name, fields in spec["registers"].items()}
+        self.init = list(spec.get("init", []))
+        self.commands = {}
+        for name, fields in spec.get("commands", {}).items():
+            pending = self.encode_state(**fields)
+            if not pending:
+                raise ValueError(f"{self.name}: invalid command {name}: {fields}")
+            self.commands[name] = pending
+        self._frames = {}  # slave -> {명령 이름: [CompiledFrame]}
+        self.frames(self.slave)  # 기본 slave 프레임은 불러올 때 만든다
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    @property
+    def slave(self):
+        return self.link.get("slave", 1)
+
+    @property
+    def fields(self):
+        """쓰기 가능한 {이름: 주소} (motion.Profile 용)"""
+        return {name: reg.address for name, reg in self.registers.items() if reg.writable}
+
+    @property
+    def policies(self):
+        """CachedClient 캐시 정책 {주소: HOST|VOLATILE}"""
+        return {reg.address: reg.cache for reg in self.registers.values()}
+
+    def address(self, name):
+        reg = self.registers.get(name)
+        return reg.address if reg is not None else None
+
+    def encode_state(self, limits=None, **fields):
+        """
+        {이름: 값} -> {주소: raw} (None 인 항목은 제외)
+        :param limits: {이름: (lo, hi)} 프로파일 범위에 더해 적용할 범위 (예: 컨트롤러 max_speed, 좁히기만 함)
+        :return: dict, 범위를 벗어난 값이 있으면 None
+        """
+        pending = {}
+        for name, value in fields.items():
+            if value is None:
+                continue
+            reg = self.registers.get(name)
+            if reg is None or not reg.writable:
+                raise TypeError(f"{self.name}: unknown or read-only field: {name}")
+            if not reg.valid(value, (limits or {}).get(name)):
+                return None
+            pending[reg.address] = reg.encode(value)
+        return pending
+
+    def frames(self, slave=None):
+        """명령 이름 -> 미리 만든 RTU 쓰기 프레임 목록 (연속 주소는 FC16 한 프레임)"""
+        slave = self.slave if slave is None else slave
+        if slave not in self._frames:
+            self._frames[slave] = {
+                name: [compile_write(slave, address, values, name) for address, values in plan_state_writes(pending, {})]
+                for name, pending in self.commands.items()
+            }
+        return self._frames[slave]
+
+    def client_settings(self):
+        """ModbusSerialClient 인자 (port 제외)"""
+        return {key: self.link[key] for key in ("baudrate", "bytesize", "parity", "stopbits", "timeout")
+                if key in self.link}
+
+    def __repr__(self):
+        return f"DriverProfile({self.name!r}, {self.link.get('baudrate')}bps, slave {self.slave})"
+
+
+DRIVERS = {
+    "grinder": DriverProfile(GRINDER),
+    "hoder": DriverProfile(HODER),
+}
+
+
+def get_driver(driver=None):
+    """
+    :param driver: DriverProfile, 내장 이름("grinder", "hoder"), JSON 경로, dict 또는 None(grinder)
+    """
+    if driver is None:
+        return DRIVERS["grinder"]
+    if isinstance(driver, DriverProfile):
+        return driver
+    if isinstance(driver, dict):
+        return DriverProfile(driver)
+    if driver in DRIVERS:
+        return DRIVERS[driver]
+    return DriverProfile.load(driver)
@@ -0,0 +1,333 @@
+"""
+여러 시리얼 포트의 모터를 포트당 프로세스 하나로 돌리는 플릿 컨트롤러
+
+    fleet = Fleet([
+        {"name": "rig1", "port": "/dev/ttyUSB0"},
+        {"name": "rig2", "port": "/dev/ttyUSB1", "backend": "rtu"},
+        {"name": "hoder", "port": "/dev/ttyUSB2", "driver": "hoder"},
+    ]).start()
+    fleet.snapshot()                     # {"rig1": {"rpm": 1200, ...}, ...} (공유 메모리에서 바로 읽음)
+    acks = fleet.apply_state(speed=50)   # 모든 모터에 보내고 모터별 응답(Ack)을 기다림
+    fleet.stop()
+
+- 워커 프로세스마다 MotorController 하나, 정해진 주기로 드라이버 레지스터를 읽어 공유 메모리 슬롯에 쓴다
+  (GIL 을 나눠 쓰지 않으므로 버스 수만큼 전체 속도로 폴링)
+- 워커는 CPU 하나에 고정 (os.sched_setaffinity 가 있는 OS 에서)
+- 슬롯은 seqlock (쓰기 중이면 홀수) 이라 락 없이 일관된 값을 읽는다
+- 명령은 워커별 파이프로 보내고, 워커는 명령을 받으면 폴링 대기 중이라도 바로 실행하고 결과를 돌려준다
+
+워커는 spawn 으로 시작하므로 스크립트에서는 if __name__ == "__main__": 안에서 start() 해야 한다.
+"""
+import json
+import multiprocessing
+import os
+import struct
+import time
+from multiprocessing.connection import wait
+
+MAX_FIELDS = 8
+SLOT = struct.Struct("<QdIIIB3x%di" % MAX_FIELDS)  # seq, 시각, 폴링 수, 실패 수, 명령 수, 연결, 값들
+SLOT_SIZE = 64
+MISSING = -1  # 읽지 못한 값 (레지스터는 0~65535)
+
+COMMANDS = ("apply_state", "set_speed", "set_cw_ccw", "set_enable", "set_brake", "start_motor", "stop_motor",
+            "command", "initialize")
+
+
+class Ack:
+    """모터 하나의 명령 결과 (ok 가 None 이면 시간 안에 응답 없음)"""
+    def __init__(self, motor, ok, result=None, elapsed=None, error=None):
+        self.motor = motor
+        self.ok = ok
+        self.result = result
+        self.elapsed = elapsed
+        self.error = error
+
+    def __repr__(self):
+        status = {True: "ok", False: "FAILED", None: "NO ACK"}[self.ok]
+        elapsed = f" {self.elapsed * 1000:.1f}ms" if self.elapsed is not None else ""
+        return f"Ack({self.motor}: {status}{elapsed}{f' {self.error}' if self.error else ''})"
+
+
+def _set_affinity(cpu):
+    if cpu is None or not hasattr(os, "sched_setaffinity"):
+        return False
+    try:
+        os.sched_setaffinity(0, {cpu})
+        return True
+    except OSError:
+        return False
+
+
+def _write_slot(buf, offset, seq, timestamp, polls, failures, commands, connected, values):
+    # seqlock: 홀수로 올리고 -> 쓰고 -> 짝수로
+    struct.pack_into("<Q", buf, offset, seq + 1)
+    SLOT.pack_into(buf, offset, seq + 1, timestamp, polls, failures, commands, connected, *values)
+    struct.pack_into("<Q", buf, offset, seq + 2)
+    return seq + 2
+
+
+def _read_slot(buf, offset, attempts=100):
+    for _ in range(attempts):
+        fields = SLOT.unpack_from(buf, offset)
+        if fields[0] % 2 == 0 and struct.unpack_from("<Q", buf, offset)[0] == fields[0]:
+            return fields
+    return None
+
+
+def _result(value):
+    # 파이프로 돌려보낼 수 있는 형태 + 성공 여부
+    if hasattr(value, "ok"):
+        return bool(value.ok), value.as_dict() if hasattr(value, "as_dict") else repr(value)
+    return bool(value), value
+
+
+def _worker(spec, shm_name, slot, conn, cpu):
+    from multiprocessing import shared_memory
+
+    from .controller import MotorController
+    from .telemetry import read_snapshot
+
+    _set_affinity(cpu)
+    shm = shared_memory.SharedMemory(name=shm_name)
+    offset = slot * SLOT_SIZE
+    motor = MotorController(
+        port=spec["port"],
+        baudrate=spec.get("baudrate"),
+        device_id=spec.get("device_id"),
+        timeout=spec.get("timeout"),
+        max_speed=spec.get("max_speed"),
+        driver=spec.get("driver"),
+        backend=spec.get("backend", "pymodbus"),
+    )
+    registers = [reg.address for reg in motor.driver.registers.values()][:MAX_FIELDS]
+    period = 1.0 / spec.get("rate_hz", 50)
+    seq = polls = failures = commands = 0
+    connected = motor.connect()
+    if connected:
+        motor.initialize()
+    conn.send(("ready", connected))
+    deadline = time.monotonic()
+    try:
+        while True:
+            # 다음 폴링까지는 명령을 기다린다 (명령이 오면 바로 실행)
+            if conn.poll(max(0.0, deadline - time.monotonic())):
+                message = conn.recv()
+                if message is None:
+                    break
+                command_id, method, kwargs = message
+                started = time.perf_counter()
+                try:
+                    ok, result = _result(getattr(motor, method)(**kwargs))
+                    error = None
+                except Exception as e:
+                    ok, result, error = False, None, f"{type(e).__name__}: {e}"
+                commands += 1
+                conn.send((command_id, ok, result, time.perf_counter() - started, error))
+                continue
+            snapshot = read_snapshot(motor.read_register, registers)
+            polls += 1
+            if not snapshot.complete:
+                failures += 1
+            values = [snapshot.get(address, MISSING) for address in registers]
+            values = [MISSING if value is None else value for value in values]
+            values += [MISSING] * (MAX_FIELDS - len(values))
+            seq = _write_slot(shm.buf, offset, seq, time.time(), polls, failures, commands,
+                              motor.transport.connected, values)
+            deadline += period
+            if deadline < time.monotonic() - period:
+                deadline = time.monotonic()  # 한 주기 이상 밀리면 따라잡지 않음
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        try:
+            motor.close()  # 속도 0
+        except Exception:
+            pass
+        shm.close()
+
+
+class Fleet:
+    """
+    :param specs: [{"name", "port", "driver", "backend", "baudrate", "device_id", "timeout", "max_speed",
+                    "rate_hz", "cpu"}, ...] (name/port 외에는 생략 가능)
+    :param pin: True 면 워커를 CPU 에 하나씩 고정 (spec 의 cpu 가 없으면 돌아가며 배정)
+    """
+    def __init__(self, specs, pin=True):
+        from .drivers import get_driver
+
+        self.specs = [dict(spec) for spec in specs]
+        names = [spec["name"] for spec in self.specs]
+        if len(set(names)) != len(names):
+            raise ValueError("motor names must be unique")
+        self.names = names
+        # 슬롯의 값 이름 (워커와 같은 순서)
+        self.fields = {spec["name"]: list(get_driver(spec.get("driver")).registers)[:MAX_FIELDS]
+                       for spec in self.specs}
+        self.pin = pin
+        self.processes = {}
+        self.conns = {}
+        self.connected = {}
+        self.shm = None
+        self._next_id = 0
+
+    @classmethod
+    def load(cls, path, **kwargs):
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f), **kwargs)
+
+    def _cpus(self):
+        available = sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else []
+        if len(available) > 1:
+            available = available[1:]  # 0 번은 감독 프로세스/화면용으로 남긴다
+        return available
+
+    def start(self, timeout=10.0):
+        from multiprocessing import shared_memory
+
+        context = multiprocessing.get_context("spawn")  # 스레드/열린 포트를 물려받지 않게
+        self.shm = shared_memory.SharedMemory(create=True, size=SLOT_SIZE * len(self.specs))
+        self.shm.buf[:] = bytes(len(self.shm.buf))
+        cpus = self._cpus()
+        for slot, spec in enumerate(self.specs):
+            cpu = spec.get("cpu")
+            if cpu is None and self.pin and cpus:
+                cpu = cpus[slot % len(cpus)]
+            parent, child = context.Pipe()
+            process = context.Process(target=_worker, args=(spec, self.shm.name, slot, child, cpu if self.pin else None),
+                                      name=f"grinder-{spec['name']}", daemon=True)
+            process.start()
+            child.close()
+            self.processes[spec["name"]] = process
+            self.conns[spec["name"]] = parent
+        deadline = time.monotonic() + timeout
+        for name, conn in self.conns.items():
+            try:
+                self.connected[name] = conn.poll(max(0.0, deadline - time.monotonic())) and conn.recv()[1]
+            except EOFError:
+                self.connected[name] = False  # 워커가 시작하다 죽음
+        return self
+
+    def stop(self, timeout=3.0):
+        for name, conn in self.conns.items():
+            try:
+                conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self.processes.values():
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+        for conn in self.conns.values():
+            conn.close()
+        if self.shm is not None:
+            self.shm.close()
+            self.shm.unlink()
+            self.shm = None
+        self.processes.clear()
+        self.conns.clear()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
+
+    # ---- 텔레메트리 ----
+    def snapshot(self):
+        """{이름: {"timestamp", "age", "polls", "failures", "commands", "connected", <레지스터 이름>: 값}}"""
+        view = {}
+        now = time.time()
+        for slot, name in enumerate(self.names):
+            fields = _read_slot(self.shm.buf, slot * SLOT_SIZE)
+            if fields is None or fields[0] == 0:
+                view[name] = {"timestamp": None, "connected": self.connected.get(name, False)}
+                continue
+            _, timestamp, polls, failures, commands, connected = fields[:6]
+            values = fields[6:]
+            entry = {
+                "timestamp": timestamp,
+                "age": now - timestamp,
+                "polls": polls,
+                "failures": failures,
+                "commands": commands,
+                "connected": bool(connected),
+            }
+            for field, value in zip(self.fields[name], values):
+                entry[field] = None if value == MISSING else value
+            view[name] = entry
+        return view
+
+    def view(self):
+        """한 화면 표 (텍스트)"""
+        snapshot = self.snapshot()
+        columns = []
+        for name in self.names:
+            for field in self.fields[name]:
+                if field not in columns:
+                    columns.append(field)
+        lines = [f"{'motor':<10} {'link':<5} {'age ms':>7} {'polls':>7} {'fail':>5} "
+                 + " ".join(f"{column:>9}" for column in columns)]
+        for name in self.names:
+            entry = snapshot[name]
+            if entry.get("timestamp") is None:
+                lines.append(f"{name:<10} {'wait':<5}")
+                continue
+            cells = " ".join(f"{'' if entry.get(column) is None else entry[column]:>9}" for column in columns)
+            lines.append(f"{name:<10} {'up' if entry['connected'] else 'DOWN':<5} {entry['age'] * 1000:7.1f} "
+                         f"{entry['polls']:7d} {entry['failures']:5d} {cells}")
+        return "\n".join(lines)
+
+    # ---- 명령 ----
+    def send(self, method, motors=None, timeout=2.0, **kwargs):
+        """
+        motors (None 이면 전체) 에 MotorController.<method>(**kwargs) 를 동시에 보내고 모터별 Ack 를 모은다
+        :return: {이름: Ack}
+        """
+        if method not in COMMANDS:
+            raise ValueError(f"unsupported fleet command: {method}")
+        targets = self.names if motors is None else [motors] if isinstance(motors, str) else list(motors)
+        self._next_id += 1
+        command_id = self._next_id
+        pending = {}
+        acks = {}
+        for name in targets:
+            conn = self.conns[name]
+            try:
+                conn.send((command_id, method, kwargs))
+                pending[conn] = name
+            except (BrokenPipeError, OSError) as e:
+                acks[name] = Ack(name, False, error=f"worker gone: {e}")
+        deadline = time.monotonic() + timeout
+        while pending:
+            ready = wait(list(pending), max(0.0, deadline - time.monotonic()))
+            if not ready:
+                break
+            for conn in ready:
+                try:
+                    message = conn.recv()
+                except EOFError:
+                    name = pending.pop(conn)
+                    acks[name] = Ack(name, False, error="worker exited")
+                    continue
+                if message[0] != command_id:
+                    continue  # 이전에 시간 초과된 명령의 늦은 응답
+                name = pending.pop(conn)
+                _, ok, result, elapsed, error = message
+                acks[name] = Ack(name, ok, result, elapsed, error)
+        for name in pending.values():
+            acks[name] = Ack(name, None, error=f"no ack within {timeout}s")
+        return acks
+
+    def apply_state(self, motors=None, timeout=2.0, **fields):
+        return self.send("apply_state", motors, timeout, **fields)
+
+    def start_motor(self, speed, direction=None, confirm_rpm=None, motors=None, timeout=5.0):
+        return self.send("start_motor", motors, timeout, speed=speed, direction=direction, confirm_rpm=confirm_rpm)
+
+    def stop_motor(self, confirm_rpm=None, motors=None, timeout=5.0):
+        return self.send("stop_motor", motors, timeout, confirm_rpm=confirm_rpm)
+
+    def command(self, name, motors=None, timeout=2.0):
+        return self.send("command", motors, timeout, name=name)
@@ -0,0 +1,174 @@
+"""
+크랭크-슬라이더 링크 기구학 (모터 각도/RPM <-> 출력 위치/속도), NumPy 배열 단위로 계산
+
+    link = SliderCrank(crank=20, rod=94)            # 길이 단위 mm (기본값은 예전 kinematics.py 치수)
+    x, v = link.forward(theta, rpm=rpm)             # 모터 각도 배열 [rad], RPM -> 위치 [mm], 속도 [mm/s]
+    theta = link.inverse(x)                         # 위치 -> 모터 각도 (닿을 수 없는 위치는 nan)
+    rpm = link.inverse_speed(theta, v)              # 원하는 출력 속도 -> 모터 RPM
+
+    table = link.table(4096)                        # 삼각함수/제곱근 대신 미리 계산한 표에서 선형 보간
+    x, v = table.forward(theta, rpm=rpm)
+
+- 각도는 모터 축 기준 라디안, 크랭크 각도 = 모터 각도 / gear_ratio
+- 크랭크 각도 0 은 슬라이더 쪽 (offset 이 0 이면 바깥 사점)
+- 위치는 크랭크 축에서 슬라이더 핀까지 슬라이더 축 방향 거리
+- 스칼라를 넣으면 스칼라, 배열을 넣으면 같은 모양의 배열을 돌려준다
+"""
+import math
+
+import numpy as np
+
+TWO_PI = 2 * math.pi
+RPM_TO_RAD = TWO_PI / 60.0  # rpm -> rad/s
+
+
+def _out(value):
+    return value[()] if isinstance(value, np.ndarray) and value.ndim == 0 else value
+
+
+class SliderCrank:
+    """
+    :param crank: 크랭크 반지름
+    :param rod: 커넥팅 로드 길이
+    :param offset: 슬라이더 축과 크랭크 축 사이 거리 (편심)
+    :param gear_ratio: 크랭크 1 회전당 모터 회전수
+    """
+    def __init__(self, crank=20.0, rod=94.0, offset=0.0, gear_ratio=1.0):
+        if crank <= 0 or rod <= 0 or gear_ratio <= 0:
+            raise ValueError("crank, rod and gear_ratio must be positive")
+        if rod < crank + abs(offset):
+            raise ValueError("rod must be at least crank + |offset| for a full crank rotation")
+        self.crank = float(crank)
+        self.rod = float(rod)
+        self.offset = float(offset)
+        self.gear_ratio = float(gear_ratio)
+
+    def __repr__(self):
+        return (f"SliderCrank(crank={self.crank:g}, rod={self.rod:g}, offset={self.offset:g}, "
+                f"gear_ratio={self.gear_ratio:g})")
+
+    @property
+    def period(self):
+        """크랭크 1 회전에 해당하는 모터 각도 [rad]"""
+        return TWO_PI * self.gear_ratio
+
+    @property
+    def stroke(self):
+        """(가장 안쪽, 가장 바깥쪽) 위치"""
+        e = self.offset
+        return math.sqrt((self.rod - self.crank) ** 2 - e * e), math.sqrt((self.rod + self.crank) ** 2 - e * e)
+
+    def dead_centers(self):
+        """(바깥 사점, 안쪽 사점) 모터 각도 - 이 두 각도에서 출력 속도가 0"""
+        outer = math.asin(self.offset / (self.rod + self.crank))
+        inner = math.pi + math.asin(self.offset / (self.rod - self.crank))
+        return outer * self.gear_ratio, inner * self.gear_ratio
+
+    def _terms(self, theta):
+        angle = np.asarray(theta, dtype=np.float64) / self.gear_ratio
+        sin, cos = np.sin(angle), np.cos(angle)
+        lateral = self.crank * sin - self.offset          # 로드의 슬라이더 축 수직 성분
+        along = np.sqrt(self.rod * self.rod - lateral * lateral)  # 로드의 슬라이더 축 방향 성분
+        return sin, cos, lateral, along
+
+    def position(self, theta):
+        _, cos, _, along = self._terms(theta)
+        return _out(self.crank * cos + along)
+
+    def rod_angle(self, theta):
+        """로드가 슬라이더 축과 이루는 각도 [rad]"""
+        _, _, lateral, _ = self._terms(theta)
+        return _out(np.arcsin(lateral / self.rod))
+
+    def ratio(self, theta):
+        """dx/d(모터 각도) [mm/rad] - 모터 각속도에 곱하면 출력 속도"""
+        sin, cos, lateral, along = self._terms(theta)
+        return _out(-self.crank * (sin + lateral * cos / along) / self.gear_ratio)
+
+    def forward(self, theta, rpm=None):
+        """
+        :return: (위치, 속도) - rpm 이 None 이면 속도도 None
+        """
+        sin, cos, lateral, along = self._terms(theta)
+        position = self.crank * cos + along
+        if rpm is None:
+            return _out(position), None
+        ratio = -self.crank * (sin + lateral * cos / along) / self.gear_ratio
+        return _out(position), _out(ratio * (np.asarray(rpm, dtype=np.float64) * RPM_TO_RAD))
+
+    def inverse(self, position, branch=1):
+        """
+        위치 -> 모터 각도 [0, period)
+        :param branch: 1 = 바깥 사점 -> 안쪽 사점 구간 (정회전 시 슬라이더가 들어오는 쪽), -1 = 나머지 반 바퀴
+        :return: 닿을 수 없는 위치는 nan
+        """
+        if branch not in (1, -1):
+            raise ValueError("branch must be 1 or -1")
+        x = np.asarray(position, dtype=np.float64)
+        r, e = self.crank, self.offset
+        # 2r(x cos + e sin) = x^2 + r^2 + e^2 - L^2  ->  cos(angle - psi) = k / (2 r R)
+        reach = np.hypot(x, e)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            angle = np.arctan2(e, x) + branch * np.arccos((x * x + r * r + e * e - self.rod * self.rod) / (2 * r * reach))
+        angle = np.mod(angle, TWO_PI)
+        angle = np.where(angle >= TWO_PI, 0.0, angle)  # -1e-17 같은 값의 mod 는 2pi 로 반올림된다
+        return _out(angle * self.gear_ratio)
+
+    def inverse_speed(self, theta, speed):
+        """원하는 출력 속도 [mm/s] -> 모터 RPM (사점에서는 inf/nan)"""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return _out(np.asarray(speed, dtype=np.float64) / np.asarray(self.ratio(theta)) / RPM_TO_RAD)
+
+    def table(self, samples=4096):
+        return KinematicsTable(self, samples)
+
+
+class KinematicsTable:
+    """
+    모터 1 주기를 samples 칸으로 나눠 위치/비율을 미리 계산해 두고 선형 보간으로 읽는다
+    (한 번 호출에 삼각함수 3 개 + 제곱근 대신 곱셈/인덱싱만, 오차는 samples^2 에 반비례)
+    4096 칸이면 기본 치수에서 위치 오차 ~7e-6 mm, 5000 점 forward 가 정확한 계산의 절반 정도 시간
+    """
+    def __init__(self, link, samples=4096):
+        if samples < 8:
+            raise ValueError("samples must be at least 8")
+        self.link = link
+        self.samples = int(samples)
+        self.scale = self.samples / link.period  # 모터 각도 -> 칸 번호
+        theta = np.arange(self.samples + 1) / self.scale
+        self.positions = np.asarray(link.position(theta))
+        self.ratios = np.asarray(link.ratio(theta))
+        self._position_slope = np.diff(self.positions)
+        self._ratio_slope = np.diff(self.ratios)
+
+    def __repr__(self):
+        return f"KinematicsTable({self.link!r}, samples={self.samples})"
+
+    def _index(self, theta):
+        index = np.mod(np.asarray(theta, dtype=np.float64), self.link.period) * self.scale
+        cell = np.minimum(index.astype(np.intp), self.samples - 1)  # mod 결과가 period 로 반올림된 경우 (스칼라도 가능)
+        return cell, index - cell
+
+    def position(self, theta):
+        cell, fraction = self._index(theta)
+        return _out(self.positions[cell] + fraction * self._position_slope[cell])
+
+    def ratio(self, theta):
+        cell, fraction = self._index(theta)
+        return _out(self.ratios[cell] + fraction * self._ratio_slope[cell])
+
+    def forward(self, theta, rpm=None):
+        cell, fraction = self._index(theta)
+        position = self.positions[cell] + fraction * self._position_slope[cell]
+        if rpm is None:
+            return _out(position), None
+        ratio = self.ratios[cell] + fraction * self._ratio_slope[cell]
+        return _out(position), _out(ratio * (np.asarray(rpm, dtype=np.float64) * RPM_TO_RAD))
+
+    def inverse(self, position, branch=1):
+        # 닫힌 해가 이미 표 탐색(np.interp 이진 탐색)보다 빠르고, 사점 근처에서 보간 오차도 없다
+        return self.link.inverse(position, branch)
+
+    def inverse_speed(self, theta, speed):
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return _out(np.asarray(speed, dtype=np.float64) / np.asarray(self.ratio(theta)) / RPM_TO_RAD)
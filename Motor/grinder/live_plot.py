@@ -0,0 +1,139 @@
+import numpy as np
+import matplotlib.pyplot as plt
+
+
+def minmax_decimate(t, data, bins):
+    """
+    화면 픽셀 폭(bins) 에 맞춰 구간마다 최소/최대 두 점만 남긴다.
+    스파이크는 그대로 보이면서 점 개수는 2*bins 로 제한된다.
+    :param t: shape (n,)
+    :param data: shape (channels, n)
+    :return: (t, data) 점이 2*bins 이하
+    """
+    n = t.shape[0]
+    bins = int(bins)
+    if bins <= 0 or n <= 2 * bins:
+        return t, data
+    starts = np.linspace(0, n, bins + 1).astype(np.intp)[:-1]
+    mins = np.minimum.reduceat(data, starts, axis=1)
+    maxs = np.maximum.reduceat(data, starts, axis=1)
+    out_t = np.repeat(t[starts], 2)
+    out = np.empty((data.shape[0], 2 * bins), dtype=data.dtype)
+    out[:, 0::2] = mins
+    out[:, 1::2] = maxs
+    return out_t, out
+
+
+class LivePlot:
+    """
+    블리팅 기반 실시간 플롯
+    - 매 프레임은 저장해 둔 배경 위에 선만 다시 그린다 (blit)
+    - x 축은 창 오른쪽 끝에 닿을 때만 scroll 만큼 넘기고, y 축은 범위를 벗어날 때만 넓힌다
+      -> 축이 바뀌는 프레임에서만 전체 다시 그리기
+    - 보이는 구간만 픽셀 폭에 맞춰 min/max 로 줄여서 그린다
+
+    :param buffer: TimeSeriesBuffer
+    :param layout: 서브플롯별 채널 이름 목록, 예: [("rpm",), ("hall_a", "hall_b", "hall_c")]
+    :param feed: 매 프레임 처음에 호출, 새 데이터를 buffer 에 넣는 함수 (없으면 생략)
+    :param ylims: 서브플롯별 초기 y 범위 (None 이면 데이터로 결정)
+    """
+    def __init__(self, buffer, layout, window=10.0, interval_ms=10, feed=None,
+                 ylims=None, scroll=0.25, title=None, styles=None, figsize=(10, 6)):
+        self.buffer = buffer
+        self.layout = [tuple(channels) for channels in layout]
+        self.window = window
+        self.interval_ms = interval_ms
+        self.feed = feed
+        self.scroll = scroll  # 창 폭 대비 한 번에 넘길 비율
+        self.styles = styles or {}
+        self.frames = 0
+        self.full_redraws = 0
+        self.background = None
+
+        self.fig, axes = plt.subplots(len(self.layout), 1, figsize=figsize, squeeze=False)
+        self.axes = [row[0] for row in axes]
+        self.lines = []  # (ax, 채널 인덱스, line)
+        for i, (ax, channels) in enumerate(zip(self.axes, self.layout)):
+            for name in channels:
+                line, = ax.plot([], [], self.styles.get(name, "-"), label=name, animated=True)
+                self.lines.append((ax, buffer.index[name], line))
+            ax.set_xlim(0, window)
+            if ylims and ylims[i] is not None:
+                ax.set_ylim(*ylims[i])
+            ax.legend(loc="upper left")
+        self.axes[-1].set_xlabel("Time (s)")
+        if title:
+            self.axes[0].set_title(title)
+
+        self.fig.canvas.mpl_connect("draw_event", self._on_draw)
+        self.timer = self.fig.canvas.new_timer(interval=interval_ms)
+        self.timer.add_callback(self.update)
+
+    def _on_draw(self, event):
+        # 창 크기 변경 등으로 전체가 다시 그려지면 배경을 다시 저장
+        self.background = self.fig.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_lines()
+
+    def _redraw(self):
+        self.full_redraws += 1
+        self.fig.canvas.draw()  # draw_event -> 배경 갱신
+
+    def _adjust_axes(self, t, data):
+        """축 범위를 바꿔야 하면 True"""
+        changed = False
+        latest = t[-1]
+        for ax in self.axes:
+            left, right = ax.get_xlim()
+            if latest > right or latest < left:
+                step = self.window * self.scroll
+                right = max(self.window, latest + step)
+                ax.set_xlim(right - self.window, right)
+                changed = True
+        for ax, channels in zip(self.axes, self.layout):
+            rows = [self.buffer.index[name] for name in channels]
+            low = float(np.min(data[rows]))
+            high = float(np.max(data[rows]))
+            bottom, top = ax.get_ylim()
+            if low < bottom or high > top:
+                margin = max(1.0, (high - low) * 0.1)
+                ax.set_ylim(min(bottom, low - margin), max(top, high + margin))
+                changed = True
+        return changed
+
+    def _draw_lines(self):
+        for ax, _, line in self.lines:
+            ax.draw_artist(line)
+
+    def update(self):
+        if self.feed is not None:
+            self.feed()
+        self.frames += 1
+        t, data = self.buffer.window(self.window)
+        if not len(t):
+            return
+        bins = self.axes[0].bbox.width
+        t, data = minmax_decimate(t, data, bins)
+        for _, row, line in self.lines:
+            line.set_data(t, data[row])
+
+        if self._adjust_axes(t, data) or self.background is None:
+            self._redraw()
+            return
+        canvas = self.fig.canvas
+        canvas.restore_region(self.background)
+        self._draw_lines()
+        canvas.blit(self.fig.bbox)
+        canvas.flush_events()
+
+    def start(self):
+        self.timer.start()
+
+    def stop(self):
+        self.timer.stop()
+
+    def show(self):
+        self.start()
+        try:
+            plt.show()
+        finally:
+            self.stop()
@@ -0,0 +1,293 @@
+"""
+Modbus 트랜잭션 계측
+
+    metrics = BusMetrics()
+    transport = ResilientClient(MeteredClient(ModbusSerialClient(...), metrics))
+    lock = TimedLock(metrics)              # MotorController.lock 대신
+    serve_metrics(metrics, port=9105)      # http://127.0.0.1:9105/metrics (Prometheus 텍스트 형식)
+
+- 함수 코드 / 시작 레지스터별 응답 시간 히스토그램
+- timeout / crc / exception / port_gone 횟수 (transport.classify_error 기준)
+- 송수신 바이트 (RTU 프레임 길이로 계산)
+- 버스 락 대기 시간
+히스토그램은 칸별 개수만 누적하므로 오래 돌려도 메모리가 늘지 않는다.
+"""
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .rtu import FC_READ_HOLDING, FC_WRITE_MULTIPLE, FC_WRITE_SINGLE, send_frame
+from .transport import ERROR_KINDS, SUPERSEDED, classify_error
+
+BUCKETS = (0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0)  # 초
+
+
+def frame_sizes(function, count):
+    """RTU 요청/정상 응답 프레임 길이 (주소 1 + PDU + CRC 2)"""
+    if function == FC_READ_HOLDING:
+        return 8, 5 + 2 * count
+    if function == FC_WRITE_SINGLE:
+        return 8, 8
+    if function == FC_WRITE_MULTIPLE:
+        return 9 + 2 * count, 8
+    return 0, 0
+
+
+class Histogram:
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # 마지막 칸은 +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = 0.0
+
+    def observe(self, value):
+        for index, edge in enumerate(self.buckets):
+            if value <= edge:
+                self.counts[index] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = max(self.max, value)
+
+    def quantile(self, q):
+        """칸 안에서 선형 보간한 분위수 (관측한 최솟값~최댓값 안으로 제한)"""
+        if not self.count:
+            return None
+        target = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if count and seen + count >= target:
+                lower = self.buckets[index - 1] if index > 0 else 0.0
+                upper = self.buckets[index] if index < len(self.buckets) else self.max
+                value = lower + (upper - lower) * (target - seen) / count
+                return min(max(value, self.min), self.max)
+            seen += count
+        return self.max
+
+    def cumulative(self):
+        total = 0
+        for edge, count in zip(list(self.buckets) + ["+Inf"], self.counts):
+            total += count
+            yield edge, total
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "mean": self.sum / self.count if self.count else None,
+            "p50": self.quantile(0.5),
+            "p99": self.quantile(0.99),
+            "max": self.max,
+        }
+
+
+class BusMetrics:
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        self.lock = threading.Lock()
+        self.latency = {}  # (function, register) -> Histogram
+        self.errors = {kind: 0 for kind in ERROR_KINDS}
+        self.errors_by_request = {}  # (function, register, kind) -> 횟수
+        self.tx_bytes = 0
+        self.rx_bytes = 0
+        self.lock_wait = Histogram(buckets)
+        self.started = time.time()
+
+    def record(self, function, register, count, seconds, kind=None):
+        if kind == SUPERSEDED:
+            return  # 버스에 나가지 않은 요청
+        request, response = frame_sizes(function, count)
+        with self.lock:
+            histogram = self.latency.get((function, register))
+            if histogram is None:
+                histogram = self.latency[(function, register)] = Histogram(self.buckets)
+            histogram.observe(seconds)
+            self.tx_bytes += request
+            if kind is None:
+                self.rx_bytes += response
+            elif kind == "exception":
+                self.rx_bytes += 5
+            if kind is not None:
+                self.errors[kind] += 1
+                key = (function, register, kind)
+                self.errors_by_request[key] = self.errors_by_request.get(key, 0) + 1
+
+    def record_lock_wait(self, seconds):
+        with self.lock:
+            self.lock_wait.observe(seconds)
+
+    def stats(self):
+        with self.lock:
+            return {
+                "latency": {
+                    f"fc{function}@0x{register:04X}": histogram.summary()
+                    for (function, register), histogram in sorted(self.latency.items())
+                },
+                "errors": dict(self.errors),
+                "errors_by_request": {
+                    f"fc{function}@0x{register:04X}/{kind}": count
+                    for (function, register, kind), count in sorted(self.errors_by_request.items())
+                },
+                "tx_bytes": self.tx_bytes,
+                "rx_bytes": self.rx_bytes,
+                "lock_wait": self.lock_wait.summary(),
+            }
+
+    def render_prometheus(self, extra=None):
+        """Prometheus 텍스트 노출 형식"""
+        lines = []
+        with self.lock:
+            lines.append("# HELP modbus_request_duration_seconds Modbus request round-trip time")
+            lines.append("# TYPE modbus_request_duration_seconds histogram")
+            for (function, register), histogram in sorted(self.latency.items()):
+                labels = f'function="{function}",register="0x{register:04X}"'
+                for edge, total in histogram.cumulative():
+                    lines.append(f'modbus_request_duration_seconds_bucket{{{labels},le="{edge}"}} {total}')
+                lines.append(f"modbus_request_duration_seconds_sum{{{labels}}} {histogram.sum}")
+                lines.append(f"modbus_request_duration_seconds_count{{{labels}}} {histogram.count}")
+
+            lines.append("# HELP modbus_errors_total Failed Modbus requests by kind")
+            lines.append("# TYPE modbus_errors_total counter")
+            for kind, count in self.errors.items():
+                lines.append(f'modbus_errors_total{{kind="{kind}"}} {count}')
+            lines.append("# TYPE modbus_request_errors_total counter")
+            for (function, register, kind), count in sorted(self.errors_by_request.items()):
+                lines.append(
+                    f'modbus_request_errors_total{{function="{function}",register="0x{register:04X}",kind="{kind}"}} {count}'
+                )
+
+            lines.append("# HELP modbus_bytes_total Bytes on the wire (RTU frames)")
+            lines.append("# TYPE modbus_bytes_total counter")
+            lines.append(f'modbus_bytes_total{{direction="tx"}} {self.tx_bytes}')
+            lines.append(f'modbus_bytes_total{{direction="rx"}} {self.rx_bytes}')
+
+            lines.append("# HELP modbus_lock_wait_seconds Time spent waiting for the bus lock")
+            lines.append("# TYPE modbus_lock_wait_seconds histogram")
+            for edge, total in self.lock_wait.cumulative():
+                lines.append(f'modbus_lock_wait_seconds_bucket{{le="{edge}"}} {total}')
+            lines.append(f"modbus_lock_wait_seconds_sum {self.lock_wait.sum}")
+            lines.append(f"modbus_lock_wait_seconds_count {self.lock_wait.count}")
+
+        # 캐시/전송 계층 통계 등 숫자 값은 gauge 로
+        for name, value in (extra() if callable(extra) else extra or {}).items():
+            if isinstance(value, bool):
+                value = int(value)
+            if isinstance(value, (int, float)):
+                lines.append(f"# TYPE motor_{name} gauge")
+                lines.append(f"motor_{name} {value}")
+        return "\n".join(lines) + "\n"
+
+
+class MeteredClient:
+    """pymodbus 클라이언트 래퍼 - 모든 요청의 시간/결과/바이트를 BusMetrics 에 기록"""
+    def __init__(self, client, metrics):
+        self.client = client
+        self.metrics = metrics
+
+    def __getattr__(self, name):
+        return getattr(self.client, name)
+
+    def _timed(self, method, function, register, size, **kwargs):
+        start = time.perf_counter()
+        try:
+            response = method(address=register, **kwargs)
+        except Exception as e:
+            self.metrics.record(function, register, size, time.perf_counter() - start, classify_error(error=e))
+            raise
+        self.metrics.record(function, register, size, time.perf_counter() - start, classify_error(response))
+        return response
+
+    def read_holding_registers(self, address, count=1, slave=0, **kwargs):
+        return self._timed(self.client.read_holding_registers, FC_READ_HOLDING, address, count,
+                           count=count, slave=slave, **kwargs)
+
+    def write_register(self, address, value, slave=0, **kwargs):
+        return self._timed(self.client.write_register, FC_WRITE_SINGLE, address, 1,
+                           value=value, slave=slave, **kwargs)
+
+    def write_registers(self, address, values, slave=0, **kwargs):
+        return self._timed(self.client.write_registers, FC_WRITE_MULTIPLE, address, len(values),
+                           values=values, slave=slave, **kwargs)
+
+    def send_frame(self, frame):
+        # 미리 만든 RTU 프레임 (rtu.CompiledFrame) 을 그대로 보낸다
+        send = getattr(self.client, "send_frame", None)
+        start = time.perf_counter()
+        try:
+            response = send(frame) if send else send_frame(self.client, frame)
+        except Exception as e:
+            self.metrics.record(frame.function, frame.address, len(frame.values), time.perf_counter() - start,
+                                classify_error(error=e))
+            raise
+        self.metrics.record(frame.function, frame.address, len(frame.values), time.perf_counter() - start,
+                            classify_error(response))
+        return response
+
+
+class TimedLock:
+    """threading.Lock 대신 쓰면 획득까지 기다린 시간을 기록한다"""
+    def __init__(self, metrics):
+        self.metrics = metrics
+        self._lock = threading.Lock()
+
+    def acquire(self, blocking=True, timeout=-1):
+        start = time.perf_counter()
+        acquired = self._lock.acquire(blocking, timeout)
+        if acquired:
+            self.metrics.record_lock_wait(time.perf_counter() - start)
+        return acquired
+
+    def release(self):
+        self._lock.release()
+
+    def locked(self):
+        return self._lock.locked()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+
+def flatten_stats(prefix, stats):
+    """{'errors': {'timeout': 1}} -> {'prefix_errors_timeout': 1} (gauge 로 내보내기용)"""
+    flat = {}
+    for key, value in stats.items():
+        name = f"{prefix}_{key}"
+        if isinstance(value, dict):
+            flat.update(flatten_stats(name, value))
+        else:
+            flat[name] = value
+    return flat
+
+
+def serve_metrics(metrics, port=9105, host="127.0.0.1", extra=None):
+    """
+    백그라운드 스레드에서 /metrics 제공 (기본은 로컬에서만 접근 가능)
+    :param extra: 숫자 값 dict 를 돌려주는 함수 (gauge 로 추가)
+    :return: server (server.shutdown() 으로 종료)
+    """
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = metrics.render_prometheus(extra).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass  # 요청마다 콘솔 출력하지 않음
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
@@ -0,0 +1,304 @@
+"""
+모션 프로파일 (속도 램프 / 유지 / 방향 전환 / 브레이크) 을 정해진 시각에 실행
+
+    profile = (Profile(get_driver("hoder").fields)
+               .set(mode=0).hold(0.1)
+               .set(brake=0).hold(0.05)
+               .set(direction=1).hold(0.05)
+               .set(speed=40).hold(2)
+               .set(direction=2).hold(2)
+               .ramp("speed", 70, duration=1.0).hold(1)
+               .set(brake=1))
+    report = run_profile(motor, profile)
+    print(report.summary())
+
+- compile() 에서 쓰기 순서와 시각을 미리 계산하고, 실행기는 RTU 프레임까지 미리 만든다 (실행 중 인코딩 없음)
+- 프레임을 만들기 전에 모든 값을 드라이버 프로파일 범위/컨트롤러 제한 (max_speed) 으로 검사 (벗어나면 ValueError)
+- 각 명령은 시작 시각 기준 절대 마감 시각에 보낸다 -> sleep 오차/버스 지연이 누적되지 않음
+- 측정한 버스 지연의 절반만큼 먼저 보내서 드라이버가 받는 시각을 목표에 맞춘다
+- 명령마다 목표 시각 대비 오차를 기록
+"""
+import json
+import math
+import time
+
+from .motor_state import STATE_FIELDS, plan_state_writes
+from .rtu import compile_write
+
+
+class ProfileCommand:
+    """t 초에 address 부터 values 를 쓴다 (값이 하나면 FC6, 여러 개면 FC16)"""
+    def __init__(self, t, address, values, label=""):
+        self.t = t
+        self.address = address
+        self.values = list(values)
+        self.label = label
+
+    @property
+    def function(self):
+        return 6 if len(self.values) == 1 else 16
+
+    def as_dict(self):
+        return {"t": self.t, "address": self.address, "values": self.values, "label": self.label}
+
+    def __repr__(self):
+        return f"ProfileCommand({self.t:.3f}s, 0x{self.address:04X}={self.values}, {self.label!r})"
+
+
+def check_commands(commands, driver, limits=None):
+    """
+    컴파일된 명령의 값이 driver 레지스터 범위와 limits ({이름: (lo, hi)}) 안인지 검사
+    :raise ValueError: 모르는 레지스터, 읽기 전용 레지스터 또는 범위를 벗어난 값
+    """
+    registers = {reg.address: reg for reg in driver.registers.values()}
+    for command in commands:
+        for offset, raw in enumerate(command.values):
+            address = command.address + offset
+            reg = registers.get(address)
+            if reg is None or not reg.writable:
+                raise ValueError(f"{command!r}: 0x{address:04X} is not a writable {driver.name} register")
+            if not 0 <= raw <= 0xFFFF or not reg.valid(reg.decode(raw), (limits or {}).get(reg.name)):
+                raise ValueError(f"{command!r}: {reg.name}={reg.decode(raw)} is out of range")
+    return commands
+
+
+class Profile:
+    """
+    선언형 스케줄 빌더 (StateTransaction 처럼 체이닝)
+    :param fields: {이름: 레지스터 주소} (기본 STATE_FIELDS, 다른 드라이버는 DriverProfile.fields)
+    :param initial: 시작 전에 알고 있는 값 (ramp 시작값 등)
+    """
+    def __init__(self, fields=None, initial=None):
+        self.fields = dict(STATE_FIELDS if fields is None else fields)
+        self.initial = dict(initial or {})
+        self.segments = []
+
+    def _check(self, names):
+        for name in names:
+            if name not in self.fields:
+                raise TypeError(f"unknown profile field: {name}")
+
+    def set(self, **fields):
+        """지금 시각에 값 쓰기 (연속 주소는 FC16 한 번으로 묶는다)"""
+        self._check(fields)
+        self.segments.append(("set", fields))
+        return self
+
+    def hold(self, duration):
+        """duration 초 동안 그대로 유지"""
+        if duration < 0:
+            raise ValueError("hold duration must be >= 0")
+        self.segments.append(("hold", duration))
+        return self
+
+    def ramp(self, field, to, duration, rate_hz=20):
+        """field 를 현재 값에서 to 까지 duration 초 동안 직선으로 바꾼다 (rate_hz 간격으로 쓰기)"""
+        self._check([field])
+        if duration <= 0 or rate_hz <= 0:
+            raise ValueError("ramp duration and rate_hz must be > 0")
+        self.segments.append(("ramp", {"field": field, "to": to, "duration": duration, "rate_hz": rate_hz}))
+        return self
+
+    def speed(self, speed):
+        return self.set(speed=speed)
+
+    def direction(self, direction):
+        return self.set(direction=direction)
+
+    def brake(self, brake):
+        return self.set(brake=brake)
+
+    @property
+    def duration(self):
+        total = 0.0
+        for kind, arg in self.segments:
+            if kind == "hold":
+                total += arg
+            elif kind == "ramp":
+                total += arg["duration"]
+        return total
+
+    def compile(self, driver=None, limits=None):
+        """
+        :param driver: 지정하면 값을 이 드라이버 프로파일 (와 limits) 로 검사한다
+        :return: 시각 순으로 정렬된 ProfileCommand 목록
+        """
+        commands = []
+        values = dict(self.initial)
+        t = 0.0
+        for kind, arg in self.segments:
+            if kind == "hold":
+                t += arg
+            elif kind == "set":
+                # 이미 그 값인 항목은 보내지 않는다
+                arg = {name: value for name, value in arg.items() if values.get(name) != value}
+                changes = {self.fields[name]: int(value) for name, value in arg.items()}
+                label = ", ".join(f"{name}={value}" for name, value in arg.items())
+                # 사이에 낀 레지스터 값을 알면 채워서 한 번에 보낸다 (같은 시각 명령이 줄 서지 않게)
+                known = {self.fields[name]: int(value) for name, value in values.items()}
+                for address, block in plan_state_writes(changes, known):
+                    commands.append(ProfileCommand(t, address, block, label))
+                values.update(arg)
+            else:
+                field, to = arg["field"], arg["to"]
+                if field not in values:
+                    raise ValueError(f"ramp start value of {field!r} is unknown (set it first)")
+                start, steps = values[field], max(1, round(arg["duration"] * arg["rate_hz"]))
+                last = start
+                for i in range(1, steps + 1):
+                    value = int(round(start + (to - start) * i / steps))
+                    if value != last:
+                        commands.append(ProfileCommand(t + arg["duration"] * i / steps, self.fields[field], [value],
+                                                       f"{field}={value} (ramp)"))
+                        last = value
+                t += arg["duration"]
+                values[field] = to
+        if driver is not None:
+            check_commands(commands, driver, limits)
+        return commands
+
+    @classmethod
+    def from_list(cls, segments, fields=None, initial=None):
+        """
+        JSON 등에서 읽은 목록으로 만들기
+            [{"set": {"brake": 0}}, {"hold": 0.05}, {"ramp": {"field": "speed", "to": 70, "duration": 1}}]
+        """
+        profile = cls(fields, initial)
+        for segment in segments:
+            (kind, arg), = segment.items()
+            if kind == "set":
+                profile.set(**arg)
+            elif kind == "hold":
+                profile.hold(arg)
+            elif kind == "ramp":
+                profile.ramp(**arg)
+            else:
+                raise ValueError(f"unknown profile segment: {kind}")
+        return profile
+
+    @classmethod
+    def load(cls, path, fields=None, initial=None):
+        with open(path, encoding="utf-8") as f:
+            return cls.from_list(json.load(f), fields, initial)
+
+
+class CommandTiming:
+    def __init__(self, command, target, sent, acked, ok):
+        self.command = command
+        self.target = target  # 목표 시각 (프로파일 시작 기준, 초)
+        self.sent = sent      # 요청 시작
+        self.acked = acked    # 응답 받음
+        self.ok = ok
+
+    @property
+    def effective(self):
+        # 드라이버가 요청을 받은 시각 ~ 요청/응답의 중간
+        return (self.sent + self.acked) / 2
+
+    @property
+    def error(self):
+        return self.effective - self.target
+
+    @property
+    def latency(self):
+        return self.acked - self.sent
+
+    def as_dict(self):
+        return {**self.command.as_dict(), "target": self.target, "error": self.error, "latency": self.latency,
+                "ok": self.ok}
+
+
+class ProfileReport:
+    def __init__(self, timings, aborted=False):
+        self.timings = timings
+        self.aborted = aborted
+
+    @property
+    def ok(self):
+        return not self.aborted and all(timing.ok for timing in self.timings)
+
+    def summary(self):
+        errors = [abs(timing.error) for timing in self.timings]
+        if not errors:
+            return {"commands": 0, "failed": 0, "aborted": self.aborted}
+        mean = sum(timing.error for timing in self.timings) / len(errors)
+        return {
+            "commands": len(errors),
+            "failed": sum(not timing.ok for timing in self.timings),
+            "aborted": self.aborted,
+            "mean_error": mean,  # + 면 늦음
+            "jitter": math.sqrt(sum((timing.error - mean) ** 2 for timing in self.timings) / len(errors)),
+            "max_abs_error": max(errors),
+            "mean_latency": sum(timing.latency for timing in self.timings) / len(errors),
+        }
+
+    def as_dicts(self):
+        return [timing.as_dict() for timing in self.timings]
+
+
+class ProfileExecutor:
+    """
+    :param motor: write_register/write_registers 가 있는 컨트롤러 (MotorController 등)
+    :param commands: Profile.compile() 결과 (motor 에 driver 가 있으면 driver/limits 로 검사, 벗어나면 ValueError)
+    :param latency: 처음 버스 지연 추정값 (초), 이후 측정값으로 갱신 (FC6/FC16 따로)
+    :param alpha: 지연 추정 갱신 비율 (지수 이동 평균)
+    :param spin: 마감 직전 이 시간(초)은 sleep 대신 바쁜 대기 (sleep 오버슛 방지)
+    :param start_delay: run() 호출 후 첫 명령까지 여유 (초)
+    """
+    def __init__(self, motor, commands, latency=0.0, alpha=0.3, spin=0.002, start_delay=0.05):
+        self.motor = motor
+        self.commands = list(commands)
+        self.latency = {6: latency, 16: latency}
+        self.alpha = alpha
+        self.spin = spin
+        self.start_delay = start_delay
+        driver = getattr(motor, "driver", None)
+        if driver is not None:
+            check_commands(self.commands, driver, getattr(motor, "limits", None))
+        # MotorController 면 요청 프레임/CRC 를 미리 만들어 두고 그대로 보낸다
+        self.frames = None
+        if hasattr(motor, "send_frame") and hasattr(motor, "device_id"):
+            self.frames = [compile_write(motor.device_id, c.address, c.values, c.label) for c in self.commands]
+
+    def _sleep_until(self, deadline):
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            if remaining > self.spin:
+                time.sleep(remaining - self.spin)
+
+    def _send(self, index, command):
+        if self.frames is not None:
+            return self.motor.send_frame(self.frames[index])
+        if command.function == 6:
+            return self.motor.write_register(command.address, command.values[0])
+        return self.motor.write_registers(command.address, command.values)
+
+    def run(self, stop_event=None, stop_on_error=False):
+        """
+        :param stop_event: set() 되면 남은 명령을 보내지 않고 멈춤 (threading.Event)
+        :return: ProfileReport
+        """
+        start = time.monotonic() + self.start_delay
+        timings = []
+        for index, command in enumerate(self.commands):
+            if stop_event is not None and stop_event.is_set():
+                return ProfileReport(timings, aborted=True)
+            # 요청/응답 중간에 드라이버가 받는다고 보고 지연의 절반만큼 먼저 보낸다
+            self._sleep_until(start + command.t - self.latency[command.function] / 2)
+            sent = time.monotonic()
+            ok = self._send(index, command)
+            acked = time.monotonic()
+            timings.append(CommandTiming(command, command.t, sent - start, acked - start, ok))
+            if ok and acked - sent > 1e-4:  # 캐시에서 생략된 쓰기는 지연 추정에서 뺀다
+                previous = self.latency[command.function]
+                self.latency[command.function] = previous + self.alpha * (acked - sent - previous)
+            if not ok and stop_on_error:
+                return ProfileReport(timings, aborted=True)
+        return ProfileReport(timings)
+
+
+def run_profile(motor, profile, **kwargs):
+    """Profile 을 컴파일해서 바로 실행"""
+    return ProfileExecutor(motor, profile.compile(), **kwargs).run()
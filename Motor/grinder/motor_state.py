@@ -0,0 +1,75 @@
+from .telemetry import REG_SPEED, REG_DIRECTION, REG_ENABLE, REG_BRAKE
+
+# 0x0001 ~ 0x0004 는 연속된 상태 레지스터 -> FC16 한 번으로 쓸 수 있다
+STATE_FIELDS = {
+    "speed": REG_SPEED,
+    "direction": REG_DIRECTION,
+    "enable": REG_ENABLE,
+    "brake": REG_BRAKE,
+}
+
+
+def plan_state_writes(pending, known_state):
+    """
+    바꿀 레지스터들을 최소한의 연속 쓰기로 묶는다.
+    중간에 빠진 레지스터는 마지막으로 쓴 값(known_state)으로 채우고,
+    모르는 값이 끼어 있으면 블록을 나눈다.
+    :return: [(시작 주소, [값, ...]), ...]
+    """
+    writes = []
+    for address in sorted(pending):
+        if writes:
+            start, values = writes[-1]
+            end = start + len(values)
+            gap = range(end, address)
+            if all(reg in known_state for reg in gap):
+                values.extend(known_state[reg] for reg in gap)
+                values.append(pending[address])
+                continue
+        writes.append((address, [pending[address]]))
+    return writes
+
+
+class StateTransaction:
+    """
+    상태 레지스터 부분 변경을 모았다가 한 번에 쓰는 빌더
+
+        with motor.transaction() as tx:
+            tx.set(enable=0).set(direction=1)
+    """
+    def __init__(self, controller):
+        self.controller = controller
+        self.fields = {}
+        self.result = None
+
+    def set(self, **fields):
+        for name in fields:
+            if name not in STATE_FIELDS:
+                raise TypeError(f"unknown state field: {name}")
+        self.fields.update(fields)
+        return self
+
+    def speed(self, speed):
+        return self.set(speed=speed)
+
+    def direction(self, direction):
+        return self.set(direction=direction)
+
+    def enable(self, enable):
+        return self.set(enable=enable)
+
+    def brake(self, brake):
+        return self.set(brake=brake)
+
+    def commit(self):
+        self.result = self.controller.apply_state(**self.fields)
+        self.fields = {}
+        return self.result
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None and self.fields:
+            self.commit()
+        return False
@@ -0,0 +1,300 @@
+"""
+메모리 맵 기반 열(column) 단위 텔레메트리 기록기
+
+파일 하나 = 청크 하나 (가득 차면 다음 파일로 교체)
+    [0, 4096)   헤더: magic | version | schema 길이 | 기록된 행 수(count) | capacity | 생성 시각 | schema(JSON)
+    [4096, ...) 열 데이터: t(float64) 열, 채널 열들이 각각 capacity 개씩 연속으로 배치
+
+쓰는 쪽은 값을 먼저 쓰고 마지막에 헤더의 count 를 올린다.
+읽는 쪽은 count 까지만 보므로 기록 중인 파일도 복사 없이(np.memmap) 열어볼 수 있다.
+
+파일 이름은 <name>_<run>_<청크 번호>.grec, run 은 Recorder 하나마다 새로 만드는 id (시작 시각 + 난수)
+-> 같은 이름으로 여러 번 기록해도 session_paths 로 한 번의 기록만 골라 읽는다.
+"""
+import json
+import os
+import re
+import struct
+import threading
+import time
+import uuid
+
+import numpy as np
+
+MAGIC = b"GRINDREC"
+VERSION = 1
+HEADER_SIZE = 4096
+HEADER_STRUCT = struct.Struct("<8sIIQQd")  # magic, version, schema_len, count, capacity, created
+COUNT_OFFSET = 16
+SCHEMA_OFFSET = 64
+COLUMN_ALIGN = 64
+FILE_SUFFIX = ".grec"
+
+
+def _column_offsets(columns, capacity):
+    offsets = []
+    offset = HEADER_SIZE
+    for _, dtype in columns:
+        offsets.append(offset)
+        size = np.dtype(dtype).itemsize * capacity
+        offset += (size + COLUMN_ALIGN - 1) // COLUMN_ALIGN * COLUMN_ALIGN
+    return offsets, offset
+
+
+class ChunkWriter:
+    """청크 파일 하나에 대한 쓰기 (Recorder 내부용)"""
+    def __init__(self, path, columns, capacity, meta=None):
+        self.path = path
+        self.columns = columns
+        self.capacity = capacity
+        self.count = 0
+        offsets, size = _column_offsets(columns, capacity)
+        schema = json.dumps({
+            "columns": [[name, np.dtype(dtype).str] for name, dtype in columns],
+            "capacity": capacity,
+            "meta": meta or {},
+        }).encode()
+        if SCHEMA_OFFSET + len(schema) > HEADER_SIZE:
+            raise ValueError("schema too large for header")
+
+        with open(path, "wb") as f:
+            f.truncate(size)  # 희소 파일로 미리 크기 확보
+        self.mm = np.memmap(path, dtype=np.uint8, mode="r+", shape=(size,))
+        header = HEADER_STRUCT.pack(MAGIC, VERSION, len(schema), 0, capacity, time.time())
+        self.mm[:len(header)] = np.frombuffer(header, dtype=np.uint8)
+        self.mm[SCHEMA_OFFSET:SCHEMA_OFFSET + len(schema)] = np.frombuffer(schema, dtype=np.uint8)
+        self.arrays = [
+            np.ndarray((capacity,), dtype=dtype, buffer=self.mm, offset=offset)
+            for (_, dtype), offset in zip(columns, offsets)
+        ]
+        self.count_view = np.ndarray((1,), dtype="<u8", buffer=self.mm, offset=COUNT_OFFSET)
+
+    @property
+    def free(self):
+        return self.capacity - self.count
+
+    def write(self, t, values, n):
+        """t: (n,), values: (channels, n) - 공간은 호출 쪽에서 확인"""
+        start = self.count
+        end = start + n
+        self.arrays[0][start:end] = t
+        for array, column in zip(self.arrays[1:], values):
+            array[start:end] = column
+        self.count = end
+        self.count_view[0] = end  # 데이터를 다 쓴 뒤에 count 공개
+
+    def flush(self):
+        self.mm.flush()
+
+    def close(self):
+        self.flush()
+        # view 를 모두 놓아야 매핑이 닫힌다
+        self.arrays = None
+        self.count_view = None
+        self.mm = None
+
+
+class Recorder:
+    """
+    append-only 다채널 기록기
+
+        recorder = Recorder("recordings", "hall", ("hall_a", "hall_b", "hall_c"))
+        recorder.append(t, [a, b, c])        # 한 샘플
+        recorder.extend(t_array, values_2d)  # 여러 샘플
+        recorder.close()
+
+    :param chunk_rows: 파일 하나에 담을 행 수 (가득 차면 다음 파일로 교체)
+    :param rotate_seconds: 지정하면 이 시간마다 파일 교체
+    :param flush_interval: 이 주기마다 백그라운드에서 msync (0 이면 close 때만)
+    """
+    def __init__(self, directory, name, channels, dtype=np.float64, chunk_rows=1 << 20,
+                 rotate_seconds=None, flush_interval=1.0, meta=None):
+        self.directory = directory
+        self.name = name
+        self.channels = tuple(channels)
+        self.columns = [("t", np.float64)] + [(channel, dtype) for channel in self.channels]
+        self.chunk_rows = chunk_rows
+        self.rotate_seconds = rotate_seconds
+        self.flush_interval = flush_interval
+        self.meta = meta or {}
+        self.lock = threading.Lock()
+        self.chunk = None
+        self.chunk_index = 0
+        self.chunk_started = 0.0
+        self.rows = 0
+        self.flushes = 0
+        self.dirty = False
+        self.paths = []
+        self.run = f"{time.strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"  # 청크 파일 이름에 들어가는 기록 id
+        os.makedirs(directory, exist_ok=True)
+        self._rotate()
+
+        self.running = threading.Event()
+        self.flusher = None
+        if flush_interval:
+            self.running.set()
+            self.flusher = threading.Thread(target=self._flush_loop, daemon=True)
+            self.flusher.start()
+
+    def _rotate(self):
+        if self.chunk is not None:
+            self.chunk.close()
+        path = os.path.join(self.directory, f"{self.name}_{self.run}_{self.chunk_index:05d}{FILE_SUFFIX}")
+        self.chunk_index += 1
+        self.chunk = ChunkWriter(path, self.columns, self.chunk_rows, self.meta)
+        self.chunk_started = time.monotonic()
+        self.paths.append(path)
+
+    def append(self, t, values):
+        self.extend(np.array([t], dtype=np.float64), np.asarray(values, dtype=np.float64).reshape(-1, 1))
+
+    def extend(self, t, values):
+        t = np.asarray(t, dtype=np.float64)
+        values = np.asarray(values).reshape(len(self.channels), -1)
+        total = t.shape[0]
+        written = 0
+        with self.lock:
+            if self.rotate_seconds and time.monotonic() - self.chunk_started >= self.rotate_seconds:
+                self._rotate()
+            while written < total:
+                if not self.chunk.free:
+                    self._rotate()
+                n = min(self.chunk.free, total - written)
+                self.chunk.write(t[written:written + n], values[:, written:written + n], n)
+                written += n
+            self.rows += total
+            self.dirty = True
+
+    def flush(self):
+        with self.lock:
+            if self.chunk is not None and self.dirty:
+                self.chunk.flush()
+                self.dirty = False
+                self.flushes += 1
+
+    def _flush_loop(self):
+        # msync 는 여기서 몰아서 -> 기록하는 쪽(폴링/수집 스레드)은 디스크를 기다리지 않는다
+        while self.running.is_set():
+            time.sleep(self.flush_interval)
+            self.flush()
+
+    def close(self):
+        self.running.clear()
+        if self.flusher:
+            self.flusher.join()
+        with self.lock:
+            if self.chunk is not None:
+                self.chunk.close()
+                self.chunk = None
+
+
+class RecordingReader:
+    """
+    청크 파일 하나를 읽기 전용 메모리 맵으로 연다 (기록 중인 파일도 가능)
+    refresh() 로 그 사이 늘어난 행 수를 다시 읽는다.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.mm = np.memmap(path, dtype=np.uint8, mode="r")
+        magic, version, schema_len, _, capacity, created = HEADER_STRUCT.unpack(
+            self.mm[:HEADER_STRUCT.size].tobytes()
+        )
+        if magic != MAGIC:
+            raise ValueError(f"not a recording file: {path}")
+        if version != VERSION:
+            raise ValueError(f"unsupported recording version {version}")
+        schema = json.loads(self.mm[SCHEMA_OFFSET:SCHEMA_OFFSET + schema_len].tobytes())
+        self.capacity = capacity
+        self.created = created
+        self.meta = schema.get("meta", {})
+        self.columns = [(name, np.dtype(dtype)) for name, dtype in schema["columns"]]
+        self.channels = tuple(name for name, _ in self.columns[1:])
+        offsets, _ = _column_offsets(self.columns, capacity)
+        self.arrays = {
+            name: np.ndarray((capacity,), dtype=dtype, buffer=self.mm, offset=offset)
+            for (name, dtype), offset in zip(self.columns, offsets)
+        }
+        self.count_view = np.ndarray((1,), dtype="<u8", buffer=self.mm, offset=COUNT_OFFSET)
+        self.count = 0
+        self.refresh()
+
+    def refresh(self):
+        self.count = int(self.count_view[0])
+        return self.count
+
+    def __len__(self):
+        return self.count
+
+    def column(self, name):
+        """복사 없는 view (count 까지)"""
+        return self.arrays[name][:self.count]
+
+    @property
+    def t(self):
+        return self.column("t")
+
+    def values(self):
+        """(channels, count) - 열을 모으므로 복사본"""
+        return np.vstack([self.column(name) for name in self.channels])
+
+
+RUN_PATTERN = r"(\d{8}_\d{6}_[0-9a-f]{8})_(\d{5})"  # Recorder.run, 청크 번호
+
+
+def _session_files(directory, name):
+    """{run: [(청크 번호, 경로)]} - 이름이 정확히 name 인 기록만 (name 으로 시작하는 다른 이름 제외)"""
+    pattern = re.compile(re.escape(name) + "_" + RUN_PATTERN + re.escape(FILE_SUFFIX) + "$")
+    runs = {}
+    for filename in os.listdir(directory) if os.path.isdir(directory) else ():
+        match = pattern.match(filename)
+        if match:
+            runs.setdefault(match.group(1), []).append((int(match.group(2)), os.path.join(directory, filename)))
+    return runs
+
+
+def _run_order(runs):
+    # run id 는 초 단위 시각이라 같은 초에 시작한 기록은 첫 청크 헤더의 생성 시각으로 가른다
+    return lambda run: (run[:15], RecordingReader(min(runs[run])[1]).created)
+
+
+def session_runs(directory, name):
+    """name 으로 기록된 run id 들 (오래된 것부터)"""
+    runs = _session_files(directory, name)
+    return sorted(runs, key=_run_order(runs))
+
+
+def session_paths(directory, name, run=None):
+    """
+    한 번의 기록(run)의 청크 파일들을 순서대로
+    :param run: Recorder.run (None 이면 가장 최근 기록)
+    """
+    runs = _session_files(directory, name)
+    if run is None:
+        if not runs:
+            return []
+        run = max(runs, key=_run_order(runs))
+    return [path for _, path in sorted(runs.get(run, ()))]
+
+
+def read_session(paths):
+    """
+    여러 청크를 이어 붙여 (t, values, channels) 반환 (복사본)
+    청크는 첫 시각 순으로 잇고, 이어 붙인 시간축이 거꾸로 가면 ValueError (다른 기록이 섞임 등)
+    """
+    readers = [RecordingReader(path) for path in paths]
+    if not readers:
+        return np.zeros(0), np.zeros((0, 0)), ()
+    channels = readers[0].channels
+    for reader in readers[1:]:
+        if reader.channels != channels:
+            raise ValueError(f"{reader.path}: channels {reader.channels} differ from {channels}")
+    readers = sorted((reader for reader in readers if len(reader)), key=lambda reader: reader.t[0])
+    if not readers:
+        return np.zeros(0), np.zeros((len(channels), 0)), channels
+    t = np.concatenate([reader.t for reader in readers])
+    values = np.concatenate([reader.values() for reader in readers], axis=1)
+    backwards = np.flatnonzero(np.diff(t) < 0)
+    if len(backwards):
+        raise ValueError(f"recording time goes backwards at sample {backwards[0] + 1} "
+                         f"({t[backwards[0]]} -> {t[backwards[0] + 1]})")
+    return t, values, channels
@@ -0,0 +1,179 @@
+"""
+레지스터 캐시 (write-through)
+
+ModbusSerialClient 와 같은 모양의 메서드를 가진 래퍼라서 MotorController 는
+    self.client = CachedClient(ModbusSerialClient(...))
+한 줄만 바꾸면 된다.
+
+- 호스트가 쓰는 설정 레지스터(속도/방향/활성화/브레이크)는 마지막으로 쓴 값을 기억한다
+  -> 같은 값 다시 쓰기는 버스로 보내지 않고, 읽기는 캐시에서 바로 돌려준다
+     (캐시 값이 verify_interval 보다 오래되면 쓰기도 그대로 보낸다 - 드라이버 리셋/다른 마스터 대비)
+- RPM/전류 같은 텔레메트리는 항상 버스에서 읽는다
+- 드라이버별 정책은 drivers.DriverProfile.policies (예: hoder 0x0023~0x0026)
+- verify_interval 을 주면 캐시 값을 그 주기마다 한 번씩 실제로 읽어 확인한다 (드라이버 리셋 등)
+"""
+import time
+
+from .telemetry import REG_SPEED, REG_DIRECTION, REG_ENABLE, REG_BRAKE
+
+VOLATILE = "volatile"  # 매번 버스에서 읽음
+HOST = "host"          # 호스트 소유, 캐시에서 읽고 같은 값 쓰기는 생략
+
+DEFAULT_POLICIES = {
+    REG_SPEED: HOST,
+    REG_DIRECTION: HOST,
+    REG_ENABLE: HOST,
+    REG_BRAKE: HOST,
+}
+
+
+class CachedResponse:
+    """버스를 거치지 않은 응답 (pymodbus 응답처럼 isError()/registers 제공)"""
+    def __init__(self, registers=None):
+        self.registers = registers or []
+
+    def isError(self):
+        return False
+
+
+class CachedClient:
+    """
+    :param client: pymodbus 클라이언트 (또는 같은 모양의 래퍼)
+    :param policies: {주소: VOLATILE|HOST}, 없는 주소는 VOLATILE
+    :param verify_interval: 캐시 값을 실제로 다시 읽어 확인하는 주기 (초, None 이면 안 함)
+    """
+    def __init__(self, client, policies=None, verify_interval=None):
+        self.client = client
+        self.policies = dict(DEFAULT_POLICIES if policies is None else policies)
+        self.verify_interval = verify_interval
+        self.values = {}    # (slave, address) -> 값
+        self.verified = {}  # (slave, address) -> 마지막으로 버스에서 확인한 시각
+        self.hits = 0
+        self.misses = 0
+        self.elided = 0
+        self.writes = 0
+        self.mismatches = 0  # 확인 읽기에서 캐시와 다른 값이 나온 횟수
+
+    def __getattr__(self, name):
+        # connect/close 등 나머지는 그대로 넘긴다
+        return getattr(self.client, name)
+
+    def is_host(self, address):
+        return self.policies.get(address, VOLATILE) == HOST
+
+    def _fresh(self, key, now):
+        if key not in self.values:
+            return False
+        if self.verify_interval is None:
+            return True
+        return now - self.verified.get(key, 0.0) < self.verify_interval
+
+    def _unchanged(self, key, value, now):
+        # 같은 값이고 확인한 지 verify_interval 이 안 지났을 때만 쓰기를 생략한다
+        return self.is_host(key[1]) and self.values.get(key) == value and self._fresh(key, now)
+
+    def invalidate(self, slave=None):
+        """캐시 비우기 (재연결 뒤 등 드라이버 상태를 알 수 없을 때)"""
+        if slave is None:
+            self.values.clear()
+            self.verified.clear()
+            return
+        for key in [key for key in self.values if key[0] == slave]:
+            del self.values[key]
+            self.verified.pop(key, None)
+
+    def read_holding_registers(self, address, count=1, slave=0, fresh=False, **kwargs):
+        # fresh=True 면 캐시를 건너뛰고 버스에서 읽는다 (쓰기 확인용)
+        now = time.monotonic()
+        keys = [(slave, reg) for reg in range(address, address + count)]
+        if not fresh and all(self.is_host(reg) for _, reg in keys) and all(self._fresh(key, now) for key in keys):
+            self.hits += count
+            return CachedResponse([self.values[key] for key in keys])
+
+        self.misses += count
+        response = self.client.read_holding_registers(address=address, count=count, slave=slave, **kwargs)
+        if response and not response.isError():
+            for key, value in zip(keys, response.registers):
+                if not self.is_host(key[1]):
+                    continue
+                if key in self.values and self.values[key] != value:
+                    self.mismatches += 1
+                self.values[key] = value
+                self.verified[key] = now
+        return response
+
+    def write_register(self, address, value, slave=0, **kwargs):
+        if self._unchanged((slave, address), value, time.monotonic()):
+            self.elided += 1
+            return CachedResponse()
+        self.writes += 1
+        response = None
+        try:
+            response = self.client.write_register(address=address, value=value, slave=slave, **kwargs)
+        finally:
+            self._after_write(slave, address, [value], response)
+        return response
+
+    def write_registers(self, address, values, slave=0, **kwargs):
+        values = list(values)
+        now = time.monotonic()
+        changed = [i for i, value in enumerate(values) if not self._unchanged((slave, address + i), value, now)]
+        if not changed:
+            self.elided += len(values)
+            return CachedResponse()
+        # 바뀐 구간만 보낸다 (앞뒤로 같은 값은 잘라냄)
+        first, last = changed[0], changed[-1]
+        self.elided += len(values) - (last - first + 1)
+        self.writes += 1
+        start = address + first
+        span = values[first:last + 1]
+        response = None
+        try:
+            if len(span) == 1:
+                response = self.client.write_register(address=start, value=span[0], slave=slave, **kwargs)
+            else:
+                response = self.client.write_registers(address=start, values=span, slave=slave, **kwargs)
+        finally:
+            self._after_write(slave, start, span, response)
+        return response
+
+    def send_frame(self, frame):
+        # 미리 만든 쓰기 프레임 (rtu.CompiledFrame): 모두 같은 값이면 생략, 프레임은 자르지 않는다
+        keys = [(frame.slave, frame.address + i) for i in range(len(frame.values))]
+        now = time.monotonic()
+        if all(self._unchanged(key, value, now) for key, value in zip(keys, frame.values)):
+            self.elided += len(frame.values)
+            return CachedResponse()
+        self.writes += 1
+        response = None
+        try:
+            response = self.client.send_frame(frame)
+        finally:
+            self._after_write(frame.slave, frame.address, frame.values, response)
+        return response
+
+    def _after_write(self, slave, address, values, response):
+        ok = response is not None and not response.isError()
+        now = time.monotonic()
+        for offset, value in enumerate(values):
+            key = (slave, address + offset)
+            if not self.is_host(key[1]):
+                continue
+            if ok:
+                self.values[key] = value
+                self.verified[key] = now  # 정상 응답 = 드라이버가 받은 값
+            else:
+                # 실패하면 실제 값을 모름 -> 다음 읽기/쓰기는 버스로
+                self.values.pop(key, None)
+                self.verified.pop(key, None)
+
+    def stats(self):
+        reads = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / reads if reads else 0.0,
+            "writes": self.writes,
+            "elided": self.elided,
+            "mismatches": self.mismatches,
+        }
@@ -0,0 +1,305 @@
+"""
+기록된 세션(recorder.py)을 MotorController 대신 재생하는 소스
+
+    motor = ReplayController.from_session("recordings", "motor", speed=10)  # 10배속
+    motor.read_register(0x0015)   # 재생 시각의 RPM
+    motor.set_speed(50)           # 버스 대신 motor.commands 에 기록
+    diff_commands(motor.commands, load_commands("baseline.jsonl"))
+
+speed=1 실시간, speed=N N배속, speed=None 가상 시간(sleep 할 때만 시간이 흐름, 단일 스레드용)
+"""
+import argparse
+import json
+import threading
+import time as _time
+from contextlib import contextmanager
+
+import numpy as np
+
+from .controller import MotorCore
+from .recorder import read_session, session_paths
+from .register_cache import HOST
+from .telemetry import DEFAULT_TELEMETRY, REGISTER_NAMES, read_snapshot
+
+REGISTER_BY_NAME = {name: address for address, name in REGISTER_NAMES.items()}
+
+
+class ReplayClock:
+    """
+    재생 시각 (기록 파일의 시간축 기준)
+    - speed 가 숫자면 실제 경과 시간 * speed
+    - speed 가 None 이면 sleep() 호출로만 시간이 흐르는 가상 시계
+    """
+    def __init__(self, start, speed=1.0):
+        self.start = start
+        self.speed = speed
+        self.virtual = start
+        self.real_start = _time.monotonic()
+        self.lock = threading.Lock()
+
+    def now(self):
+        if self.speed is None:
+            return self.virtual
+        return self.start + (_time.monotonic() - self.real_start) * self.speed
+
+    def sleep(self, seconds):
+        if seconds <= 0:
+            return
+        if self.speed is None:
+            with self.lock:
+                self.virtual += seconds
+            _time.sleep(0)  # 다른 스레드에 양보만
+        else:
+            _time.sleep(seconds / self.speed)
+
+    def elapsed(self):
+        return self.now() - self.start
+
+
+class ClockShim:
+    """모듈의 `time` 자리에 끼워 넣는 객체 (sleep/time/monotonic 이 재생 시계를 따름)"""
+    def __init__(self, clock):
+        self._clock = clock
+
+    def sleep(self, seconds):
+        self._clock.sleep(seconds)
+
+    def time(self):
+        return self._clock.now()
+
+    def monotonic(self):
+        return self._clock.now()
+
+    def perf_counter(self):
+        return self._clock.now()
+
+    def __getattr__(self, name):
+        return getattr(_time, name)
+
+
+@contextmanager
+def patched_time(clock, *modules):
+    """
+    modules 안의 `time` 을 재생 시계로 바꿔 둔다 (제어 루프의 time.sleep(0.1) 도 N배속으로)
+    """
+    shim = ClockShim(clock)
+    modules = [module for module in dict.fromkeys(modules) if hasattr(module, "time")]  # 중복/time 없는 모듈 제외
+    saved = [(module, module.time) for module in modules]
+    for module, _ in saved:
+        module.time = shim
+    try:
+        yield shim
+    finally:
+        for module, original in saved:
+            module.time = original
+
+
+class ReplayController(MotorCore):
+    """
+    MotorController 와 같은 메서드를 가진 재생용 컨트롤러 (드라이버 프로파일 / max_speed 는 MotorCore)
+    - 읽기: 재생 시각에 해당하는 기록 샘플 값 (호스트가 쓴 상태 레지스터는 마지막으로 쓴 값)
+    - 쓰기: 버스로 보내지 않고 commands 에 (재생 시각, 함수, 주소, 값) 으로 기록
+    """
+    def __init__(self, t, values, channels, speed=1.0, period=None, driver=None, max_speed=None):
+        super().__init__(driver, max_speed)
+        # 호스트가 쓰는 레지스터 (읽으면 기록 값 대신 마지막으로 쓴 값)
+        self.host_registers = {address for address, policy in self.driver.policies.items() if policy == HOST}
+        self.t = np.asarray(t, dtype=np.float64)
+        self.values = np.asarray(values)
+        self.channels = tuple(channels)
+        self.rows = {}
+        for row, name in enumerate(self.channels):
+            address = self.driver.address(name)
+            if address is None:
+                address = REGISTER_BY_NAME.get(name)
+            if address is None and name.startswith("0x"):
+                address = int(name, 16)
+            if address is not None:
+                self.rows[address] = row
+        if period is None:
+            period = float(np.median(np.diff(self.t))) if len(self.t) > 1 else 0.0
+        self.period = period
+        self.clock = ReplayClock(self.t[0] if len(self.t) else 0.0, speed)
+        self.lock = threading.Lock()
+        self.commands = []
+        self.reads = 0
+        self.finished = False
+
+    @classmethod
+    def from_session(cls, directory, name, speed=1.0, run=None, **kwargs):
+        """:param run: recorder.Recorder.run (None 이면 name 의 가장 최근 기록)"""
+        t, values, channels = read_session(session_paths(directory, name, run))
+        if not len(t):
+            raise ValueError(f"no recording found for {name} ({run or 'latest'}) in {directory}")
+        return cls(t, values, channels, speed=speed, **kwargs)
+
+    # ---- MotorController 인터페이스 ----
+    def connect(self):
+        return True
+
+    def close(self):
+        self.set_speed(0)
+
+    def sample_index(self):
+        now = self.clock.now()
+        if now > self.t[-1] + self.period:
+            self.finished = True
+            return None
+        return max(0, int(np.searchsorted(self.t, now, side="right")) - 1)
+
+    def read_register(self, address, count=1, fresh=False):
+        with self.lock:
+            index = self.sample_index()
+            if index is None:
+                return None  # 기록 끝 -> 통신 실패처럼 보인다
+            self.reads += 1
+            registers = []
+            for reg in range(address, address + count):
+                if reg in self.host_registers and reg in self.state:
+                    registers.append(self.state[reg])
+                elif reg in self.rows:
+                    registers.append(int(self.values[self.rows[reg], index]))
+                else:
+                    registers.append(self.state.get(reg, 0))
+            return registers
+
+    def _record(self, function, address, values):
+        self.commands.append({
+            "t": round(float(self.clock.elapsed()), 6),
+            "function": function,
+            "address": address,
+            "values": list(values),
+        })
+
+    def write_register(self, address, value):
+        with self.lock:
+            self._record("write_register", address, [value])
+            self.state[address] = value
+        return True
+
+    def write_registers(self, address, values):
+        with self.lock:
+            self._record("write_registers", address, values)
+            for offset, value in enumerate(values):
+                self.state[address + offset] = value
+        return True
+
+    def read_snapshot(self, registers=DEFAULT_TELEMETRY, max_gap=0):
+        snapshot = read_snapshot(self.read_register, registers, max_gap=max_gap)
+        snapshot.timestamp = snapshot.monotonic = self.clock.now()
+        return snapshot
+
+
+# ---- 명령 비교 ----
+def save_commands(commands, path):
+    with open(path, "w") as f:
+        for command in commands:
+            f.write(json.dumps(command) + "\n")
+
+
+def load_commands(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def diff_commands(actual, expected, time_tolerance=0.05):
+    """
+    두 명령 목록 비교 (순서대로, 시각은 time_tolerance 초까지 허용)
+    :return: 차이 목록 (비어 있으면 같음)
+    """
+    differences = []
+    for index in range(max(len(actual), len(expected))):
+        a = actual[index] if index < len(actual) else None
+        e = expected[index] if index < len(expected) else None
+        if a is None or e is None:
+            differences.append({"index": index, "actual": a, "expected": e})
+            continue
+        same_command = (a["function"], a["address"], a["values"]) == (e["function"], e["address"], e["values"])
+        if not same_command or abs(a["t"] - e["t"]) > time_tolerance:
+            differences.append({"index": index, "actual": a, "expected": e})
+    return differences
+
+
+class InlineTelemetry:
+    """
+    가상 시간(speed=None)용 구독자: poll() 할 때 그 자리에서 한 번 읽는다
+    폴링 스레드가 따로 sleep 하면 가상 시계가 두 배로 흐르므로 스레드 없이 돌린다
+    """
+    def __init__(self, poller):
+        self.poller = poller
+        self.subscription = poller.subscribe()
+
+    def poll(self):
+        self.poller.poll_once()
+        return self.subscription.poll()
+
+    def latest(self):
+        return self.subscription.latest()
+
+    @property
+    def dropped(self):
+        return self.subscription.dropped
+
+
+def replay_motor_control(motor, script, rate_hz=10):
+    """
+    script(grinder.ui 모듈 등)의 motor_control 을 재생 데이터로 기록이 끝날 때까지 돌린다
+    script.motor_control(motor, run_event, direction_lock, current_direction, input_queue, telemetry)
+    """
+    import sys
+    from queue import Queue
+    from . import scheduler, telemetry, telemetry_poller
+
+    # 스크립트가 motor_control 을 다른 모듈(grinder.ui)에서 가져다 쓰는 경우 그 모듈의 시간도 바꾼다
+    control_module = sys.modules[script.motor_control.__module__]
+
+    poller = telemetry_poller.TelemetryPoller(motor, rate_hz=rate_hz)
+    virtual = motor.clock.speed is None
+    run_event = threading.Event()
+    run_event.set()
+    with patched_time(motor.clock, script, control_module, scheduler, telemetry, telemetry_poller):
+        if virtual:
+            subscription = InlineTelemetry(poller)
+        else:
+            poller.start()
+            subscription = poller.subscribe()
+        thread = threading.Thread(
+            target=script.motor_control,
+            args=(motor, run_event, threading.Lock(), [0], Queue(), subscription),
+        )
+        thread.start()
+        while not motor.finished:
+            _time.sleep(0.01)
+        run_event.clear()
+        thread.join()
+        poller.stop()
+    return motor.commands
+
+
+if __name__ == "__main__":
+    import importlib
+
+    parser = argparse.ArgumentParser(description="기록된 세션으로 motor_control 재생")
+    parser.add_argument("directory")
+    parser.add_argument("name")
+    parser.add_argument("--script", default="grinder.ui", help="motor_control 이 들어 있는 모듈")
+    parser.add_argument("--speed", type=float, default=10.0, help="재생 배속 (0 이면 가상 시간으로 최대한 빠르게)")
+    parser.add_argument("--output", default=None, help="발행된 명령 저장 (jsonl)")
+    parser.add_argument("--compare", default=None, help="비교할 기준 명령 파일 (jsonl)")
+    parser.add_argument("--run", default=None, help="재생할 기록 id (기본은 가장 최근, recorder.session_runs)")
+    parser.add_argument("--driver", default=None, help="드라이버 프로파일 (기본 grinder)")
+    parser.add_argument("--max-speed", type=int, default=None)
+    args = parser.parse_args()
+
+    motor = ReplayController.from_session(args.directory, args.name, speed=args.speed or None, run=args.run,
+                                          driver=args.driver, max_speed=args.max_speed)
+    started = _time.monotonic()
+    commands = replay_motor_control(motor, importlib.import_module(args.script))
+    print(f"재생 {motor.t[-1] - motor.t[0]:.1f}초 -> {_time.monotonic() - started:.1f}초, 명령 {len(commands)}개")
+    if args.output:
+        save_commands(commands, args.output)
+    if args.compare:
+        differences = diff_commands(commands, load_commands(args.compare))
+        for difference in differences:
+            print(difference)
+        print("동일" if not differences else f"차이 {len(differences)}개")
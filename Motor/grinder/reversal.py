@@ -0,0 +1,148 @@
+"""
+정지(stall) 감지 -> 자동 방향 전환 상태 기계
+
+    RUNNING --rpm<=stall_rpm--> STALL_SUSPECT --suspect_time 동안 유지--> REVERSING
+       ^                            |  rpm>=resume_rpm (일시적인 0, 읽기 누락)        |
+       |<---------------------------+                                                 v
+       +----------------rpm>=resume_rpm (새 방향으로 회전 확인)------------------ SETTLING
+
+- 샘플마다 update() 한 번 (버퍼 합계 없이 증분 계산)
+- 판단은 샘플 수가 아닌 시간 기준, stall_rpm/resume_rpm 두 문턱으로 히스테리시스
+- 읽기 실패(None)는 상태를 바꾸지 않는다 -> 한 번 누락으로 전환하지 않음
+- 전환 후 고정 대기 대신 RPM 이 다시 올라오는 순간 RUNNING 으로 돌아간다
+- 방향은 0/1 로 다루고, 레지스터 값(예: hoder 1 = CW, 2 = CCW)으로는 reverse_fields/logical_direction 이 바꾼다
+"""
+from .drivers import get_driver
+
+RUNNING = "RUNNING"
+STALL_SUSPECT = "STALL_SUSPECT"
+REVERSING = "REVERSING"
+SETTLING = "SETTLING"
+
+
+class StallReversal:
+    """
+    :param stall_rpm: 이 값 이하면 멈춘 것으로 의심
+    :param resume_rpm: 이 값 이상이면 돌고 있는 것으로 봄 (stall_rpm 보다 커야 함)
+    :param suspect_time: 멈춤이 이 시간(초) 이상 이어져야 방향 전환
+    :param reverse_timeout: 방향 레지스터 읽기가 이 시간 안에 새 방향을 보이지 않으면 명령 재전송
+    :param settle_timeout: 전환 후 이 시간 안에 돌지 않으면 다시 멈춤으로 판단
+    """
+    def __init__(self, direction=0, stall_rpm=0, resume_rpm=30, suspect_time=0.05,
+                 reverse_timeout=0.1, settle_timeout=1.0):
+        if resume_rpm <= stall_rpm:
+            raise ValueError("resume_rpm must be greater than stall_rpm")
+        self.direction = direction
+        self.stall_rpm = stall_rpm
+        self.resume_rpm = resume_rpm
+        self.suspect_time = suspect_time
+        self.reverse_timeout = reverse_timeout
+        self.settle_timeout = settle_timeout
+        self.state = RUNNING
+        self.since = None       # 현재 상태에 들어온 시각
+        self.reversed_at = None  # 마지막 방향 전환 명령 시각
+        self.reversals = 0
+        self.retries = 0
+        self.suppressed = 0      # 의심했다가 다시 돌아서 전환하지 않은 횟수
+        self.latencies = []      # 멈춤 감지 ~ 새 방향 회전 확인 (초)
+        self.stalled_at = None
+
+    def _enter(self, state, t):
+        self.state = state
+        self.since = t
+
+    def _reverse(self, t):
+        self.direction = 1 - self.direction
+        self.reversed_at = t
+        self.reversals += 1
+        self._enter(REVERSING, t)
+        return self.direction
+
+    def update(self, t, rpm, direction=None):
+        """
+        :param t: 샘플 시각 (초, monotonic 계열)
+        :param rpm: 읽은 RPM (읽기 실패면 None)
+        :param direction: 방향 레지스터 읽은 값 (없으면 None)
+        :return: 새로 보내야 할 방향 (보낼 명령이 없으면 None)
+        """
+        if rpm is None:
+            return None
+        if self.state == RUNNING:
+            if rpm <= self.stall_rpm:
+                self.stalled_at = t
+                self._enter(STALL_SUSPECT, t)
+                return self.update(t, rpm, direction) if self.suspect_time <= 0 else None
+        elif self.state == STALL_SUSPECT:
+            if rpm >= self.resume_rpm:
+                self.suppressed += 1
+                self._enter(RUNNING, t)
+            elif rpm <= self.stall_rpm and t - self.since >= self.suspect_time:
+                return self._reverse(t)
+        elif self.state == REVERSING:
+            if direction is None or direction == self.direction:
+                self._enter(SETTLING, t)
+                return self.update(t, rpm, direction)
+            if t - self.since >= self.reverse_timeout:
+                self.retries += 1
+                self._enter(REVERSING, t)
+                return self.direction
+        elif self.state == SETTLING:
+            if rpm >= self.resume_rpm:
+                self.latencies.append(t - self.stalled_at)
+                self._enter(RUNNING, t)
+            elif t - self.since >= self.settle_timeout:
+                # 새 방향으로도 돌지 못함 -> 다시 멈춤 판단부터
+                self.stalled_at = t
+                self._enter(STALL_SUSPECT, t)
+        return None
+
+    def command_failed(self, t):
+        """방향 전환 쓰기가 실패하면 호출 -> 다음 샘플에서 다시 보낸다"""
+        self.direction = 1 - self.direction
+        self.reversals -= 1
+        self._enter(STALL_SUSPECT, t - self.suspect_time)
+
+    def stats(self):
+        latencies = sorted(self.latencies)
+        return {
+            "state": self.state,
+            "reversals": self.reversals,
+            "retries": self.retries,
+            "suppressed": self.suppressed,
+            "latency_median": latencies[len(latencies) // 2] if latencies else None,
+            "latency_max": latencies[-1] if latencies else None,
+        }
+
+
+def _driver(motor):
+    return getattr(motor, "driver", None) or get_driver()
+
+
+def _direction_values(driver):
+    reg = driver.registers.get("direction")
+    return reg.values if reg is not None and reg.values else (0, 1)
+
+
+def feedback_registers(motor):
+    """자동 방향 전환에 읽을 (rpm, direction) 레지스터 주소 (프로파일에 없으면 None)"""
+    driver = _driver(motor)
+    return driver.address("rpm"), driver.address("direction")
+
+
+def logical_direction(motor, raw):
+    """방향 레지스터 값 -> 0/1 (모르는 값이면 None)"""
+    values = _direction_values(_driver(motor))
+    return values.index(raw) if raw in values else None
+
+
+def reverse_fields(motor, direction):
+    """
+    방향 전환에 필요한 최소 필드 (0/1 방향 -> motor.driver 의 레지스터 값)
+    enable 레지스터가 있는 드라이버에서 enable 이 아직 1로 쓰이지 않았으면 같이 쓴다
+    """
+    driver = _driver(motor)
+    fields = {"direction": _direction_values(driver)[direction]}
+    enable = driver.address("enable")
+    if enable is not None and getattr(motor, "state", {}).get(enable) != 1:
+        fields["enable"] = 1
+    return fields
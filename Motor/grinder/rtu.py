@@ -0,0 +1,303 @@
+"""
+Modbus RTU 프레임 (주소 + PDU + CRC16) 과 pyserial 위의 가벼운 RTU 클라이언트
+
+    frame = compile_write(100, 0x0004, [1])   # 브레이크 ON 요청/정상 응답을 미리 만들어 둔다
+    response = send_frame(client, frame)       # 보낼 때는 인코딩 없이 바이트만 쓰고 비교
+
+    client = RtuClient("/dev/ttyUSB2", baudrate=9600)   # ModbusSerialClient 대신 (같은 메서드)
+    client.read_holding_registers(address=0x0015, count=2, slave=100).registers
+
+RtuClient 는 요청 객체/범용 프레이머 없이
+- 미리 잡아 둔 버퍼에 요청을 채우고 CRC 는 표(table)로 계산
+- 응답은 기대 길이만큼만 읽고 (예외 응답 5바이트를 먼저 읽어 구분)
+- 프레임 간 3.5 문자 침묵과 응답 타임아웃을 보율/프레임 길이로 계산한다
+  (9600bps 에서 2 레지스터 읽기 타임아웃 ~41ms, 고정 0.1s 대비 실패한 폴링마다 ~59ms 절약)
+"""
+import struct
+import time
+
+from .transport import CRC, EXCEPTION, OTHER, TIMEOUT
+
+FC_READ_HOLDING = 3
+FC_WRITE_SINGLE = 6
+FC_WRITE_MULTIPLE = 16
+
+
+def _crc_table():
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
+        table.append(crc)
+    return tuple(table)
+
+
+CRC_TABLE = _crc_table()
+
+
+def crc16(data):
+    # 바이트당 비트 8번 대신 표 한 번 조회
+    crc = 0xFFFF
+    table = CRC_TABLE
+    for byte in data:
+        crc = (crc >> 8) ^ table[(crc ^ byte) & 0xFF]
+    return crc
+
+
+def with_crc(frame):
+    return frame + struct.pack("<H", crc16(frame))
+
+
+def read_request(slave, address, count=1):
+    return with_crc(struct.pack(">BBHH", slave, FC_READ_HOLDING, address, count))
+
+
+def write_request(slave, address, value):
+    return with_crc(struct.pack(">BBHH", slave, FC_WRITE_SINGLE, address, value))
+
+
+def write_many_request(slave, address, values):
+    count = len(values)
+    return with_crc(struct.pack(">BBHHB%dH" % count, slave, FC_WRITE_MULTIPLE, address, count, count * 2, *values))
+
+
+class CompiledFrame:
+    """
+    미리 만든 쓰기 요청과 기대하는 정상 응답
+    FC6 응답은 요청과 같고, FC16 응답은 주소/개수만 돌려주므로 둘 다 미리 알 수 있다.
+    """
+    def __init__(self, slave, address, values, name=""):
+        self.slave = slave
+        self.address = address
+        self.values = list(values)
+        self.name = name
+        if len(self.values) == 1:
+            self.function = FC_WRITE_SINGLE
+            self.request = write_request(slave, address, self.values[0])
+            self.response = self.request
+        else:
+            self.function = FC_WRITE_MULTIPLE
+            self.request = write_many_request(slave, address, self.values)
+            self.response = with_crc(struct.pack(">BBHH", slave, FC_WRITE_MULTIPLE, address, len(self.values)))
+
+    def __repr__(self):
+        return f"CompiledFrame({self.name or hex(self.address)}: {self.request.hex(' ')})"
+
+
+def compile_write(slave, address, values, name=""):
+    return CompiledFrame(slave, address, values, name)
+
+
+class FrameResponse:
+    """send_frame 결과 (pymodbus 응답처럼 isError() 제공, 실패면 kind 로 분류)"""
+    def __init__(self, raw, expected):
+        self.raw = raw
+        self.expected = expected
+        self.registers = []
+
+    def isError(self):
+        return self.raw != self.expected
+
+    @property
+    def kind(self):
+        if not self.isError():
+            return None
+        if not self.raw:
+            return TIMEOUT
+        if len(self.raw) == 5 and self.raw[1] & 0x80 and crc16(self.raw[:3]) == struct.unpack("<H", self.raw[3:])[0]:
+            return EXCEPTION
+        return CRC  # 짧거나 다른 응답 (CRC/길이 오류)
+
+    def __str__(self):
+        return f"FrameResponse({self.kind}: {self.raw.hex(' ')})"
+
+
+def send_frame(client, frame):
+    """
+    pymodbus 시리얼 클라이언트의 포트로 미리 만든 요청을 그대로 보내고 응답 바이트를 비교한다
+    (호출하는 쪽에서 버스 락을 잡고 있어야 함)
+    """
+    port = getattr(client, "socket", None)
+    if port is None:
+        raise ConnectionError("serial port is not open")
+    port.reset_input_buffer()  # 이전 트랜잭션의 늦은 응답 버림
+    port.write(frame.request)
+    raw = port.read(5)  # 예외 응답 길이만큼 먼저 읽는다
+    if len(raw) == 5 and not raw[1] & 0x80 and len(frame.response) > 5:
+        raw += port.read(len(frame.response) - 5)
+    return FrameResponse(raw, frame.response)
+
+
+def char_time(baudrate, bytesize=8, parity="N", stopbits=1):
+    """한 문자(시작 비트 + 데이터 + 패리티 + 정지 비트) 전송 시간 (초)"""
+    return (1 + bytesize + (0 if parity == "N" else 1) + stopbits) / baudrate
+
+
+def silent_interval(baudrate, bytesize=8, parity="N", stopbits=1):
+    """프레임 사이 침묵 3.5 문자 (19200bps 초과는 규격대로 1.75ms 고정)"""
+    if baudrate > 19200:
+        return 0.00175
+    return 3.5 * char_time(baudrate, bytesize, parity, stopbits)
+
+
+class RtuResponse:
+    """pymodbus 응답과 같은 모양 (registers, isError()), 실패면 kind 로 분류"""
+    def __init__(self, registers=None, kind=None, raw=b"", exception_code=None):
+        self.registers = registers if registers is not None else []
+        self.kind = kind
+        self.raw = raw
+        self.exception_code = exception_code
+
+    def isError(self):
+        return self.kind is not None
+
+    def __str__(self):
+        if self.kind is None:
+            return f"RtuResponse({self.registers})"
+        return f"RtuResponse({self.kind}: {bytes(self.raw).hex(' ')})"
+
+
+class RtuClient:
+    """
+    pyserial 위의 최소 Modbus RTU 마스터 (FC3 / FC6 / FC16)
+    :param timeout: 응답 타임아웃 (초), None 이면 보율과 프레임 길이로 계산
+    :param turnaround: 드라이버가 요청을 받고 응답을 시작하기까지 허용하는 시간 (초)
+    """
+    MAX_REGISTERS = 123
+
+    def __init__(self, port, baudrate=115200, bytesize=8, parity="N", stopbits=1, timeout=None, turnaround=0.02):
+        self.port = port
+        self.baudrate = baudrate
+        self.bytesize = bytesize
+        self.parity = parity
+        self.stopbits = stopbits
+        self.timeout = timeout
+        self.turnaround = turnaround
+        self.char_time = char_time(baudrate, bytesize, parity, stopbits)
+        self.silent_interval = silent_interval(baudrate, bytesize, parity, stopbits)
+        self.socket = None
+        self._request = bytearray(9 + 2 * self.MAX_REGISTERS)  # 가장 긴 FC16 요청
+        self._view = memoryview(self._request)
+        self._structs = {}       # 레지스터 개수 -> struct.Struct
+        self._last_end = 0.0     # 마지막 프레임이 끝난 시각 (침묵 계산)
+        self._dirty = False      # 실패 뒤 입력 버퍼에 찌꺼기가 있을 수 있음
+
+    @property
+    def connected(self):
+        return self.socket is not None and self.socket.is_open
+
+    def connect(self):
+        if self.connected:
+            return True
+        import serial  # pyserial (pymodbus 의존성) 은 연결할 때만 불러온다
+
+        try:
+            self.socket = serial.Serial(self.port, self.baudrate, bytesize=self.bytesize, parity=self.parity,
+                                        stopbits=self.stopbits, timeout=self.response_timeout(8, 8))
+        except (OSError, serial.SerialException):
+            self.socket = None
+            return False
+        self._dirty = True
+        return True
+
+    def close(self):
+        if self.socket is not None:
+            self.socket.close()
+        self.socket = None
+
+    def response_timeout(self, request_length, response_length):
+        """요청 송신 + 드라이버 처리 + 응답 수신 시간 (timeout 을 주면 그 값)"""
+        if self.timeout is not None:
+            return self.timeout
+        return (request_length + response_length + 3.5) * self.char_time + self.turnaround
+
+    def _registers(self, count):
+        unpack = self._structs.get(count)
+        if unpack is None:
+            unpack = self._structs[count] = struct.Struct(">%dH" % count)
+        return unpack
+
+    def _seal(self, length):
+        """버퍼 앞 length 바이트 뒤에 CRC 를 붙이고 요청 전체를 돌려준다"""
+        crc = crc16(self._view[:length])
+        self._request[length] = crc & 0xFF
+        self._request[length + 1] = crc >> 8
+        return self._view[:length + 2]
+
+    def _transact(self, request, function, response_length):
+        """요청을 보내고 기대 길이만큼 응답을 읽는다 (정상이면 응답 bytes, 실패면 RtuResponse)"""
+        port = self.socket
+        if port is None:
+            raise ConnectionError("serial port is not open")
+        timeout = self.response_timeout(len(request), response_length)
+        if port.timeout != timeout:
+            port.timeout = timeout
+        if self._dirty:
+            port.reset_input_buffer()
+            self._dirty = False
+        wait = self._last_end + self.silent_interval - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        port.write(request)
+
+        raw = port.read(5)  # 예외 응답 길이
+        if len(raw) == 5 and raw[1] == function and response_length > 5:
+            raw += port.read(response_length - 5)
+        self._last_end = time.monotonic()
+
+        if len(raw) == 5 and raw[1] == function | 0x80:
+            if crc16(raw) != 0:
+                return self._fail(CRC, raw)
+            return RtuResponse(kind=EXCEPTION, raw=raw, exception_code=raw[2])
+        if len(raw) < response_length:
+            return self._fail(TIMEOUT if not raw else CRC, raw)
+        if crc16(raw) != 0 or raw[0] != request[0] or raw[1] != function:
+            return self._fail(CRC, raw)  # CRC 까지 포함해 계산하면 정상 프레임은 0
+        return raw
+
+    def _fail(self, kind, raw):
+        self._dirty = True
+        return RtuResponse(kind=kind, raw=raw)
+
+    def read_holding_registers(self, address, count=1, slave=0, **kwargs):
+        if not 1 <= count <= 125:
+            return RtuResponse(kind=OTHER)
+        struct.pack_into(">BBHH", self._request, 0, slave, FC_READ_HOLDING, address, count)
+        raw = self._transact(self._seal(6), FC_READ_HOLDING, 5 + 2 * count)
+        if isinstance(raw, RtuResponse):
+            return raw
+        if raw[2] != 2 * count:
+            return self._fail(CRC, raw)
+        return RtuResponse(list(self._registers(count).unpack_from(raw, 3)), raw=raw)
+
+    def write_register(self, address, value, slave=0, **kwargs):
+        struct.pack_into(">BBHH", self._request, 0, slave, FC_WRITE_SINGLE, address, value)
+        raw = self._transact(self._seal(6), FC_WRITE_SINGLE, 8)
+        if isinstance(raw, RtuResponse):
+            return raw
+        if raw != self._request[:8]:  # 정상 응답은 요청 그대로
+            return self._fail(CRC, raw)
+        return RtuResponse(raw=raw)
+
+    def write_registers(self, address, values, slave=0, **kwargs):
+        count = len(values)
+        if not 1 <= count <= self.MAX_REGISTERS:
+            return RtuResponse(kind=OTHER)
+        struct.pack_into(">BBHHB", self._request, 0, slave, FC_WRITE_MULTIPLE, address, count, 2 * count)
+        self._registers(count).pack_into(self._request, 7, *values)
+        raw = self._transact(self._seal(7 + 2 * count), FC_WRITE_MULTIPLE, 8)
+        if isinstance(raw, RtuResponse):
+            return raw
+        if raw[2:6] != self._request[2:6]:  # 시작 주소 / 개수
+            return self._fail(CRC, raw)
+        return RtuResponse(raw=raw)
+
+    def send_frame(self, frame):
+        """미리 만든 요청 (CompiledFrame) 그대로 전송"""
+        raw = self._transact(frame.request, frame.function, len(frame.response))
+        if isinstance(raw, RtuResponse):
+            return raw
+        if raw != frame.response:
+            return self._fail(CRC, raw)
+        return RtuResponse(raw=raw)
@@ -0,0 +1,237 @@
+"""
+monotonic 마감 시각(deadline) 기반 주기 실행
+
+- Ticker: 제어 루프용. 작업 시간이 매번 달라도 주기가 밀리지 않게 `deadline += period` 로 잰다.
+- AdaptivePoller: 레지스터 묶음(PollGroup)별로 주기를 따로 두고,
+  RPM 이 변하는 중이거나 방향 전환 직후에는 빠르게, 정상 상태에서는 느리게 읽는다.
+  TelemetryPoller 와 같은 subscribe()/latest() 를 제공하므로 제어/플롯 쪽은 그대로 쓴다.
+"""
+import math
+import threading
+import time
+
+from .telemetry import REG_RPM, read_snapshot
+from .telemetry_poller import SampleRing
+
+
+class PeriodStats:
+    """실제 주기와 지터(표준편차), 마감 지연 통계 (Welford 누적)"""
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = 0.0
+        self.max_late = 0.0
+        self.overruns = 0  # 마감을 한 주기 이상 놓쳐 건너뛴 횟수
+
+    def add(self, period, late=0.0):
+        self.count += 1
+        delta = period - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (period - self.mean)
+        self.min = min(self.min, period)
+        self.max = max(self.max, period)
+        self.max_late = max(self.max_late, late)
+
+    @property
+    def jitter(self):
+        return math.sqrt(self._m2 / self.count) if self.count > 1 else 0.0
+
+    def as_dict(self):
+        return {
+            "count": self.count,
+            "period": self.mean,
+            "jitter": self.jitter,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            "max_late": self.max_late,
+            "overruns": self.overruns,
+        }
+
+
+class Ticker:
+    """
+    while run_event.is_set():
+        ...작업...
+        ticker.wait()
+
+    time.sleep(period) 와 달리 작업 시간만큼 덜 잔다. 한 주기 이상 밀리면 따라잡지 않고 건너뛴다.
+    """
+    def __init__(self, period):
+        self.period = period
+        self.stats = PeriodStats()
+        self.deadline = None
+        self.last = None
+
+    def wait(self):
+        now = time.monotonic()
+        if self.deadline is None:
+            self.deadline = now
+        self.deadline += self.period
+        delay = self.deadline - now
+        if delay > 0:
+            time.sleep(delay)
+        elif -delay > self.period:
+            self.stats.overruns += 1
+            self.deadline = now
+        woke = time.monotonic()
+        if self.last is not None:
+            self.stats.add(woke - self.last, max(0.0, woke - self.deadline))
+        self.last = woke
+        return woke
+
+
+class PollGroup:
+    """
+    함께 읽는 레지스터 묶음과 그 주기
+    :param fast_hz: RPM 변화 중 / 방향 전환 직후 주기
+    :param slow_hz: 정상 상태 주기
+    :param rpm_delta: 직전 샘플 대비 이만큼 변하면 빠른 주기로
+    :param hold: 마지막 변화 이후 이 시간(초) 동안 빠른 주기 유지 (바로 느려지지 않게)
+    :param rpm_register: 변화를 볼 RPM 레지스터 (드라이버 프로파일 주소, None 이면 항상 느린 주기)
+    """
+    def __init__(self, name, registers, fast_hz=50, slow_hz=5, rpm_delta=20, hold=1.0, capacity=4096,
+                 recorder=None, rpm_register=REG_RPM):
+        self.name = name
+        self.registers = tuple(registers)
+        self.rpm_register = rpm_register
+        self.fast_period = 1.0 / fast_hz
+        self.slow_period = 1.0 / slow_hz
+        self.rpm_delta = rpm_delta
+        self.hold = hold
+        self.recorder = recorder  # recorder.Recorder (채널 순서 = registers 정렬 순서)
+        self.ring = SampleRing(capacity)
+        self.stats = {"fast": PeriodStats(), "slow": PeriodStats()}  # 빠른/느린 주기를 따로 집계
+        self.failures = 0
+        self.fast_until = 0.0
+        self.deadline = 0.0
+        self.scheduled = "slow"  # 현재 deadline 을 잡을 때 쓴 주기
+        self.switched = False  # 느린 -> 빠른 전환 직후 한 번은 통계에서 뺀다
+        self.last_run = None
+        self.last_rpm = None
+
+    @property
+    def fast(self):
+        return time.monotonic() < self.fast_until
+
+    @property
+    def period(self):
+        return self.fast_period if self.fast else self.slow_period
+
+    def boost(self, now):
+        """빠른 주기로 전환 (이미 잡힌 느린 마감은 앞당긴다)"""
+        self.fast_until = now + self.hold
+        if self.last_run is not None and self.scheduled == "slow":
+            self.deadline = max(now, min(self.deadline, self.last_run + self.fast_period))
+            self.scheduled = "fast"
+            self.switched = True
+
+    def observe(self, snapshot, now):
+        rpm = snapshot.registers.get(self.rpm_register)
+        if rpm is None:
+            return
+        if self.last_rpm is not None and abs(rpm - self.last_rpm) >= self.rpm_delta:
+            self.boost(now)
+        self.last_rpm = rpm
+
+
+class AdaptivePoller:
+    """
+    PollGroup 여러 개를 한 스레드에서 마감 순서대로 읽는다 (버스는 한 번에 하나)
+
+        poller = AdaptivePoller(motor, [
+            PollGroup("rpm", (REG_RPM, REG_CURRENT), fast_hz=50, slow_hz=5),
+            PollGroup("state", (REG_DIRECTION,), fast_hz=10, slow_hz=1),
+        ]).start()
+        telemetry = poller.subscribe("rpm")
+
+    motor.state(마지막으로 쓴 상태 레지스터)가 바뀌면 방향 전환 등으로 보고 모든 묶음을 빠르게 돌린다.
+    """
+    def __init__(self, motor, groups, max_gap=0):
+        self.motor = motor
+        self.groups = list(groups)
+        self.by_name = {group.name: group for group in self.groups}
+        self.max_gap = max_gap
+        # 마감 사이에 쉬는 최대 시간 (이 간격으로 명령 변경을 확인)
+        self.max_sleep = min(group.fast_period for group in self.groups)
+        self.commanded = dict(getattr(motor, "state", {}))
+        self.running = threading.Event()
+        self.thread = None
+
+    def subscribe(self, name=None, from_start=False):
+        group = self.by_name[name] if name else self.groups[0]
+        return group.ring.subscribe(from_start)
+
+    def latest(self, name=None):
+        group = self.by_name[name] if name else self.groups[0]
+        return group.ring.latest()
+
+    def boost(self):
+        now = time.monotonic()
+        for group in self.groups:
+            group.boost(now)
+
+    def _check_commands(self):
+        state = getattr(self.motor, "state", None)
+        if state is not None and state != self.commanded:
+            self.commanded = dict(state)
+            self.boost()
+
+    def poll_group(self, group):
+        now = time.monotonic()
+        snapshot = read_snapshot(self.motor.read_register, group.registers, max_gap=self.max_gap)
+        if snapshot.complete:
+            group.ring.append(snapshot)
+            group.observe(snapshot, now)
+            if group.recorder is not None:
+                group.recorder.append(snapshot.timestamp, [snapshot.registers[reg] for reg in sorted(group.registers)])
+        else:
+            group.failures += 1
+        stats = group.stats[group.scheduled]
+        if group.last_run is not None and not group.switched:
+            stats.add(now - group.last_run, max(0.0, now - group.deadline))
+        group.switched = False
+        group.last_run = now
+        group.scheduled = "fast" if group.fast else "slow"
+        group.deadline += group.period
+        if group.deadline < time.monotonic() - group.period:
+            stats.overruns += 1  # 버스가 주기보다 느림 -> 밀린 주기는 건너뛴다
+            group.deadline = time.monotonic()
+        return snapshot
+
+    def start(self):
+        now = time.monotonic()
+        for group in self.groups:
+            group.deadline = now
+        self.running.set()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.running.clear()
+        if self.thread:
+            self.thread.join()
+            self.thread = None
+
+    def _run(self):
+        while self.running.is_set():
+            self._check_commands()
+            group = min(self.groups, key=lambda g: g.deadline)
+            delay = group.deadline - time.monotonic()
+            if delay > 0:
+                time.sleep(min(delay, self.max_sleep))
+                continue
+            self.poll_group(group)
+
+    def stats(self):
+        return {
+            group.name: {
+                "fast": group.stats["fast"].as_dict(),
+                "slow": group.stats["slow"].as_dict(),
+                "mode": "fast" if group.fast else "slow",
+                "failures": group.failures,
+            }
+            for group in self.groups
+        }
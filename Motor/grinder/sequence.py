@@ -0,0 +1,230 @@
+"""
+확인(readback) 기반 시동/정지 시퀀스
+
+고정 sleep 대신 단계마다 쓰고 -> 드라이버가 값을 보일 때까지 읽고 -> 바로 다음 단계로 넘어간다.
+
+    result = run_sequence(motor, start_steps(speed=70, direction=1, confirm_rpm=30))
+    if not result.ok:
+        print(result.failed)
+
+    result = await run_sequence_async(async_motor, stop_steps(confirm_rpm=10))
+
+- 쓰기가 실패하거나 읽은 값이 다르면 단계 시간 안에서 다시 쓴다
+- 확인 읽기는 캐시를 거치지 않는다 (read_register(..., fresh=True))
+- 단계가 시간 안에 확인되지 않으면 거기서 멈추고, abort 단계(예: 정지)가 있으면 실행한다
+"""
+import asyncio
+import time
+
+from .drivers import get_driver
+
+
+class Step:
+    """
+    :param name: 단계 이름 (로그/결과용)
+    :param address: 쓸 레지스터 (None 이면 쓰지 않고 기다리기만 함)
+    :param value: 쓸 값
+    :param watch: 확인할 때 읽을 레지스터 (기본은 address)
+    :param expect: 읽은 값 -> bool (기본은 value 와 같은지)
+    :param timeout: 확인까지 기다릴 최대 시간 (초)
+    """
+    def __init__(self, name, address=None, value=None, watch=None, expect=None, timeout=0.5):
+        if address is None and watch is None:
+            raise ValueError("step needs a register to write or to watch")
+        self.name = name
+        self.address = address
+        self.value = value
+        self.watch = address if watch is None else watch
+        self.expect = expect if expect is not None else (lambda read, value=value: read == value)
+        self.timeout = timeout
+
+    def __repr__(self):
+        return f"Step({self.name!r})"
+
+
+class StepResult:
+    def __init__(self, name, ok, elapsed, writes, reads, value, error=None):
+        self.name = name
+        self.ok = ok
+        self.elapsed = elapsed  # 시작 ~ 확인 (초)
+        self.writes = writes    # 보낸 쓰기 횟수 (재시도 포함)
+        self.reads = reads      # 확인 읽기 횟수
+        self.value = value      # 마지막으로 읽은 값
+        self.error = error
+
+    def as_dict(self):
+        return dict(self.__dict__)
+
+    def __repr__(self):
+        status = "ok" if self.ok else f"FAILED ({self.error})"
+        return f"{self.name}: {status} {self.elapsed * 1000:.0f}ms value={self.value}"
+
+
+class SequenceResult:
+    def __init__(self, steps, elapsed, aborted=None):
+        self.steps = steps
+        self.elapsed = elapsed
+        self.aborted = aborted  # 실패 후 실행한 abort 시퀀스 결과 (없으면 None)
+
+    @property
+    def ok(self):
+        return all(step.ok for step in self.steps)
+
+    @property
+    def failed(self):
+        return next((step for step in self.steps if not step.ok), None)
+
+    def as_dict(self):
+        return {
+            "ok": self.ok,
+            "elapsed": self.elapsed,
+            "steps": [step.as_dict() for step in self.steps],
+            "aborted": self.aborted.as_dict() if self.aborted else None,
+        }
+
+    def __repr__(self):
+        return f"SequenceResult(ok={self.ok}, {self.elapsed * 1000:.0f}ms, {self.steps})"
+
+
+def _field_step(driver, name, value, timeout):
+    # 드라이버 프로파일에 없는 필드는 건너뛴다 (예: hoder 에는 enable 이 없음)
+    reg = driver.registers.get(name)
+    if reg is None or value is None:
+        return None
+    return Step(name, reg.address, reg.encode(value), timeout=timeout)
+
+
+def _rpm_step(driver, name, expect, timeout):
+    reg = driver.registers.get("rpm")
+    if reg is None:
+        return None
+    return Step(name, watch=reg.address, expect=lambda raw: expect(reg.decode(raw)), timeout=timeout)
+
+
+def start_steps(speed, direction=None, confirm_rpm=None, timeout=0.5, spin_timeout=3.0, driver=None):
+    """
+    test.py startMotor 순서: 속도 -> 방향 -> 브레이크 해제 -> 활성화 (-> 회전 확인)
+    주소/인코딩은 driver 프로파일 (기본 grinder) 에서 가져오고, 프로파일에 없는 단계는 뺀다
+    :param confirm_rpm: 지정하면 RPM 이 이 값 이상이 될 때까지 기다린다 (rpm 레지스터가 있을 때)
+    """
+    driver = get_driver(driver)
+    steps = [
+        _field_step(driver, "speed", speed, timeout),
+        _field_step(driver, "direction", direction, timeout),
+        _field_step(driver, "brake", 0, timeout),
+        _field_step(driver, "enable", 1, timeout),
+    ]
+    if confirm_rpm is not None:
+        steps.append(_rpm_step(driver, "spinning", lambda rpm: rpm >= confirm_rpm, spin_timeout))
+    return [step for step in steps if step is not None]
+
+
+def stop_steps(confirm_rpm=None, timeout=0.5, stop_timeout=3.0, driver=None):
+    """
+    속도 0 -> 비활성화 -> 브레이크 (-> 정지 확인)
+    :param confirm_rpm: 지정하면 RPM 이 이 값 이하가 될 때까지 기다린다 (rpm 레지스터가 있을 때)
+    """
+    driver = get_driver(driver)
+    steps = [
+        _field_step(driver, "speed", 0, timeout),
+        _field_step(driver, "enable", 0, timeout),
+        _field_step(driver, "brake", 1, timeout),
+    ]
+    if confirm_rpm is not None:
+        steps.append(_rpm_step(driver, "stopped", lambda rpm: rpm <= confirm_rpm, stop_timeout))
+    return [step for step in steps if step is not None]
+
+
+def _first(values):
+    return values[0] if values else None
+
+
+class _StepRun:
+    """한 단계의 진행 상태 (동기/비동기 실행이 같이 쓴다)"""
+    def __init__(self, step, now):
+        self.step = step
+        self.started = now
+        self.written = step.address is None
+        self.writes = 0
+        self.reads = 0
+        self.value = None
+        self.error = None
+
+    def expired(self, now):
+        return now - self.started >= self.step.timeout
+
+    def wrote(self, ok):
+        self.writes += 1
+        self.written = ok
+        if not ok:
+            self.error = "write failed"
+
+    def read(self, value):
+        self.reads += 1
+        self.value = value
+        if value is None:
+            self.error = "read failed"
+            return False
+        try:
+            confirmed = bool(self.step.expect(value))
+        except Exception as e:
+            self.error = f"expect: {e}"
+            return False
+        self.error = None if confirmed else "not confirmed"
+        if not confirmed and self.step.address == self.step.watch:
+            self.written = False  # 드라이버가 다른 값을 보이면 (리셋 등) 다시 쓴다
+        return confirmed
+
+    def result(self, ok, now):
+        error = None if ok else f"timeout after {self.step.timeout}s ({self.error or 'not confirmed'})"
+        return StepResult(self.step.name, ok, now - self.started, self.writes, self.reads, self.value, error)
+
+
+def run_sequence(motor, steps, poll_interval=0.01, abort=None):
+    """
+    steps 를 순서대로 실행 (motor 는 MotorController)
+    :param poll_interval: 확인 읽기 사이 간격 (초)
+    :param abort: 단계가 실패하면 실행할 시퀀스 (예: stop_steps())
+    :return: SequenceResult
+    """
+    started = time.monotonic()
+    results = []
+    for step in steps:
+        run = _StepRun(step, time.monotonic())
+        while True:
+            if not run.written:
+                run.wrote(motor.write_register(step.address, step.value))
+            if run.written and run.read(_first(motor.read_register(step.watch, fresh=True))):
+                results.append(run.result(True, time.monotonic()))
+                break
+            if run.expired(time.monotonic()):
+                results.append(run.result(False, time.monotonic()))
+                break
+            time.sleep(poll_interval)
+        if not results[-1].ok:
+            aborted = run_sequence(motor, abort, poll_interval) if abort else None
+            return SequenceResult(results, time.monotonic() - started, aborted)
+    return SequenceResult(results, time.monotonic() - started)
+
+
+async def run_sequence_async(motor, steps, poll_interval=0.01, abort=None):
+    """run_sequence 의 asyncio 버전 (motor 는 AsyncMotorController), 기다리는 동안 다른 태스크 진행"""
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    results = []
+    for step in steps:
+        run = _StepRun(step, loop.time())
+        while True:
+            if not run.written:
+                run.wrote(await motor.write_register(step.address, step.value))
+            if run.written and run.read(_first(await motor.read_register(step.watch, fresh=True))):
+                results.append(run.result(True, loop.time()))
+                break
+            if run.expired(loop.time()):
+                results.append(run.result(False, loop.time()))
+                break
+            await asyncio.sleep(poll_interval)
+        if not results[-1].ok:
+            aborted = await run_sequence_async(motor, abort, poll_interval) if abort else None
+            return SequenceResult(results, loop.time() - started, aborted)
+    return SequenceResult(results, loop.time() - started)
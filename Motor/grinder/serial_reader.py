@@ -0,0 +1,139 @@
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+from .binary_frames import CHANNELS, FrameDecoder, Frames
+
+
+class LineDecoder:
+    """
+    기존 ASCII 출력("a,b,c\\n", 펌웨어 TELEMETRY_BINARY 0) 용 디코더
+    FrameDecoder 와 같은 decode() 인터페이스, 시간은 PC 수신 시각
+    """
+    def __init__(self, channels=len(CHANNELS)):
+        self.channels = channels
+        self.buffer = b""
+        self.frames = 0
+        self.dropped = 0  # seq 가 없어서 알 수 없음
+        self.bad_frames = 0
+        self.start = time.monotonic()
+
+    def decode(self, data):
+        lines = (self.buffer + bytes(data)).split(b"\n")
+        self.buffer = lines.pop()  # 마지막 조각은 아직 줄이 끝나지 않음
+        rows = []
+        for line in lines:
+            parts = line.strip().split(b",")
+            if len(parts) != self.channels:
+                self.bad_frames += 1
+                continue
+            try:
+                rows.append([float(part) for part in parts])
+            except ValueError:
+                self.bad_frames += 1
+        now = time.monotonic() - self.start
+        seq = np.arange(self.frames, self.frames + len(rows)) & 0xFFFF
+        self.frames += len(rows)
+        values = np.array(rows, dtype=np.float64).reshape(-1, self.channels).T
+        return Frames(seq, np.full(len(rows), now), values)
+
+
+def concat_frames(batches):
+    if len(batches) == 1:
+        return batches[0]
+    return Frames(
+        np.concatenate([b.seq for b in batches]),
+        np.concatenate([b.t for b in batches]),
+        np.concatenate([b.channels for b in batches], axis=1),
+    )
+
+
+class SerialReader:
+    """
+    시리얼 포트를 백그라운드 스레드에서 계속 비우는 수집기
+    - OS 버퍼에 쌓인 바이트는 한 번에 읽어서 디코딩 (한 줄씩 읽지 않음)
+    - 디코딩된 묶음은 큐에 쌓고, 렌더러는 drain() 으로 쌓인 것을 한꺼번에 가져간다
+    - 렌더러가 너무 늦으면 가장 오래된 묶음부터 버리고 overflow_dropped 로 센다
+    """
+    def __init__(self, ser, decoder=None, max_batches=1000, poll_timeout=0.02, recorder=None):
+        self.ser = ser
+        self.recorder = recorder  # recorder.Recorder, 수집 스레드에서 모든 샘플을 기록
+        self.decoder = decoder or FrameDecoder()
+        self.batches = deque()
+        self.max_batches = max_batches
+        self.poll_timeout = poll_timeout
+        self.lock = threading.Lock()
+        self.pending_samples = 0
+        self.overflow_dropped = 0
+        self.bytes_read = 0
+        self.reads = 0
+        self.running = threading.Event()
+        self.thread = None
+
+    def start(self):
+        self.ser.timeout = self.poll_timeout  # read() 가 오래 막히지 않게
+        self.running.set()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.running.clear()
+        if self.thread:
+            self.thread.join()
+            self.thread = None
+
+    def _run(self):
+        while self.running.is_set():
+            try:
+                # 쌓인 만큼 한 번에, 없으면 1바이트를 poll_timeout 동안 기다림
+                data = self.ser.read(self.ser.in_waiting or 1)
+            except Exception:
+                self.running.clear()
+                break
+            if not data:
+                continue
+            self.reads += 1
+            self.bytes_read += len(data)
+            frames = self.decoder.decode(data)
+            if len(frames.seq):
+                if self.recorder is not None:
+                    self.recorder.extend(frames.t, frames.channels)
+                self._push(frames)
+
+    def _push(self, frames):
+        with self.lock:
+            if len(self.batches) >= self.max_batches:
+                oldest = self.batches.popleft()
+                self.pending_samples -= len(oldest.seq)
+                self.overflow_dropped += len(oldest.seq)
+            self.batches.append(frames)
+            self.pending_samples += len(frames.seq)
+
+    def drain(self):
+        """쌓여 있는 샘플을 모두 꺼낸다 (없으면 None)"""
+        with self.lock:
+            if not self.batches:
+                return None
+            batches = list(self.batches)
+            self.batches.clear()
+            self.pending_samples = 0
+        return concat_frames(batches)
+
+    def stats(self):
+        try:
+            backlog = self.ser.in_waiting
+        except Exception:
+            backlog = None
+        return {
+            "backlog_bytes": backlog,           # OS 수신 버퍼에 남은 바이트
+            "pending_samples": self.pending_samples,  # 렌더러가 아직 안 가져간 샘플
+            "frames": self.decoder.frames,
+            "dropped": self.decoder.dropped,     # seq 간격으로 본 손실
+            "bad_frames": self.decoder.bad_frames,
+            "overflow_dropped": self.overflow_dropped,
+            "bytes_read": self.bytes_read,
+            "reads": self.reads,
+        }
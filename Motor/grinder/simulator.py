@@ -0,0 +1,322 @@
+"""
+하드웨어 없이 돌려볼 수 있는 Modbus RTU 모터 드라이버 시뮬레이터 (POSIX pty 사용)
+
+    python -m grinder.simulator --baud 115200 --slave 100
+    -> 출력된 /dev/pts/N 을 MotorController(port=...) 에 넣으면 된다.
+"""
+import argparse
+import os
+import random
+import select
+import struct
+import threading
+import time
+import tty
+
+from .rtu import crc16, with_crc
+from .telemetry import REG_SPEED, REG_DIRECTION, REG_ENABLE, REG_BRAKE, REG_RPM, REG_CURRENT
+
+# hoder_test250527.py 드라이버 레지스터
+REG_COMM_MODE = 0x0023  # 0 쓰면 RS-485 통신 모드 기동
+REG_PWM = 0x0024        # 0~100 %
+REG_PWM_DIRECTION = 0x0025  # 1: CW, 2: CCW
+REG_PWM_BRAKE = 0x0026      # 1: 브레이크 ON
+
+EXC_ILLEGAL_FUNCTION = 0x01
+EXC_ILLEGAL_ADDRESS = 0x02
+EXC_ILLEGAL_VALUE = 0x03
+EXC_DEVICE_FAILURE = 0x04
+
+
+class MotorModel:
+    """
+    1차 관성 모델: 속도가 목표값으로 시정수 tau 만큼 따라간다.
+    내부 속도는 부호 있음 (방향 0 -> +, 1 -> -), RPM 레지스터는 크기만 보고한다.
+    """
+    def __init__(self, rpm_per_unit=10.0, max_rpm=3000.0, tau=0.3, brake_tau=0.05,
+                 amps_per_rpm_s=0.002, idle_current=50, max_speed=300, register_space=None):
+        self.rpm_per_unit = rpm_per_unit
+        self.max_rpm = max_rpm
+        self.tau = tau
+        self.brake_tau = brake_tau
+        self.amps_per_rpm_s = amps_per_rpm_s
+        self.idle_current = idle_current
+        self.max_speed = max_speed
+        self.register_space = register_space  # 지정하면 0 ~ register_space-1 의 빈 레지스터는 0 으로 읽힘
+        self.registers = {
+            REG_SPEED: 0, REG_DIRECTION: 0, REG_ENABLE: 0, REG_BRAKE: 1,
+            REG_RPM: 0, REG_CURRENT: 0,
+            REG_COMM_MODE: 1, REG_PWM: 0, REG_PWM_DIRECTION: 1, REG_PWM_BRAKE: 1,
+        }
+        self.velocity = 0.0  # 부호 있는 rpm
+        self.stalled = False  # 부하 걸림 (고장 주입)
+        self.last_update = time.monotonic()
+        self.lock = threading.Lock()
+
+    def target_velocity(self):
+        regs = self.registers
+        if self.stalled:
+            return 0.0
+        if regs[REG_COMM_MODE] == 0 and regs[REG_PWM] > 0:  # PWM 드라이버 맵
+            if regs[REG_PWM_BRAKE]:
+                return 0.0
+            sign = 1.0 if regs[REG_PWM_DIRECTION] == 1 else -1.0
+            return sign * self.max_rpm * regs[REG_PWM] / 100.0
+        if regs[REG_BRAKE] or not regs[REG_ENABLE]:
+            return 0.0
+        sign = 1.0 if regs[REG_DIRECTION] == 0 else -1.0
+        return sign * min(self.max_rpm, regs[REG_SPEED] * self.rpm_per_unit)
+
+    def braking(self):
+        regs = self.registers
+        return self.stalled or regs[REG_BRAKE] == 1 or \
+            (regs[REG_COMM_MODE] == 0 and regs[REG_PWM_BRAKE] == 1)
+
+    def step(self, dt):
+        if dt <= 0:
+            return
+        target = self.target_velocity()
+        tau = self.brake_tau if self.braking() else self.tau
+        previous = self.velocity
+        # 정확한 1차 응답 (dt 크기와 무관하게 안정)
+        alpha = 1.0 - pow(2.718281828459045, -dt / tau)
+        self.velocity += (target - self.velocity) * alpha
+        if abs(self.velocity) < 0.5 and target == 0:
+            self.velocity = 0.0
+        accel = abs(self.velocity - previous) / dt
+        self.registers[REG_RPM] = int(round(abs(self.velocity)))
+        current = 0
+        if self.velocity or target:
+            current = self.idle_current + accel * self.amps_per_rpm_s * 1000
+        self.registers[REG_CURRENT] = min(0xFFFF, int(current))
+
+    def update(self, now=None):
+        now = time.monotonic() if now is None else now
+        self.step(now - self.last_update)
+        self.last_update = now
+
+    def read(self, address, count):
+        with self.lock:
+            self.update()
+            values = []
+            for reg in range(address, address + count):
+                if reg in self.registers:
+                    values.append(self.registers[reg])
+                elif self.register_space and reg < self.register_space:
+                    values.append(0)
+                else:
+                    return None
+            return values
+
+    def write(self, address, value):
+        """유효하지 않으면 예외 코드 반환, 성공이면 None"""
+        if address not in self.registers or address in (REG_RPM, REG_CURRENT):
+            return EXC_ILLEGAL_ADDRESS
+        if address == REG_SPEED and not 0 <= value <= self.max_speed:
+            return EXC_ILLEGAL_VALUE
+        if address in (REG_DIRECTION, REG_ENABLE, REG_BRAKE) and value not in (0, 1):
+            return EXC_ILLEGAL_VALUE
+        if address == REG_PWM and not 0 <= value <= 100:
+            return EXC_ILLEGAL_VALUE
+        if address == REG_PWM_DIRECTION and value not in (1, 2):
+            return EXC_ILLEGAL_VALUE
+        with self.lock:
+            self.update()
+            self.registers[address] = value
+        return None
+
+
+class FaultInjector:
+    """
+    :param drop_rate: 응답하지 않을 확률 (마스터 쪽 타임아웃)
+    :param crc_error_rate: 응답 CRC 를 깨뜨릴 확률
+    :param exception_rate: 0x04(Device failure) 예외 응답 확률
+    """
+    def __init__(self, drop_rate=0.0, crc_error_rate=0.0, exception_rate=0.0, seed=None):
+        self.drop_rate = drop_rate
+        self.crc_error_rate = crc_error_rate
+        self.exception_rate = exception_rate
+        self.random = random.Random(seed)
+
+    def hit(self, rate):
+        return rate > 0 and self.random.random() < rate
+
+
+class MotorSimulator:
+    """
+    pty 한 쌍의 master 쪽에서 Modbus RTU 슬레이브로 동작한다.
+    :param latency: 요청 수신 후 응답까지 처리 지연 (초)
+    :param jitter: latency 에 더해지는 0~jitter 랜덤 지연
+    :param emulate_baud: True 면 보율에 맞춰 송신 시간만큼 지연
+    """
+    def __init__(self, slave_id=100, baudrate=115200, model=None, faults=None,
+                 latency=0.002, jitter=0.0, emulate_baud=True):
+        self.slave_id = slave_id
+        self.baudrate = baudrate
+        self.model = model or MotorModel()
+        self.faults = faults or FaultInjector()
+        self.latency = latency
+        self.jitter = jitter
+        self.emulate_baud = emulate_baud
+        self.master_fd = None
+        self.slave_fd = None
+        self.port = None
+        self.running = False
+        self.thread = None
+        self.stats = {"requests": 0, "responses": 0, "dropped": 0, "crc_errors": 0,
+                      "exceptions": 0, "bad_frames": 0}
+
+    def char_time(self):
+        return 10.0 / self.baudrate  # 8N1: start + 8 data + stop
+
+    def start(self):
+        self.master_fd, self.slave_fd = os.openpty()
+        tty.setraw(self.master_fd)
+        tty.setraw(self.slave_fd)
+        self.port = os.ttyname(self.slave_fd)
+        self.running = True
+        self.thread = threading.Thread(target=self._serve, daemon=True)
+        self.thread.start()
+        return self.port
+
+    def stop(self):
+        self.running = False
+        if self.thread:
+            self.thread.join()
+        for fd in (self.master_fd, self.slave_fd):
+            if fd is not None:
+                os.close(fd)
+        self.master_fd = self.slave_fd = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
+
+    # ---- 프레임 처리 ----
+    @staticmethod
+    def expected_length(buffer):
+        """요청 프레임 길이 (아직 판단할 수 없으면 None)"""
+        if len(buffer) < 2:
+            return None
+        function = buffer[1]
+        if function in (0x03, 0x04, 0x06):
+            return 8
+        if function == 0x10:
+            if len(buffer) < 7:
+                return None
+            return 9 + buffer[6]
+        return 4  # 모르는 함수 코드: 주소+코드+CRC 로 보고 예외 응답
+
+    def _serve(self):
+        buffer = bytearray()
+        while self.running:
+            ready, _, _ = select.select([self.master_fd], [], [], 0.05)
+            if not ready:
+                if buffer:  # 프레임 사이 침묵 -> 남은 조각 버림
+                    self.stats["bad_frames"] += 1
+                    buffer.clear()
+                continue
+            try:
+                buffer += os.read(self.master_fd, 256)
+            except OSError:
+                break
+            while True:
+                length = self.expected_length(buffer)
+                if length is None or len(buffer) < length:
+                    break
+                frame = bytes(buffer[:length])
+                if crc16(frame[:-2]) != struct.unpack("<H", frame[-2:])[0]:
+                    del buffer[0]  # 동기 다시 맞추기
+                    self.stats["bad_frames"] += 1
+                    continue
+                del buffer[:length]
+                self._respond(frame)
+
+    def _respond(self, frame):
+        if frame[0] != self.slave_id:
+            return  # 다른 슬레이브 주소는 무시 (멀티 드롭)
+        self.stats["requests"] += 1
+        response = self.handle(frame[:-2])
+        if self.faults.hit(self.faults.drop_rate):
+            self.stats["dropped"] += 1
+            return
+        delay = self.latency + (random.random() * self.jitter if self.jitter else 0.0)
+        if self.emulate_baud:
+            delay += (len(frame) + len(response)) * self.char_time()
+        if delay > 0:
+            time.sleep(delay)
+        response = with_crc(response)
+        if self.faults.hit(self.faults.crc_error_rate):
+            self.stats["crc_errors"] += 1
+            response = response[:-1] + bytes([response[-1] ^ 0xFF])
+        os.write(self.master_fd, response)
+        self.stats["responses"] += 1
+
+    def handle(self, pdu):
+        """주소+PDU (CRC 제외) 를 받아 응답 (CRC 제외) 반환"""
+        slave, function = pdu[0], pdu[1]
+        if self.faults.hit(self.faults.exception_rate):
+            return self._exception(slave, function, EXC_DEVICE_FAILURE)
+        if function in (0x03, 0x04):
+            address, count = struct.unpack(">HH", pdu[2:6])
+            if not 1 <= count <= 125:
+                return self._exception(slave, function, EXC_ILLEGAL_VALUE)
+            values = self.model.read(address, count)
+            if values is None:
+                return self._exception(slave, function, EXC_ILLEGAL_ADDRESS)
+            return bytes([slave, function, count * 2]) + struct.pack(">%dH" % count, *values)
+        if function == 0x06:
+            address, value = struct.unpack(">HH", pdu[2:6])
+            error = self.model.write(address, value)
+            if error:
+                return self._exception(slave, function, error)
+            return bytes(pdu[:6])
+        if function == 0x10:
+            address, count = struct.unpack(">HH", pdu[2:6])
+            values = struct.unpack(">%dH" % count, pdu[7:7 + count * 2])
+            for offset, value in enumerate(values):
+                error = self.model.write(address + offset, value)
+                if error:
+                    return self._exception(slave, function, error)
+            return bytes(pdu[:6])
+        return self._exception(slave, function, EXC_ILLEGAL_FUNCTION)
+
+    def _exception(self, slave, function, code):
+        self.stats["exceptions"] += 1
+        return bytes([slave, function | 0x80, code])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Modbus RTU 모터 드라이버 시뮬레이터")
+    parser.add_argument("--baud", type=int, default=115200)
+    parser.add_argument("--slave", type=int, default=100)
+    parser.add_argument("--tau", type=float, default=0.3, help="관성 시정수 (초)")
+    parser.add_argument("--latency", type=float, default=0.002)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--drop", type=float, default=0.0, help="무응답 확률")
+    parser.add_argument("--crc-error", type=float, default=0.0, help="CRC 오류 확률")
+    parser.add_argument("--exception", type=float, default=0.0, help="예외 응답 확률")
+    args = parser.parse_args()
+
+    simulator = MotorSimulator(
+        slave_id=args.slave,
+        baudrate=args.baud,
+        model=MotorModel(tau=args.tau),
+        faults=FaultInjector(args.drop, args.crc_error, args.exception),
+        latency=args.latency,
+        jitter=args.jitter,
+    )
+    port = simulator.start()
+    print(f"시뮬레이터 포트: {port} (slave={args.slave}, baud={args.baud})")
+    try:
+        while True:
+            time.sleep(1)
+            print(simulator.model.registers[REG_RPM], simulator.stats)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        simulator.stop()
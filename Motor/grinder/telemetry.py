@@ -0,0 +1,118 @@
+import time
+from dataclasses import dataclass, field
+
+# 드라이버 레지스터 맵 (packet.h 와 동일)
+REG_SPEED = 0x0001
+REG_DIRECTION = 0x0002
+REG_ENABLE = 0x0003
+REG_BRAKE = 0x0004
+REG_RPM = 0x0015
+REG_CURRENT = 0x0016
+
+REGISTER_NAMES = {
+    REG_SPEED: "speed",
+    REG_DIRECTION: "direction",
+    REG_ENABLE: "enable",
+    REG_BRAKE: "brake",
+    REG_RPM: "rpm",
+    REG_CURRENT: "current",
+}
+
+# 한 프레임에서 같이 읽을 기본 레지스터 (RPM, 전류, 방향)
+DEFAULT_TELEMETRY = (REG_DIRECTION, REG_RPM, REG_CURRENT)
+
+MAX_READ_COUNT = 125  # FC3 한 번에 읽을 수 있는 최대 레지스터 수
+
+
+@dataclass
+class TelemetrySnapshot:
+    """한 번의 폴링으로 얻은 레지스터 값 묶음"""
+    timestamp: float  # 벽시계 (time.time, 기록/로그용)
+    registers: dict = field(default_factory=dict)
+    transactions: int = 0
+    monotonic: float = 0.0  # time.monotonic - 타이머/경과 시간은 이 값으로 (NTP/수동 시각 변경에 안 흔들림)
+
+    def get(self, address, default=None):
+        return self.registers.get(address, default)
+
+    @property
+    def complete(self):
+        return all(value is not None for value in self.registers.values())
+
+    @property
+    def speed(self):
+        return self.registers.get(REG_SPEED)
+
+    @property
+    def direction(self):
+        return self.registers.get(REG_DIRECTION)
+
+    @property
+    def enable(self):
+        return self.registers.get(REG_ENABLE)
+
+    @property
+    def brake(self):
+        return self.registers.get(REG_BRAKE)
+
+    @property
+    def rpm(self):
+        return self.registers.get(REG_RPM)
+
+    @property
+    def current(self):
+        return self.registers.get(REG_CURRENT)
+
+    def as_dict(self):
+        values = {"timestamp": self.timestamp}
+        for address, value in self.registers.items():
+            values[REGISTER_NAMES.get(address, hex(address))] = value
+        return values
+
+
+def plan_block_reads(addresses, max_gap=0, max_count=MAX_READ_COUNT):
+    """
+    레지스터 주소들을 최소한의 연속 읽기 블록으로 묶는다.
+    :param addresses: 읽을 레지스터 주소들
+    :param max_gap: 같은 블록으로 합칠 수 있는 빈 레지스터 개수
+    :param max_count: 블록 하나의 최대 레지스터 수
+    :return: [(시작 주소, 개수), ...]
+    """
+    blocks = []
+    for address in sorted(set(addresses)):
+        if blocks:
+            start, count = blocks[-1]
+            end = start + count  # 다음 블록 시작 가능 주소
+            if address - end <= max_gap and address - start < max_count:
+                blocks[-1] = (start, address - start + 1)
+                continue
+        blocks.append((address, 1))
+    return blocks
+
+
+def read_snapshot(read_register, addresses=DEFAULT_TELEMETRY, max_gap=0, max_count=MAX_READ_COUNT):
+    """
+    블록 단위로 레지스터를 읽어 TelemetrySnapshot 으로 반환
+    :param read_register: read_register(address, count) 형태의 함수
+    :return: TelemetrySnapshot (실패한 레지스터 값은 None)
+    """
+    snapshot = TelemetrySnapshot(timestamp=time.time(), monotonic=time.monotonic())
+    wanted = set(addresses)
+    for start, count in plan_block_reads(wanted, max_gap=max_gap, max_count=max_count):
+        fill_block(snapshot, wanted, start, count, read_register(start, count))
+    return snapshot
+
+
+def fill_block(snapshot, wanted, start, count, values):
+    """블록 읽기 결과를 스냅샷에 채운다 (values 가 None 이면 해당 레지스터는 None)"""
+    snapshot.transactions += 1
+    if isinstance(values, int):  # count=1 일 때 값 하나만 돌려주는 구현 대응
+        values = [values]
+    for offset in range(count):
+        address = start + offset
+        if address not in wanted:
+            continue
+        if values and offset < len(values):
+            snapshot.registers[address] = values[offset]
+        else:
+            snapshot.registers[address] = None
@@ -0,0 +1,128 @@
+import threading
+import time
+
+from .telemetry import DEFAULT_TELEMETRY, REGISTER_NAMES, read_snapshot
+
+
+class SampleRing:
+    """
+    고정 크기 링 버퍼 (쓰는 쪽 1개, 읽는 쪽 여러 개)
+    쓰기는 락 없이 슬롯에 넣고 seq 만 증가시킨다. 읽는 쪽은 자기 커서(seq)를 들고
+    있다가 그 뒤로 들어온 샘플만 가져가며, 너무 늦어서 덮어쓰인 샘플은 dropped 로 센다.
+    """
+    def __init__(self, capacity=4096):
+        self.capacity = capacity
+        self.buffer = [None] * capacity
+        self.seq = 0  # 지금까지 쓴 샘플 수 (= 다음에 쓸 번호)
+
+    def append(self, sample):
+        self.buffer[self.seq % self.capacity] = sample
+        self.seq += 1
+
+    def latest(self):
+        seq = self.seq
+        if seq == 0:
+            return None
+        return self.buffer[(seq - 1) % self.capacity]
+
+    def read_since(self, cursor):
+        """
+        :return: (samples, next_cursor, dropped)
+        """
+        end = self.seq
+        start = max(cursor, end - self.capacity)
+        samples = [self.buffer[i % self.capacity] for i in range(start, end)]
+        # 복사하는 동안 쓰는 쪽이 한 바퀴 돌아 덮어쓴 앞부분은 버린다
+        # append 는 슬롯을 먼저 쓰고 seq 를 올리므로, seq 번 샘플이 들어갈 슬롯 (seq - capacity 번) 도
+        # 이미 덮어쓰였을 수 있다 -> seq - capacity + 1 번부터만 믿는다
+        overwritten = self.seq - self.capacity + 1 - start
+        if overwritten > 0:
+            samples = samples[overwritten:]
+            start += overwritten
+        return samples, end, start - cursor
+
+    def subscribe(self, from_start=False):
+        return Subscription(self, 0 if from_start else self.seq)
+
+    def __len__(self):
+        return min(self.seq, self.capacity)
+
+
+class Subscription:
+    """SampleRing 구독자 (각 구독자는 자기 커서만 갱신하므로 서로 막지 않는다)"""
+    def __init__(self, ring, cursor):
+        self.ring = ring
+        self.cursor = cursor
+        self.dropped = 0
+
+    def poll(self):
+        samples, self.cursor, dropped = self.ring.read_since(self.cursor)
+        self.dropped += dropped
+        return samples
+
+    def latest(self):
+        return self.ring.latest()
+
+
+class TelemetryPoller:
+    """
+    버스에서 텔레메트리를 읽는 유일한 곳.
+    정해진 주기로 스냅샷을 읽어 SampleRing 에 넣고, 제어/플롯/로거는 구독만 한다.
+    """
+    def __init__(self, motor, rate_hz=20, registers=DEFAULT_TELEMETRY, capacity=4096, max_gap=0,
+                 recorder=None):
+        self.motor = motor
+        self.recorder = recorder  # recorder.Recorder (채널 순서 = registers 정렬 순서)
+        self.period = 1.0 / rate_hz
+        self.registers = registers
+        self.max_gap = max_gap
+        self.ring = SampleRing(capacity)
+        self.failures = 0
+        self.overruns = 0  # 주기 안에 읽기를 못 끝낸 횟수
+        self.running = threading.Event()
+        self.thread = None
+
+    def subscribe(self, from_start=False):
+        return self.ring.subscribe(from_start)
+
+    def latest(self):
+        return self.ring.latest()
+
+    def poll_once(self):
+        snapshot = read_snapshot(self.motor.read_register, self.registers, max_gap=self.max_gap)
+        if snapshot.complete:
+            self.ring.append(snapshot)
+            if self.recorder is not None:
+                self.recorder.append(snapshot.timestamp, [snapshot.registers[reg] for reg in sorted(self.registers)])
+        else:
+            self.failures += 1
+        return snapshot
+
+    def start(self):
+        self.running.set()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.running.clear()
+        if self.thread:
+            self.thread.join()
+            self.thread = None
+
+    def _run(self):
+        deadline = time.monotonic()
+        while self.running.is_set():
+            self.poll_once()
+            deadline += self.period
+            delay = deadline - time.monotonic()
+            if delay < 0:  # 버스가 주기보다 느림 -> 밀린 주기는 건너뛴다
+                self.overruns += 1
+                deadline = time.monotonic()
+                continue
+            time.sleep(delay)
+
+
+def recorder_channels(registers=DEFAULT_TELEMETRY):
+    """TelemetryPoller(recorder=...) 에 맞는 Recorder 채널 이름"""
+    return tuple(REGISTER_NAMES.get(reg, hex(reg)) for reg in sorted(registers))
@@ -0,0 +1,103 @@
+import numpy as np
+
+
+class TimeSeriesBuffer:
+    """
+    고정 크기 다채널 시계열 버퍼 (NumPy 배열 기반)
+
+    크기 2*capacity 배열에 같은 샘플을 두 군데(i, i+capacity) 써 두기 때문에
+    최근 n 개 샘플은 항상 연속된 구간이 되고, view() 는 복사 없이 슬라이스만 돌려준다.
+    append 는 O(1), 메모리는 처음 할당한 크기에서 늘어나지 않는다.
+
+        buffer = TimeSeriesBuffer(200, ("hall_a", "hall_b", "hall_c"))
+        buffer.append(t, a, b, c)
+        t, (a, b, c) = buffer.view()
+        line.set_data(t, a)
+    """
+    def __init__(self, capacity, channels=("value",), dtype=np.float64):
+        self.capacity = int(capacity)
+        self.channels = tuple(channels)
+        self.index = {name: i for i, name in enumerate(self.channels)}
+        self.t = np.zeros(2 * self.capacity, dtype=np.float64)
+        self.data = np.zeros((len(self.channels), 2 * self.capacity), dtype=dtype)
+        self.head = 0   # 다음에 쓸 위치 (0 ~ capacity-1)
+        self.count = 0  # 저장된 샘플 수 (최대 capacity)
+        self.total = 0  # 지금까지 들어온 샘플 수
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        self.head = 0
+        self.count = 0
+
+    def append(self, t, *values):
+        if len(values) == 1 and len(self.channels) > 1:
+            values = values[0]  # append(t, [a, b, c]) 형태도 허용
+        head = self.head
+        mirror = head + self.capacity
+        self.t[head] = self.t[mirror] = t
+        self.data[:, head] = values
+        self.data[:, mirror] = values
+        self.head = (head + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+        self.total += 1
+
+    def extend(self, t, values):
+        """
+        여러 샘플을 한 번에 추가
+        :param t: shape (n,)
+        :param values: shape (channels, n)
+        """
+        t = np.asarray(t, dtype=np.float64)
+        values = np.asarray(values).reshape(len(self.channels), -1)
+        n = t.shape[0]
+        if n == 0:
+            return
+        self.total += n
+        if n > self.capacity:  # 어차피 덮어쓰일 앞부분은 버린다
+            skip = n - self.capacity
+            self.head = (self.head + skip) % self.capacity
+            t = t[skip:]
+            values = values[:, skip:]
+            n = self.capacity
+        positions = (self.head + np.arange(n)) % self.capacity
+        self.t[positions] = t
+        self.t[positions + self.capacity] = t
+        self.data[:, positions] = values
+        self.data[:, positions + self.capacity] = values
+        self.head = (self.head + n) % self.capacity
+        self.count = min(self.capacity, self.count + n)
+
+    def _span(self, n=None):
+        n = self.count if n is None else min(int(n), self.count)
+        end = self.head + self.capacity
+        return end - n, end
+
+    def view(self, n=None):
+        """
+        최근 n 개 (생략 시 전부) 샘플의 (t, data) 를 복사 없이 반환
+        data 는 shape (channels, n), 다음 append 때 내용이 바뀔 수 있다.
+        """
+        start, end = self._span(n)
+        return self.t[start:end], self.data[:, start:end]
+
+    def channel(self, name, n=None):
+        start, end = self._span(n)
+        return self.data[self.index[name], start:end]
+
+    def window(self, seconds, now=None):
+        """마지막 샘플(또는 now) 기준 seconds 초 이내 샘플 (t 는 단조 증가라고 가정)"""
+        t, data = self.view()
+        if not len(t):
+            return t, data
+        latest = t[-1] if now is None else now
+        first = np.searchsorted(t, latest - seconds, side="left")
+        return t[first:], data[:, first:]
+
+    def latest(self):
+        if not self.count:
+            return None
+        position = (self.head - 1) % self.capacity
+        return self.t[position], self.data[:, position]
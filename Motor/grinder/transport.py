@@ -0,0 +1,248 @@
+"""
+끊겨도 스스로 복구하는 Modbus 전송 계층
+
+    self.client = ResilientClient(ModbusSerialClient(...))
+
+- 실패를 TIMEOUT / CRC / EXCEPTION / PORT_GONE 으로 분류해서 센다
+- 포트가 사라지거나 타임아웃이 연속되면 닫고 다시 연결 (지수 백오프, 상한 있음)
+  재연결을 기다리는 동안 호출은 막히지 않고 바로 실패를 돌려준다
+- 다시 연결되면 마지막으로 쓴 값을 다시 써서 드라이버 상태를 복원한다
+- 장애 시작 ~ 복원 완료 시간(recovery time)을 기록한다
+"""
+import threading
+import time
+
+from pymodbus.exceptions import ConnectionException, ModbusIOException
+from pymodbus.pdu import ExceptionResponse
+
+TIMEOUT = "timeout"
+CRC = "crc"                # 응답은 왔는데 프레임을 해석하지 못함 (CRC/길이 오류)
+EXCEPTION = "exception"    # 드라이버가 예외 응답을 보냄 (잘못된 주소 등)
+PORT_GONE = "port_gone"    # USB-시리얼 분리, 포트 열기 실패
+OTHER = "other"
+ERROR_KINDS = (TIMEOUT, CRC, EXCEPTION, PORT_GONE, OTHER)
+SUPERSEDED = "superseded"  # 버스에 나가기 전에 정지 명령에 밀려 취소됨 (장애로 세지 않음)
+
+
+def classify_error(response=None, error=None):
+    """
+    pymodbus 응답/예외를 분류 (정상 응답이면 None)
+    pymodbus 는 대부분의 실패를 예외 대신 ModbusIOException 응답으로 돌려주므로 메시지로 구분한다
+    재시도 후 응답이 없을 때의 메시지("No Response received .../Unable to decode response")에는
+    decode 가 들어 있으므로 무응답을 먼저 본다 (pymodbus 는 이 경우 깨진 프레임과 구분하지 않음, 타임아웃으로 셈)
+    """
+    if error is not None:
+        if isinstance(error, (ConnectionException, OSError)) or type(error).__name__ == "SerialException":
+            return PORT_GONE
+        return OTHER
+    if response is None:
+        return TIMEOUT
+    if isinstance(response, ExceptionResponse):
+        return EXCEPTION
+    if not response.isError():
+        return None
+    if getattr(response, "kind", None) in ERROR_KINDS + (SUPERSEDED,):
+        return response.kind  # TransportError, rtu.FrameResponse
+    message = str(response)
+    if "Errno" in message or "Connection" in message or "could not open" in message:
+        return PORT_GONE
+    if isinstance(response, ModbusIOException):
+        lowered = message.lower()
+        if "no response" in lowered:
+            return TIMEOUT
+        if "decode" in lowered or "crc" in lowered or "incomplete" in lowered:
+            return CRC
+    return OTHER
+
+
+class TransportError:
+    """호출하지 못했거나 예외가 난 경우의 응답 (pymodbus 오류 응답처럼 isError() 가 True)"""
+    def __init__(self, kind, message=""):
+        self.kind = kind
+        self.message = message
+
+    def isError(self):
+        return True
+
+    def __str__(self):
+        return f"TransportError({self.kind}: {self.message})"
+
+
+class ResilientClient:
+    """
+    :param client: pymodbus 클라이언트 (connect/close 로 다시 열 수 있어야 함)
+    :param backoff: 첫 재연결 대기 (초), 실패할 때마다 두 배
+    :param max_backoff: 재연결 대기 상한 (초)
+    :param timeouts_before_reconnect: 타임아웃이 이만큼 연속되면 포트 문제로 보고 다시 연다
+    :param restore: 재연결 후 마지막으로 쓴 값을 다시 쓸지
+    """
+    def __init__(self, client, backoff=0.05, max_backoff=2.0, timeouts_before_reconnect=5, restore=True):
+        self.client = client
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.timeouts_before_reconnect = timeouts_before_reconnect
+        self.restore = restore
+        self.lock = threading.RLock()
+        self.connected = False
+        self.next_attempt = 0.0
+        self.delay = backoff
+        self.consecutive_timeouts = 0
+        self.failed_since = None  # 장애가 시작된 시각 (정상이면 None)
+        self.commanded = {}       # (slave, address) -> 마지막으로 쓴 값
+        self.on_reconnect = []    # 재연결 후 호출 (예: 캐시 비우기)
+        self.errors = {kind: 0 for kind in ERROR_KINDS}
+        self.requests = 0
+        self.reconnects = 0
+        self.reconnect_failures = 0
+        self.recovery_times = []
+
+    def __getattr__(self, name):
+        return getattr(self.client, name)
+
+    def connect(self):
+        with self.lock:
+            try:
+                self.connected = bool(self.client.connect())
+            except Exception:
+                self.connected = False
+            return self.connected
+
+    def close(self):
+        with self.lock:
+            self.connected = False
+            self.client.close()
+
+    def _mark_failed(self, kind):
+        if self.failed_since is None:
+            self.failed_since = time.monotonic()
+        if kind == TIMEOUT:
+            self.consecutive_timeouts += 1
+            if self.consecutive_timeouts < self.timeouts_before_reconnect:
+                return
+        elif kind != PORT_GONE:
+            return
+        # 포트를 닫고 백오프 후 다시 연다
+        self.connected = False
+        self.consecutive_timeouts = 0
+        try:
+            self.client.close()
+        except Exception:
+            pass
+
+    def _mark_ok(self):
+        self.consecutive_timeouts = 0
+        if self.failed_since is not None:
+            self.recovery_times.append(time.monotonic() - self.failed_since)
+            self.failed_since = None
+
+    def _ensure_connected(self):
+        if self.connected:
+            return True
+        now = time.monotonic()
+        if now < self.next_attempt:
+            return False
+        try:
+            self.client.close()
+            ok = bool(self.client.connect())
+        except Exception:
+            ok = False
+        if not ok:
+            self.reconnect_failures += 1
+            self.next_attempt = now + self.delay
+            self.delay = min(self.delay * 2, self.max_backoff)
+            return False
+        self.connected = True
+        self.reconnects += 1
+        self.delay = self.backoff
+        self.next_attempt = 0.0
+        if self.restore:
+            self._restore()
+        for callback in self.on_reconnect:
+            callback()
+        return True
+
+    def _restore(self):
+        """재연결 직후 마지막으로 쓴 값을 연속 구간별로 다시 쓴다"""
+        for slave, address, values in _runs(self.commanded):
+            if len(values) == 1:
+                response = self._call(self.client.write_register, address=address, value=values[0], slave=slave)
+            else:
+                response = self._call(self.client.write_registers, address=address, values=values, slave=slave)
+            if response.isError():
+                return False
+        return True
+
+    def _call(self, method, **kwargs):
+        self.requests += 1
+        try:
+            response = method(**kwargs)
+            kind = classify_error(response)
+        except Exception as e:
+            response = TransportError(classify_error(error=e), str(e))
+            kind = response.kind
+        if kind == SUPERSEDED:
+            return response  # 버스에 나가지 않았으므로 링크 상태와 무관
+        if kind is not None:
+            self.errors[kind] += 1
+        if kind is None or kind == EXCEPTION:
+            self._mark_ok()  # 예외 응답도 링크는 살아 있다는 뜻
+        else:
+            self._mark_failed(kind)
+            if response is None:
+                response = TransportError(kind, "no response")
+        return response
+
+    def _request(self, method_name, **kwargs):
+        with self.lock:
+            if not self._ensure_connected():
+                return TransportError(PORT_GONE, "reconnecting")
+            return self._call(getattr(self.client, method_name), **kwargs)
+
+    def read_holding_registers(self, address, count=1, slave=0, **kwargs):
+        return self._request("read_holding_registers", address=address, count=count, slave=slave, **kwargs)
+
+    def write_register(self, address, value, slave=0, **kwargs):
+        response = self._request("write_register", address=address, value=value, slave=slave, **kwargs)
+        if not response.isError():
+            self.commanded[(slave, address)] = value
+        return response
+
+    def write_registers(self, address, values, slave=0, **kwargs):
+        response = self._request("write_registers", address=address, values=values, slave=slave, **kwargs)
+        if not response.isError():
+            for offset, value in enumerate(values):
+                self.commanded[(slave, address + offset)] = value
+        return response
+
+    def send_frame(self, frame):
+        # 미리 만든 쓰기 프레임 (rtu.CompiledFrame)
+        response = self._request("send_frame", frame=frame)
+        if not response.isError():
+            for offset, value in enumerate(frame.values):
+                self.commanded[(frame.slave, frame.address + offset)] = value
+        return response
+
+    def stats(self):
+        recovery = sorted(self.recovery_times)
+        return {
+            "connected": self.connected,
+            "requests": self.requests,
+            "errors": dict(self.errors),
+            "reconnects": self.reconnects,
+            "reconnect_failures": self.reconnect_failures,
+            "failing_for": time.monotonic() - self.failed_since if self.failed_since is not None else 0.0,
+            "last_recovery": self.recovery_times[-1] if recovery else None,
+            "max_recovery": recovery[-1] if recovery else None,
+        }
+
+
+def _runs(commanded):
+    """{(slave, address): value} -> 연속 주소 구간 [(slave, start, [values])]"""
+    runs = []
+    for slave, address in sorted(commanded):
+        value = commanded[(slave, address)]
+        if runs and runs[-1][0] == slave and runs[-1][1] + len(runs[-1][2]) == address:
+            runs[-1][2].append(value)
+        else:
+            runs.append((slave, address, [value]))
+    return runs
@@ -0,0 +1,205 @@
+"""
+키보드 입력 / 제어 루프 / 실시간 플롯 (Modbus_control, Keyboard_control 스크립트 공통)
+
+matplotlib 과 numpy 는 플롯을 띄울 때만 불러온다 -> 화면 없는 PC 에서도 run(plot=None) 으로 제어 가능
+"""
+import threading
+import time
+from queue import Queue
+
+from .reversal import StallReversal, feedback_registers, logical_direction, reverse_fields
+from .scheduler import AdaptivePoller, PollGroup, Ticker
+
+
+def user_input_handler(motor, run_event, input_queue):
+    # 숫자를 입력하면 속도 변경, 그 외 입력(또는 EOF)이면 종료
+    while run_event.is_set():
+        try:
+            user_input = input()
+            if user_input.isdigit():
+                user_speed = int(user_input)
+                if 0 <= user_speed <= motor.max_speed:
+                    input_queue.put(user_speed)
+            else:
+                run_event.clear()
+                break
+        except:
+            run_event.clear()
+            break
+
+
+def motor_control(motor, run_event, direction_lock, current_direction, input_queue, telemetry, period=0.02,
+                  suspect_time=0.05, verbose=False):
+    ticker = Ticker(period)  # 작업 시간과 무관하게 일정한 주기
+    reversal = StallReversal(direction=current_direction[0], suspect_time=suspect_time)
+    rpm_register, _ = feedback_registers(motor)  # motor.driver 의 RPM 주소 (없으면 전환하지 않음)
+    while run_event.is_set():
+        if not input_queue.empty():
+            new_speed = input_queue.get()
+            motor.set_speed(new_speed)
+            if verbose:
+                print(f"[제어] 속도를 {new_speed}로 설정했습니다.")
+
+        # 버스를 직접 읽지 않고 poller 가 넣어 둔 샘플마다 정지 판단
+        # (한 번 읽기 누락/순간 0 으로는 전환하지 않음)
+        for sample in telemetry.poll():
+            new_direction = reversal.update(sample.monotonic, sample.get(rpm_register))
+            if new_direction is None:
+                continue
+            if verbose:
+                print("[제어] RPM이 0입니다. 방향을 반전합니다.")
+            # 방향 전환 (+ 필요하면 활성화) 을 한 번에 전송
+            with direction_lock:
+                current_direction[0] = new_direction
+                ok = motor.apply_state(**reverse_fields(motor, new_direction))
+            if not ok:
+                reversal.command_failed(sample.monotonic)
+        ticker.wait()
+    if verbose:
+        print(f"[제어] 방향 전환 통계: {reversal.stats()}")
+
+
+def _pyplot(backend=None):
+    import matplotlib
+    if backend:
+        matplotlib.use(backend)
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def plot_telemetry(telemetry, run_event, channels=("rpm",), ylims=None, run_time=20, capacity=4096,
+                   interval_ms=50, title="Real-time Motor RPM", backend=None, value_of=None):
+    """
+    구독(telemetry)에서 받은 샘플을 블리팅 플롯으로 그린다 (창을 닫으면 run_event 해제)
+    :param value_of: value_of(sample, 채널 이름) -> 값 (기본은 sample 의 같은 이름 속성, GRINDER 주소)
+    """
+    if value_of is None:
+        value_of = getattr
+    plt = _pyplot(backend)
+    from .live_plot import LivePlot
+    from .timeseries import TimeSeriesBuffer
+
+    data = TimeSeriesBuffer(capacity, channels)  # 고정 크기, 오래 돌려도 메모리 일정
+    start_time = time.monotonic()
+
+    def feed():
+        if not run_event.is_set():
+            plt.close(plot.fig)
+            return
+        # 마지막 프레임 이후 들어온 샘플을 한꺼번에 반영 (버스 지연과 무관)
+        for sample in telemetry.poll():
+            data.append(sample.monotonic - start_time, *(value_of(sample, name) for name in channels))
+
+    plot = LivePlot(
+        data,
+        [(name,) for name in channels],
+        window=run_time,
+        interval_ms=interval_ms,
+        feed=feed,
+        ylims=ylims,
+        styles={"rpm": "b-", "direction": "r-", "current": "g-"},
+        title=title,
+        figsize=(10, 4 * len(channels)),
+    )
+    for ax, name in zip(plot.axes, channels):
+        ax.set_ylabel(name.capitalize() if name != "rpm" else "RPM")
+        if name == "direction":
+            ax.set_yticks([0, 1])  # y축에 0과 1 라벨
+    try:
+        plt.tight_layout()
+        plot.show()
+    except:
+        pass
+    run_event.clear()
+
+
+def plot_rpm(telemetry, run_event, run_time=20, backend=None, value_of=None):
+    plot_telemetry(telemetry, run_event, ("rpm",), [(-10, 3000)], run_time, backend=backend, value_of=value_of)
+
+
+def plot_rpm_and_direction(telemetry, run_event, run_time=20, backend=None, value_of=None):
+    plot_telemetry(telemetry, run_event, ("rpm", "direction"), [(-10, 3000), (-0.5, 1.5)], run_time,
+                   title="Real-time Motor RPM / Direction", backend=backend, value_of=value_of)
+
+
+PLOTS = {
+    "rpm": plot_rpm,
+    "rpm-direction": plot_rpm_and_direction,
+}
+
+
+def run(motor, speed=None, plot="rpm", run_time=20, fast_hz=50, slow_hz=5, metrics_port=None, duration=None,
+        backend=None, period=0.02, suspect_time=0.05, verbose=False):
+    """
+    연결된 motor 로 키보드 제어 + 자동 방향 전환 (+ 플롯) 을 돌린다
+
+    :param speed: 시작 속도 (None 이면 설정하지 않음), 브레이크도 해제한다
+    :param plot: "rpm" / "rpm-direction" / None (None 이면 화면 없이 실행)
+    :param duration: 지정하면 그 시간(초) 뒤 종료 (화면 없이 실행할 때)
+    :param metrics_port: 지정하면 http://127.0.0.1:<port>/metrics 제공
+    :param period: 제어 루프 주기 (초)
+    :param suspect_time: RPM 0 이 이 시간 이상 이어지면 방향 전환
+    :return: motor.stats() 와 폴링 통계
+    """
+    if speed is not None:
+        if not motor.apply_state(speed=speed, brake=0):
+            print("[오류] 속도 설정 / 브레이크 해제 실패")
+    server = None
+    if metrics_port:
+        try:
+            server = motor.start_metrics_server(metrics_port)
+        except OSError as e:
+            # 다른 인스턴스가 같은 포트를 쓰는 중 등 - 계측 없이 계속
+            print(f"[경고] 메트릭 서버 시작 실패 (port {metrics_port}): {e}")
+
+    run_event = threading.Event()   # set() 상태면 진행, clear() 상태면 종료
+    run_event.set()
+    direction_lock = threading.Lock()
+    # 레지스터 주소/방향 값은 motor.driver 기준 (hoder: 0x0024~, 방향 1/2, rpm/enable 없음)
+    driver = motor.driver
+    rpm_register, direction_register = feedback_registers(motor)
+    direction = logical_direction(motor, motor.state.get(direction_register))
+    current_direction = [0 if direction is None else direction]
+    input_queue = Queue()
+    if rpm_register is None:
+        print(f"[경고] {driver.name} 드라이버에는 RPM 레지스터가 없어 자동 방향 전환을 하지 않습니다")
+
+    def value_of(sample, name):
+        value = sample.get(driver.address(name))
+        return logical_direction(motor, value) if name == "direction" else value
+
+    # 버스 읽기는 poller 하나만 하고 제어/플롯은 구독
+    # RPM 이 변하는 중이거나 방향 전환 직후에는 fast_hz, 정상 상태에서는 slow_hz 로 읽는다
+    names = ("direction", "rpm", "current") if plot == "rpm-direction" else ("rpm", "current")
+    registers = tuple(driver.address(name) for name in names if driver.address(name) is not None)
+    poller = AdaptivePoller(motor, [PollGroup("rpm", registers, fast_hz=fast_hz, slow_hz=slow_hz,
+                                              rpm_register=rpm_register)]).start()
+
+    motor_thread = threading.Thread(
+        target=motor_control,
+        args=(motor, run_event, direction_lock, current_direction, input_queue, poller.subscribe()),
+        kwargs={"period": period, "suspect_time": suspect_time, "verbose": verbose},
+    )
+    input_thread = threading.Thread(target=user_input_handler, args=(motor, run_event, input_queue), daemon=True)
+    motor_thread.start()
+    input_thread.start()
+
+    try:
+        if plot:
+            PLOTS[plot](poller.subscribe(), run_event, run_time=run_time, backend=backend, value_of=value_of)
+        else:
+            deadline = time.monotonic() + duration if duration else None
+            while run_event.is_set() and (deadline is None or time.monotonic() < deadline):
+                time.sleep(0.1)
+    except KeyboardInterrupt:
+        pass
+    except Exception as e:
+        print(f"[오류] 플로팅 실행 중 오류 발생: {e}")
+
+    run_event.clear()  # 종료 신호 설정
+    motor_thread.join()
+    poller.stop()
+    if server is not None:
+        server.shutdown()
+        server.server_close()
+    return {"motor": motor.stats(), "polling": poller.stats()}
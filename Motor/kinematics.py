@@ -1,13 +1,18 @@
-import math 
-import numpy
+import math
 
-radian_a = math.acos(20/94)
-degree_a = math.degrees(radian_a)
+from grinder.kinematics import SliderCrank
+
+# 크랭크 20, 로드 94 (기구학 계산은 grinder/kinematics.py)
+link = SliderCrank(crank=20, rod=94)
+
+# 크랭크가 슬라이더 축과 수직인 자세 (모터 각도 90도)
+theta = math.pi / 2
+
+degree_a = 90 - math.degrees(link.rod_angle(theta))  # 크랭크와 로드 사이 각도
 print(degree_a)
 
-b = math.tan(radian_a) * 20
+b = link.position(theta)  # 크랭크 축 ~ 슬라이더 핀 거리
 print(b)
 
-radian_c = math.asin(20/94)
-degree_c = math.degrees(radian_c)
-print(degree_c)
\ No newline at end of file
+degree_c = math.degrees(link.rod_angle(theta))  # 로드 기울기
+print(degree_c)
@@ -15,7 +15,7 @@ sys.path.append(
 from Log.Logging_Class import NodeLogger
 import serial
 import time
-from pymodbus.client import ModbusSerialClient
+from grinder.controller import MotorController as ModbusMotorController
 
 class ParamterMotorController(object):
     def __init__(self):
@@ -27,7 +27,7 @@ class ParamterMotorController(object):
         }
   
 
-class MotorController(ParamterMotorController):
+class MotorController(ParamterMotorController, ModbusMotorController):
     """
     [VialStorage] VialStorage Class for controlling in another computer (windows)
 
@@ -43,11 +43,13 @@ class MotorController(ParamterMotorController):
     """
     def __init__(self, logger_obj, device_name="MotorController"):
         ParamterMotorController.__init__(self,)
+        ModbusMotorController.__init__(self, port=self.info["Port"], baudrate=self.info["BaudRate"])
         self.logger_obj=logger_obj
         self.device_name=device_name
-        self.arduinoData = serial.Serial(self.info["Port"], self.info["BaudRate"])
+        self.connect()
 
     def heartbeat(self):
+        self.arduinoData = serial.Serial(self.info["Port"], self.info["BaudRate"])
         self.arduinoData.write("5".encode())
         time.sleep(2)
         self.arduinoData.write("-5".encode())
@@ -58,66 +60,20 @@ class MotorController(ParamterMotorController):
         return_res_msg="[{}] : {}".format(self.device_name, debug_msg)
         return return_res_msg
 
-    def read_register(self, address, count=1):
-        try:
-            with self.lock:
-                response = self.client.read_holding_registers(address=address, count=count, slave=self.device_id)
-            if response and not response.isError():
-                return response.registers[0] if count == 1 else response.registers
-        except:
-            pass
-        return None
-
-    def write_register(self, address, value):
-        try:
-            with self.lock:
-                response = self.client.write_register(address=address, value=value, slave=self.device_id)
-            if response and not response.isError():
-                return True
-        except:
-            pass
-        return False
-
-    def set_speed(self, speed):
-        print("..")
-        if 0 <= speed <= 100:
-            return self.write_register(0x0001, speed)
-        return False
-
-    def set_cw_ccw(self, direction):
-        if direction in [0, 1]:
-            return self.write_register(0x0002, direction)
-        return False
-
-    def set_enable(self, enable):
-        if enable in [0, 1]:
-            return self.write_register(0x0003, enable)
-        return False
-
-    def set_brake(self, brake):
-        if brake in [0, 1]:
-            return self.write_register(0x0004, brake)
-        return False
-
-    def get_current_RPM(self):
-        return self.read_register(0x0015)
-    
     # Action
     def startMotor(self, speed=50, direction=1, motor_id=1, mode_type="virtual"):
         device_name = "Motor {} ({})".format(motor_id, mode_type)
         if mode_type == "real":
             self.logger_obj.debug(device_name=device_name, debug_msg="Starting motor...")
-            time.sleep(4)
-            self.set_speed(speed)
-            time.sleep(4)
-            self.set_cw_ccw(direction)
-            time.sleep(4)
-            self.set_brake(0)
-            time.sleep(4)
-            self.set_enable(1)
-            time.sleep(4)
+            # 단계마다 드라이버 값을 읽어 확인 (고정 대기 없음, 실패하면 정지 시퀀스)
+            result = self.start_motor(speed, direction)
+            for step in result.steps:
+                self.logger_obj.debug(device_name=device_name, debug_msg=repr(step))
             rpm = self.get_current_RPM()
-            debug_msg = f"Motor started with speed: {speed}, direction: {direction}, current RPM: {rpm}"
+            if not result.ok:
+                debug_msg = f"Motor start failed at {result.failed.name}: {result.failed.error}, current RPM: {rpm}"
+            else:
+                debug_msg = f"Motor started with speed: {speed}, direction: {direction}, current RPM: {rpm} ({result.elapsed:.2f}s)"
             self.logger_obj.debug(device_name=device_name, debug_msg=debug_msg)
             return "[{}] : {}".format(device_name, debug_msg)
         else:
@@ -129,10 +85,12 @@ class MotorController(ParamterMotorController):
         device_name = "Motor {} ({})".format(motor_id, mode_type)
         if mode_type == "real":
             self.logger_obj.debug(device_name=device_name, debug_msg="Stopping motor...")
-            self.set_enable(0)
-            self.set_brake(1)
+            result = self.stop_motor()
             rpm = self.get_current_RPM()
-            debug_msg = f"Motor stopped with current RPM: {rpm}"
+            if not result.ok:
+                debug_msg = f"Motor stop failed at {result.failed.name}: {result.failed.error}, current RPM: {rpm}"
+            else:
+                debug_msg = f"Motor stopped with current RPM: {rpm}"
             self.logger_obj.debug(device_name=device_name, debug_msg=debug_msg)
             return "[{}] : {}".format(device_name, debug_msg)
         else:
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# grinder 패키지는 Motor/ 아래에 있다 (설치하지 않고 실행)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,86 @@
+import asyncio
+import time
+
+from grinder.async_control import ControlState, control_step
+from grinder.telemetry import REG_DIRECTION, REG_RPM, TelemetrySnapshot
+
+
+class WallClockJumpMotor:
+    """rpm 0 을 돌려주는데 두 번째 샘플부터 벽시계가 한 시간 앞으로 뛴다"""
+    def __init__(self):
+        self.reads = 0
+        self.applied = []
+
+    async def read_snapshot(self, registers=None):
+        self.reads += 1
+        return TelemetrySnapshot(timestamp=time.time() + (3600 if self.reads > 1 else 0),
+                                 registers={REG_RPM: 0, REG_DIRECTION: 0}, monotonic=time.monotonic())
+
+    async def apply_state(self, **fields):
+        self.applied.append(fields)
+        return True
+
+
+def test_wall_clock_jump_does_not_trigger_reversal():
+    motor = WallClockJumpMotor()
+    state = ControlState(suspect_time=0.15)
+
+    async def steps():
+        for _ in range(3):
+            await control_step(motor, state)
+
+    asyncio.run(steps())
+    assert motor.applied == []
+    assert state.samples[-1][0] < 1.0  # 경과 시간도 monotonic 기준
+
+
+def test_periodic_keeps_running_after_exception(capsys):
+    from grinder.async_control import periodic
+
+    calls = []
+
+    async def flaky():
+        calls.append(len(calls))
+        if len(calls) == 2:
+            raise RuntimeError("bus glitch")
+
+    async def main():
+        task = asyncio.get_running_loop().create_task(periodic(0.005, flaky))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(main())
+    assert len(calls) > 3
+    assert "bus glitch" in capsys.readouterr().err
+
+
+def test_async_controller_uses_driver_profile_and_limit():
+    from grinder.async_control import AsyncMotorController, user_input_handler
+    from grinder.controller import MotorController
+
+    class Recording(AsyncMotorController):
+        async def write_register(self, address, value):
+            self.state[address] = value
+            return True
+
+        async def write_registers(self, address, values):
+            for offset, value in enumerate(values):
+                self.state[address + offset] = value
+            return True
+
+    async def steps():
+        grinder = Recording(port="/dev/null")  # pymodbus 비동기 클라이언트는 이벤트 루프 안에서 만든다
+        hoder = Recording(port="/dev/null", driver="hoder")
+        assert grinder.max_speed == MotorController.MAX_SPEED
+        assert not await grinder.set_speed(MotorController.MAX_SPEED + 1)
+        assert await hoder.apply_state(speed=60, direction=1)
+        queue = asyncio.Queue()
+        for line in ("150", "70", "q"):
+            queue.put_nowait(line)
+        await user_input_handler(grinder, asyncio.Event(), queue)
+        return grinder, hoder
+
+    grinder, hoder = asyncio.run(steps())
+    assert hoder.state == {0x0024: 60, 0x0025: 1}
+    assert grinder.state == {0x0001: 70}  # 150 은 max_speed(100) 를 넘어서 무시
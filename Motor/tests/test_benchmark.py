@@ -0,0 +1,40 @@
+from grinder.benchmark import format_row, run_case
+
+
+class Registers:
+    def __init__(self, registers):
+        self.registers = registers
+
+    def isError(self):
+        return False
+
+
+class FlakyClient:
+    """처음 drops 번은 응답이 없는 클라이언트"""
+    def __init__(self, drops):
+        self.drops = drops
+
+    def read_holding_registers(self, address, count=1, slave=0):
+        if self.drops:
+            self.drops -= 1
+            return None
+        return Registers([7] * count)
+
+    def write_registers(self, address, values, slave=0):
+        return Registers(values)
+
+
+def test_baseline_read_is_retried():
+    result = run_case(FlakyClient(drops=2), 100, 0x0001, 2, write_ratio=0.5, transactions=10)
+    assert "error" not in result and result["baseline_retries"] == 2
+    assert result["outcomes"]["ok"] == 10
+
+    failed = run_case(FlakyClient(drops=100), 100, 0x0001, 2, write_ratio=0.5, transactions=10)
+    assert "error" in failed
+
+
+def test_format_row_labels_auto_timeout_in_both_branches():
+    row = {"backend": "rtu", "baudrate": 115200, "timeout": None, "count": 2, "write_ratio": 0.5}
+    assert "timeout=auto" in format_row(dict(row, error="baseline read failed"))
+    ok = run_case(FlakyClient(drops=0), 100, 0x0001, 2, write_ratio=0.0, transactions=5)
+    assert "timeout=auto" in format_row(dict(row, **ok))
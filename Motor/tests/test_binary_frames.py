@@ -0,0 +1,50 @@
+import numpy as np
+
+from grinder.binary_frames import FRAME_SIZE, FrameDecoder, encode_frames
+
+
+def _frames(seq, timestamp_us=None):
+    seq = np.asarray(seq)
+    if timestamp_us is None:
+        timestamp_us = seq * 1000
+    channels = np.vstack([seq, seq + 1, seq + 2]) % 4096
+    return encode_frames(seq, timestamp_us, channels)
+
+
+def test_decodes_frames_split_across_reads():
+    data = _frames(np.arange(10))
+    decoder = FrameDecoder()
+    first = decoder.decode(data[:FRAME_SIZE * 3 + 7])  # 프레임 중간에서 잘린 읽기
+    second = decoder.decode(data[FRAME_SIZE * 3 + 7:])
+    assert list(first.seq) + list(second.seq) == list(range(10))
+    assert list(second.channels[1]) == [4, 5, 6, 7, 8, 9, 10]
+    assert decoder.frames == 10 and decoder.dropped == 0 and decoder.buffer == b""
+
+
+def test_resyncs_after_garbage_and_counts_bad_checksum():
+    data = bytearray(_frames(np.arange(6)))
+    data[2 * FRAME_SIZE + 6] ^= 0xFF  # 2 번 프레임 값 한 바이트 손상 -> checksum 불일치
+    decoder = FrameDecoder()
+    result = decoder.decode(b"\x00\x5a\xa5\x13" + bytes(data))  # 앞에 잡음
+    assert list(result.seq) == [0, 1, 3, 4, 5]
+    assert decoder.bad_frames == 1
+    assert decoder.skipped_bytes >= 4 + FRAME_SIZE
+    assert decoder.dropped == 1  # 버린 프레임은 seq 가 건너뛴 것으로 보인다
+
+
+def test_counts_seq_gaps_across_calls_and_wrap():
+    decoder = FrameDecoder()
+    decoder.decode(_frames([0xFFFD, 0xFFFE]))
+    result = decoder.decode(_frames([1, 2, 5]))  # 0xFFFF, 0, 3, 4 누락 (16비트 넘어감)
+    assert list(result.seq) == [1, 2, 5]
+    assert decoder.dropped == 4
+
+
+def test_micros_wrap_keeps_time_increasing():
+    near_end = (1 << 32) - 1500
+    decoder = FrameDecoder()
+    first = decoder.decode(_frames([0, 1], [near_end, near_end + 1000]))
+    second = decoder.decode(_frames([2, 3], [near_end + 2000, near_end + 3000]))  # micros() 가 0 으로 돌아감
+    t = np.concatenate([first.t, second.t])
+    assert decoder.wraps == 1
+    assert np.allclose(np.diff(t), 0.001)
@@ -0,0 +1,120 @@
+import threading
+import time
+
+from pymodbus.register_write_message import WriteSingleRegisterResponse
+
+from grinder.bus_arbiter import BusArbiter
+from grinder.controller import MotorController
+from grinder.simulator import MotorSimulator
+from grinder.telemetry import REG_DIRECTION, REG_SPEED
+from grinder.transport import SUPERSEDED, ResilientClient, classify_error
+
+
+def test_motor_controller_through_arbiter():
+    with MotorSimulator(slave_id=100) as sim:
+        arbiter = BusArbiter(port=sim.port)
+        assert arbiter.connect()
+        try:
+            motor = MotorController(client=arbiter.client_for(timeout=1.0), device_id=100)
+            assert motor.connect()
+            assert motor.apply_state(speed=50, direction=1, enable=1, brake=0)
+            assert motor.command("brake_on")  # 미리 만든 프레임도 arbiter 큐를 거친다
+            assert sim.model.registers[0x0004] == 1
+            assert motor.read_register(0x0001, count=4, fresh=True) == [50, 1, 1, 1]
+
+            stats = motor.stats()
+            assert stats["transport"]["requests"] >= 3
+            assert arbiter.completed >= 3
+        finally:
+            arbiter.close()
+
+
+class BlockingClient:
+    """첫 요청에서 release 될 때까지 버스를 붙잡는 가짜 클라이언트"""
+    def __init__(self):
+        self.release = threading.Event()
+        self.busy = threading.Event()
+        self.sent = []
+
+    def connect(self):
+        return True
+
+    def close(self):
+        pass
+
+    def _send(self, *request):
+        self.busy.set()
+        self.release.wait(2.0)
+        self.sent.append(request)
+        return WriteSingleRegisterResponse(request[1], request[2])
+
+    def read_holding_registers(self, address, count=1, slave=0):
+        return self._send("read", address, count)
+
+    def write_register(self, address, value, slave=0):
+        return self._send("write", address, value)
+
+
+def test_timed_out_request_is_never_sent():
+    bus = BlockingClient()
+    arbiter = BusArbiter(client=bus)
+    assert arbiter.connect()
+    try:
+        client = arbiter.client_for(timeout=0.05)
+        first = arbiter.write(100, REG_DIRECTION, 1)
+        assert bus.busy.wait(1.0)          # 첫 요청이 버스를 붙잡고 있는 동안
+        assert client.write_register(REG_DIRECTION, 0, slave=100) is None
+        assert arbiter.queue_depth()["total"] == 0  # 포기한 요청은 큐에서 빠진다
+        bus.release.set()
+        first.wait(1.0)
+        arbiter.write(100, REG_DIRECTION, 1).wait(1.0)
+        assert bus.sent == [("write", REG_DIRECTION, 1), ("write", REG_DIRECTION, 1)]
+    finally:
+        bus.release.set()
+        arbiter.close()
+
+
+def test_coalesced_read_survives_one_caller_giving_up():
+    bus = BlockingClient()
+    arbiter = BusArbiter(client=bus)
+    assert arbiter.connect()
+    try:
+        arbiter.write(100, REG_DIRECTION, 1)
+        assert bus.busy.wait(1.0)
+        read = arbiter.read(100, REG_SPEED, 4)
+        assert arbiter.read(100, REG_SPEED, 4) is read
+        assert not arbiter.cancel(read)    # 다른 호출자가 아직 기다린다
+        assert arbiter.cancel(read)
+        assert read.cancelled and arbiter.queue_depth()["total"] == 0
+    finally:
+        bus.release.set()
+        arbiter.close()
+
+
+def test_superseded_setpoint_is_not_a_bus_failure():
+    bus = BlockingClient()
+    arbiter = BusArbiter(client=bus)
+    assert arbiter.connect()
+    try:
+        client = ResilientClient(arbiter.client_for(timeout=1.0), timeouts_before_reconnect=1)
+        assert client.connect()
+        arbiter.write(100, REG_DIRECTION, 1)
+        assert bus.busy.wait(1.0)
+        result = {}
+        thread = threading.Thread(target=lambda: result.update(
+            response=client.write_register(REG_DIRECTION, 0, slave=100)))
+        thread.start()
+        while arbiter.queue_depth()["setpoint"] == 0:
+            time.sleep(0.001)
+        stop = arbiter.write(100, REG_SPEED, 0)  # 정지 명령이 쌓인 설정값을 밀어낸다
+        thread.join(1.0)
+        bus.release.set()
+        stop.wait(1.0)
+
+        assert classify_error(result["response"]) == SUPERSEDED
+        stats = client.stats()
+        assert sum(stats["errors"].values()) == 0
+        assert stats["connected"] and stats["failing_for"] == 0.0
+    finally:
+        bus.release.set()
+        arbiter.close()
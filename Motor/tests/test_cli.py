@@ -0,0 +1,13 @@
+from grinder.cli import build_parser
+
+
+def test_global_backend_survives_run_subcommand():
+    args = build_parser().parse_args(["--backend", "rtu", "--port", "/dev/ttyX", "run"])
+    assert args.backend == "rtu"
+    assert args.mpl_backend is None
+
+
+def test_run_matplotlib_backend_has_its_own_flag():
+    args = build_parser().parse_args(["run", "--mpl-backend", "Agg"])
+    assert args.backend == "pymodbus"
+    assert args.mpl_backend == "Agg"
@@ -0,0 +1,10 @@
+from grinder.drivers import get_driver
+
+
+def test_controller_limit_narrows_register_range():
+    hoder = get_driver("hoder")
+    assert hoder.encode_state({"speed": (0, 300)}, speed=150) is None  # PWM 범위는 0~100
+    assert hoder.encode_state({"speed": (0, 300)}, speed=100) == {0x0024: 100}
+    grinder = get_driver("grinder")
+    assert grinder.encode_state({"speed": (0, 100)}, speed=150) is None
+    assert grinder.encode_state({"speed": (0, 100)}, speed=80) == {0x0001: 80}
@@ -0,0 +1,37 @@
+import time
+
+from grinder.fleet import Fleet
+from grinder.simulator import MotorSimulator
+
+
+def test_fleet_drives_two_simulated_buses():
+    with MotorSimulator(slave_id=100) as grinder, MotorSimulator(slave_id=1, baudrate=9600) as hoder:
+        fleet = Fleet([
+            {"name": "grinder", "port": grinder.port, "rate_hz": 20},
+            {"name": "hoder", "port": hoder.port, "driver": "hoder", "backend": "rtu", "rate_hz": 20},
+        ], pin=False)
+        try:
+            fleet.start()
+            assert fleet.connected == {"grinder": True, "hoder": True}
+
+            acks = fleet.apply_state(speed=50)
+            assert all(ack.ok for ack in acks.values()), acks
+            assert grinder.model.registers[0x0001] == 50
+            assert hoder.model.registers[0x0024] == 50
+
+            deadline = time.monotonic() + 5
+            snapshot = fleet.snapshot()
+            while time.monotonic() < deadline and not all(
+                    entry.get("speed") == 50 for entry in snapshot.values()):
+                time.sleep(0.05)  # 워커가 명령 뒤 한 번 더 폴링할 때까지
+                snapshot = fleet.snapshot()
+            for entry in snapshot.values():
+                assert entry["connected"] and entry["polls"] > 0 and entry["commands"] == 1
+                assert entry["speed"] == 50
+            assert "rpm" in snapshot["grinder"] and "rpm" not in snapshot["hoder"]  # 프로파일별 필드
+
+            acks = fleet.send("set_speed", motors="hoder", speed=1000)  # max_speed 초과
+            assert list(acks) == ["hoder"] and acks["hoder"].ok is False
+        finally:
+            fleet.stop()
+        assert not fleet.processes
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from grinder.kinematics import RPM_TO_RAD, SliderCrank
+
+LINKS = [SliderCrank(), SliderCrank(crank=15, rod=60, offset=5, gear_ratio=3)]
+
+
+@pytest.mark.parametrize("link", LINKS, ids=repr)
+def test_inverse_round_trips_on_both_branches(link):
+    outer, inner = link.dead_centers()
+    theta = np.linspace(0, link.period, 721, endpoint=False)
+    theta = theta[(np.abs(theta - outer) > 1e-3) & (np.abs(theta - inner) > 1e-3)]  # 사점에서는 두 갈래가 만남
+    forward = (theta > outer) & (theta < inner)  # 바깥 사점 -> 안쪽 사점 = branch 1
+    x = link.position(theta)
+    angle = np.where(forward, link.inverse(x, branch=1), link.inverse(x, branch=-1))
+    assert np.all((0 <= angle) & (angle < link.period))
+    error = np.mod(angle - theta + link.period / 2, link.period) - link.period / 2  # 0 과 period 는 같은 각도
+    assert np.max(np.abs(error)) < 1e-7
+    inner_x, outer_x = link.stroke
+    assert np.isnan(link.inverse(outer_x + 1.0))
+    assert link.position(outer) == pytest.approx(outer_x)
+    assert link.position(inner) == pytest.approx(inner_x)
+
+
+@pytest.mark.parametrize("link", LINKS, ids=repr)
+def test_ratio_is_the_derivative_of_position(link):
+    theta = np.linspace(0, link.period, 361)
+    h = 1e-6
+    numeric = (link.position(theta + h) - link.position(theta - h)) / (2 * h)
+    assert np.allclose(link.ratio(theta), numeric, atol=1e-5)
+    assert np.allclose(link.ratio(np.array(link.dead_centers())), 0, atol=1e-9)
+
+    x, v = link.forward(theta, rpm=120)
+    assert np.allclose(x, link.position(theta))
+    assert np.allclose(v, link.ratio(theta) * 120 * RPM_TO_RAD)
+    mid = link.period / 4
+    assert link.inverse_speed(mid, link.forward(mid, rpm=90)[1]) == pytest.approx(90)
+
+
+def test_table_matches_exact_kinematics():
+    link = SliderCrank()
+    table = link.table(4096)
+    theta = np.random.default_rng(0).uniform(-link.period, 2 * link.period, 1000)  # 한 바퀴 밖도 감싼다
+    x, v = table.forward(theta, rpm=60)
+    exact_x, exact_v = link.forward(theta, rpm=60)
+    assert np.max(np.abs(x - exact_x)) < 1e-4
+    assert np.max(np.abs(v - exact_v)) < 1e-2
+    assert np.isscalar(table.position(1.0)) and np.isscalar(link.position(1.0))
@@ -0,0 +1,37 @@
+import socket
+
+from grinder.controller import MotorController
+from grinder.metrics import Histogram
+from grinder.simulator import MotorSimulator
+from grinder.ui import run
+
+
+def test_quantile_interpolates_within_bucket_and_stays_in_range():
+    histogram = Histogram()
+    for value in (0.006, 0.007, 0.0076):
+        histogram.observe(value)
+    assert 0.006 <= histogram.quantile(0.5) <= 0.0076
+    assert histogram.quantile(0.99) <= histogram.max
+    assert histogram.quantile(0.0) >= histogram.min
+
+    histogram = Histogram()
+    for value in [0.0015] * 50 + [0.004] * 50:
+        histogram.observe(value)
+    assert 0.0015 <= histogram.quantile(0.25) <= 0.002
+    assert 0.002 < histogram.quantile(0.75) <= 0.004
+
+
+def test_run_survives_metrics_port_in_use(capsys):
+    busy = socket.socket()
+    busy.bind(("127.0.0.1", 0))
+    busy.listen()
+    with MotorSimulator(slave_id=100) as sim:
+        motor = MotorController(port=sim.port)
+        assert motor.connect()
+        try:
+            stats = run(motor, plot=None, duration=0.2, metrics_port=busy.getsockname()[1])
+        finally:
+            motor.close()
+            busy.close()
+    assert "motor" in stats
+    assert "메트릭 서버 시작 실패" in capsys.readouterr().out
@@ -0,0 +1,24 @@
+import pytest
+
+from grinder.controller import MotorController
+from grinder.drivers import get_driver
+from grinder.motion import Profile, ProfileExecutor
+
+
+def test_executor_rejects_values_outside_driver_range():
+    hoder = MotorController(port="/dev/null", driver="hoder")
+    with pytest.raises(ValueError):
+        ProfileExecutor(hoder, Profile(hoder.driver.fields).set(speed=150).compile())
+    with pytest.raises(ValueError):
+        ProfileExecutor(hoder, Profile(hoder.driver.fields).set(direction=0).compile())
+    ProfileExecutor(hoder, Profile(hoder.driver.fields).set(speed=70, direction=2).compile())
+
+
+def test_executor_applies_controller_limits():
+    motor = MotorController(port="/dev/null", max_speed=100)
+    profile = Profile(motor.driver.fields, initial={"speed": 0}).ramp("speed", 150, duration=1.0)
+    with pytest.raises(ValueError):
+        ProfileExecutor(motor, profile.compile())
+    with pytest.raises(ValueError):
+        profile.compile(get_driver("grinder"), {"speed": (0, 100)})
+    assert profile.compile(get_driver("grinder"))  # 프로파일 범위 (0~300) 안
@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from grinder.recorder import Recorder, read_session, session_paths, session_runs
+from grinder.replay import ReplayController
+
+
+def _record(directory, name, t, chunk_rows=4):
+    recorder = Recorder(directory, name, ("rpm",), chunk_rows=chunk_rows, flush_interval=0)
+    recorder.extend(t, np.asarray(t).reshape(1, -1) * 10)
+    recorder.close()
+    return recorder
+
+
+def test_session_reads_only_one_run(tmp_path):
+    first = _record(tmp_path, "run", np.arange(6.0))
+    second = _record(tmp_path, "run", np.arange(3.0))      # 같은 이름으로 다시 기록 (t 가 다시 0 부터)
+    _record(tmp_path, "run_2", np.arange(100.0, 105.0))     # 이름이 run 으로 시작하는 다른 세션
+
+    assert first.run != second.run
+    assert session_runs(tmp_path, "run") == [first.run, second.run]
+    assert session_paths(tmp_path, "run") == second.paths   # 기본은 가장 최근 기록
+    assert session_paths(tmp_path, "run", first.run) == first.paths
+
+    t, values, channels = read_session(session_paths(tmp_path, "run", first.run))
+    assert channels == ("rpm",)
+    assert list(t) == [0, 1, 2, 3, 4, 5] and list(values[0]) == [0, 10, 20, 30, 40, 50]
+
+    motor = ReplayController.from_session(tmp_path, "run", speed=None, run=first.run)
+    assert len(motor.t) == 6
+
+
+def test_read_session_sorts_chunks_and_rejects_time_going_backwards(tmp_path):
+    recorder = _record(tmp_path, "a", np.arange(8.0))
+    t, _, _ = read_session(list(reversed(recorder.paths)))
+    assert list(t) == list(range(8))
+
+    other = _record(tmp_path, "b", np.arange(2.0, 6.0))
+    with pytest.raises(ValueError):
+        read_session(recorder.paths + other.paths)  # 다른 기록이 섞이면 시간이 겹친다
@@ -0,0 +1,48 @@
+import time
+
+from grinder.register_cache import CachedClient
+from grinder.rtu import compile_write
+
+
+class Response:
+    registers = []
+
+    def isError(self):
+        return False
+
+
+class RecordingClient:
+    def __init__(self):
+        self.sent = []
+
+    def write_register(self, address, value, slave=0):
+        self.sent.append((address, value))
+        return Response()
+
+    def write_registers(self, address, values, slave=0):
+        self.sent.append((address, list(values)))
+        return Response()
+
+    def send_frame(self, frame):
+        self.sent.append(("frame", frame.address))
+        return Response()
+
+
+def test_repeated_write_is_elided_only_while_cache_is_fresh():
+    bus = RecordingClient()
+    client = CachedClient(bus, verify_interval=0.05)
+    client.write_register(0x0001, 50, slave=100)
+    client.write_register(0x0001, 50, slave=100)
+    client.write_registers(0x0001, [50], slave=100)
+    client.send_frame(compile_write(100, 0x0001, [50]))
+    assert bus.sent == [(0x0001, 50)]
+
+    time.sleep(0.06)  # 드라이버가 리셋됐을 수 있다 -> 같은 값이라도 다시 보낸다
+    client.write_register(0x0001, 50, slave=100)
+    assert bus.sent == [(0x0001, 50), (0x0001, 50)]
+
+    time.sleep(0.06)
+    client.write_registers(0x0001, [50, 0], slave=100)
+    time.sleep(0.06)
+    client.send_frame(compile_write(100, 0x0001, [50]))
+    assert bus.sent[2:] == [(0x0001, [50, 0]), ("frame", 0x0001)]
@@ -0,0 +1,29 @@
+import numpy as np
+
+from grinder.controller import MotorController
+from grinder.replay import ReplayController
+
+
+def _replay(**kwargs):
+    t = np.arange(5) * 0.1
+    values = np.vstack([np.full(5, 1200), np.full(5, 40)])
+    return ReplayController(t, values, ("rpm", "current"), speed=None, **kwargs)
+
+
+def test_replay_shares_the_controller_speed_limit():
+    motor = _replay()
+    assert motor.max_speed == MotorController.MAX_SPEED
+    assert motor.set_speed(MotorController.MAX_SPEED)
+    assert not motor.set_speed(MotorController.MAX_SPEED + 1)
+    assert not motor.apply_state(speed=MotorController.MAX_SPEED + 1)
+    assert motor.get_current_RPM() == [1200]
+    assert [command["values"] for command in motor.commands] == [[MotorController.MAX_SPEED]]
+
+
+def test_replay_writes_driver_profile_registers():
+    motor = _replay(driver="hoder", max_speed=80)
+    assert motor.apply_state(speed=50, direction=2, brake=0)
+    assert not motor.set_speed(90)
+    assert motor.commands[0]["address"] == 0x0024
+    assert motor.read_register(0x0024, 3) == [50, 2, 0]  # 호스트가 쓴 값은 기록 대신 마지막으로 쓴 값
+    assert motor.get_current_RPM() is None  # hoder 에는 rpm 레지스터가 없다
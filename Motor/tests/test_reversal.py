@@ -0,0 +1,66 @@
+from grinder.controller import MotorCore
+from grinder.reversal import (REVERSING, RUNNING, SETTLING, STALL_SUSPECT, StallReversal, feedback_registers,
+                              logical_direction, reverse_fields)
+
+
+def test_reverse_fields_follow_the_driver_profile():
+    grinder = MotorCore()
+    assert reverse_fields(grinder, 1) == {"direction": 1, "enable": 1}
+    grinder.state[0x0003] = 1
+    assert reverse_fields(grinder, 0) == {"direction": 0}
+
+    hoder = MotorCore(driver="hoder")  # 방향 1 = CW, 2 = CCW, enable 레지스터 없음
+    assert reverse_fields(hoder, 0) == {"direction": 1}
+    assert reverse_fields(hoder, 1) == {"direction": 2}
+    assert hoder.state_writes(**reverse_fields(hoder, 1)) == [(0x0025, [2])]
+    assert logical_direction(hoder, 2) == 1 and logical_direction(hoder, 0) is None
+    assert feedback_registers(hoder) == (None, 0x0025)
+    assert feedback_registers(grinder) == (0x0015, 0x0002)
+
+
+def test_stall_reverses_after_suspect_time_and_settles():
+    reversal = StallReversal(direction=0, suspect_time=0.05)
+    assert reversal.update(0.00, 500) is None and reversal.state == RUNNING
+    assert reversal.update(0.01, 0) is None and reversal.state == STALL_SUSPECT
+    assert reversal.update(0.04, 0) is None  # 아직 suspect_time 전
+    assert reversal.update(0.07, 0) == 1 and reversal.state == REVERSING
+    assert reversal.update(0.08, 0, direction=1) is None and reversal.state == SETTLING
+    assert reversal.update(0.20, 200, direction=1) is None and reversal.state == RUNNING
+    assert reversal.stats()["reversals"] == 1
+    assert abs(reversal.latencies[0] - 0.19) < 1e-9
+
+
+def test_brief_zero_and_missed_reads_do_not_reverse():
+    reversal = StallReversal(suspect_time=0.05)
+    reversal.update(0.00, 0)
+    assert reversal.update(0.10, None) is None and reversal.state == STALL_SUSPECT  # 읽기 누락은 무시
+    assert reversal.update(0.11, 300) is None and reversal.state == RUNNING
+    assert reversal.suppressed == 1 and reversal.reversals == 0
+
+
+def test_direction_is_resent_until_the_register_follows():
+    reversal = StallReversal(direction=0, suspect_time=0, reverse_timeout=0.1)
+    assert reversal.update(0.0, 0, direction=0) == 1
+    assert reversal.update(0.05, 0, direction=0) is None
+    assert reversal.update(0.12, 0, direction=0) == 1  # reverse_timeout 안에 반영 안 됨 -> 재전송
+    assert reversal.retries == 1 and reversal.state == REVERSING
+
+
+def test_settle_timeout_goes_back_to_suspect():
+    reversal = StallReversal(suspect_time=0.05, settle_timeout=1.0)
+    reversal.update(0.0, 0)
+    reversal.update(0.1, 0)
+    reversal.update(0.2, 0)
+    assert reversal.state == SETTLING
+    assert reversal.update(1.3, 0) is None and reversal.state == STALL_SUSPECT
+    assert reversal.update(1.4, 0) == 0  # 새 방향으로도 못 돌면 다시 전환
+
+
+def test_failed_command_is_retried_on_the_next_sample():
+    reversal = StallReversal(direction=0, suspect_time=0.05)
+    reversal.update(0.0, 0)
+    assert reversal.update(0.1, 0) == 1
+    reversal.command_failed(0.1)
+    assert reversal.direction == 0 and reversal.reversals == 0 and reversal.state == STALL_SUSPECT
+    assert reversal.update(0.12, 0) == 1
+    assert reversal.reversals == 1
@@ -0,0 +1,123 @@
+import struct
+
+from grinder.rtu import (CompiledFrame, FrameResponse, RtuClient, compile_write, crc16, read_request,
+                         silent_interval, with_crc)
+from grinder.transport import CRC, EXCEPTION, TIMEOUT, classify_error
+
+
+class FakePort:
+    """RtuClient.socket 자리에 넣는 가짜 시리얼 포트 (보낸 요청을 기록하고 준비한 응답을 돌려줌)"""
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.buffer = b""
+        self.written = []
+        self.timeout = None
+        self.is_open = True
+        self.resets = 0
+
+    def reset_input_buffer(self):
+        self.resets += 1
+        self.buffer = b""
+
+    def write(self, data):
+        self.written.append(bytes(data))
+        self.buffer += self.responses.pop(0) if self.responses else b""
+
+    def read(self, size):
+        data, self.buffer = self.buffer[:size], self.buffer[size:]
+        return data
+
+
+def _client(*responses, **kwargs):
+    client = RtuClient("/dev/null", **kwargs)
+    client.socket = FakePort(*responses)
+    return client
+
+
+def test_crc16_known_vectors():
+    assert crc16(b"123456789") == 0x4B37  # CRC-16/MODBUS check 값
+    assert read_request(1, 0x0000, 1) == bytes.fromhex("01 03 00 00 00 01 84 0a")
+    assert with_crc(bytes.fromhex("11 03 00 6b 00 03"))[-2:] == bytes.fromhex("76 87")
+    frame = read_request(100, 0x0015, 2)
+    assert crc16(frame) == 0  # CRC 까지 넣어 계산하면 0
+
+
+def test_compiled_write_frames():
+    single = compile_write(100, 0x0004, [1], "brake_on")
+    assert single.function == 6
+    assert single.request == with_crc(bytes.fromhex("64 06 00 04 00 01"))
+    assert single.response == single.request  # FC6 정상 응답은 요청 그대로
+
+    many = CompiledFrame(100, 0x0001, [50, 1])
+    assert many.function == 16
+    assert many.request == with_crc(bytes.fromhex("64 10 00 01 00 02 04 00 32 00 01"))
+    assert many.response == with_crc(bytes.fromhex("64 10 00 01 00 02"))
+
+    assert not FrameResponse(many.response, many.response).isError()
+    assert FrameResponse(b"", many.response).kind == TIMEOUT
+    assert FrameResponse(many.response[:-1] + b"\x00", many.response).kind == CRC
+    assert FrameResponse(with_crc(bytes([100, 0x90, 0x02])), many.response).kind == EXCEPTION
+
+
+def test_read_and_write_round_trip():
+    reply = with_crc(struct.pack(">BBBHH", 100, 3, 4, 1200, 35))
+    client = _client(reply)
+    response = client.read_holding_registers(address=0x0015, count=2, slave=100)
+    assert not response.isError() and response.registers == [1200, 35]
+    assert client.socket.written == [read_request(100, 0x0015, 2)]
+
+    frame = compile_write(100, 0x0001, [50, 1])
+    client = _client(frame.response)
+    assert not client.send_frame(frame).isError()
+    assert client.socket.written == [frame.request]
+
+    client = _client(with_crc(bytes.fromhex("64 06 00 01 00 32")))
+    assert classify_error(client.write_register(address=0x0001, value=50, slave=100)) is None
+
+
+def test_rejects_short_crc_bad_and_exception_frames():
+    good = with_crc(struct.pack(">BBBHH", 100, 3, 4, 1200, 35))
+
+    silent = _client(b"").read_holding_registers(address=0x0015, count=2, slave=100)
+    assert silent.kind == TIMEOUT and classify_error(silent) == TIMEOUT
+
+    short = _client(good[:7]).read_holding_registers(address=0x0015, count=2, slave=100)
+    assert short.kind == CRC
+
+    corrupted = good[:4] + bytes([good[4] ^ 0xFF]) + good[5:]
+    assert _client(corrupted).read_holding_registers(address=0x0015, count=2, slave=100).kind == CRC
+
+    other_slave = with_crc(struct.pack(">BBBHH", 101, 3, 4, 1200, 35))
+    assert _client(other_slave).read_holding_registers(address=0x0015, count=2, slave=100).kind == CRC
+
+    exception = _client(with_crc(bytes([100, 0x83, 0x02]))).read_holding_registers(address=0x0099, slave=100)
+    assert exception.kind == EXCEPTION and exception.exception_code == 2
+    assert classify_error(exception) == EXCEPTION
+
+    bad_exception = with_crc(bytes([100, 0x83, 0x02]))[:-1] + b"\x00"
+    assert _client(bad_exception).read_holding_registers(address=0x0099, slave=100).kind == CRC
+
+    echo = with_crc(bytes.fromhex("64 06 00 01 00 33"))  # 다른 값을 돌려준 FC6 응답
+    assert _client(echo).write_register(address=0x0001, value=50, slave=100).kind == CRC
+
+
+def test_failure_flushes_input_before_next_request():
+    good = with_crc(struct.pack(">BBBH", 100, 3, 2, 7))
+    client = _client(good[:4], good)
+    client._dirty = False
+    assert client.read_holding_registers(address=1, slave=100).isError()
+    resets = client.socket.resets
+    assert client.read_holding_registers(address=1, slave=100).registers == [7]
+    assert client.socket.resets == resets + 1  # 실패 뒤에는 늦게 온 찌꺼기를 버리고 보낸다
+
+
+def test_timeout_is_derived_from_baudrate():
+    client = _client(with_crc(struct.pack(">BBBHH", 1, 3, 4, 0, 0)), baudrate=9600)
+    expected = (8 + 9 + 3.5) * 10 / 9600 + client.turnaround  # 요청 + 응답 + 침묵, 8N1 은 10 비트
+    assert abs(client.response_timeout(8, 9) - expected) < 1e-12
+    client.read_holding_registers(address=0, count=2, slave=1)
+    assert client.socket.timeout == client.response_timeout(8, 9)
+
+    assert _client(timeout=0.2).response_timeout(8, 9) == 0.2  # 고정 타임아웃을 주면 그대로
+    assert abs(silent_interval(9600) - 3.5 * 10 / 9600) < 1e-12
+    assert silent_interval(115200) == 0.00175
@@ -0,0 +1,97 @@
+import pytest
+
+from grinder import scheduler
+from grinder.scheduler import AdaptivePoller, PollGroup, Ticker
+
+
+class FakeClock:
+    """time.monotonic / time.sleep 대신 (sleep 하면 시각만 넘어간다)"""
+    def __init__(self):
+        self.now = 100.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class FakeMotor:
+    def __init__(self, clock, rpm=0, cost=0.0):
+        self.clock = clock
+        self.rpm = rpm
+        self.cost = cost  # 읽기 한 번에 걸리는 시간
+        self.state = {}
+
+    def read_register(self, address, count=1, fresh=False):
+        self.clock.now += self.cost
+        return [self.rpm] * count
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(scheduler.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(scheduler.time, "sleep", clock.sleep)
+    return clock
+
+
+def test_ticker_keeps_absolute_deadlines(clock):
+    ticker = Ticker(0.02)
+    ticker.wait()
+    for work in (0.005, 0.015, 0.0):
+        clock.now += work  # 작업 시간이 달라도 깨어나는 시각은 20ms 간격
+        assert ticker.wait() == pytest.approx(ticker.deadline)
+    assert ticker.stats.mean == pytest.approx(0.02)
+    assert ticker.stats.overruns == 0
+
+
+def test_ticker_skips_missed_periods(clock):
+    ticker = Ticker(0.02)
+    ticker.wait()
+    clock.now += 0.1  # 다섯 주기 밀림 -> 따라잡지 않고 지금부터 다시
+    woke = ticker.wait()
+    assert ticker.stats.overruns == 1 and ticker.deadline == woke
+    assert ticker.wait() == pytest.approx(woke + 0.02)
+
+
+def test_group_speeds_up_on_rpm_change_and_slows_after_hold(clock):
+    motor = FakeMotor(clock, rpm=100)
+    group = PollGroup("rpm", (0x0015,), fast_hz=50, slow_hz=5, hold=1.0)
+    poller = AdaptivePoller(motor, [group])
+    group.deadline = clock.now
+    poller.poll_group(group)
+    assert group.scheduled == "slow" and group.deadline == pytest.approx(100.2)
+
+    clock.now = group.deadline
+    motor.rpm = 500  # rpm_delta 이상 변화 -> 빠른 주기
+    poller.poll_group(group)
+    assert group.scheduled == "fast" and group.deadline == pytest.approx(100.22)
+
+    clock.now = 101.5  # hold 가 지나면 다시 느린 주기
+    poller.poll_group(group)
+    assert group.scheduled == "slow"
+
+
+def test_command_change_pulls_the_slow_deadline_in(clock):
+    motor = FakeMotor(clock, rpm=100)
+    group = PollGroup("rpm", (0x0015,), fast_hz=50, slow_hz=5)
+    poller = AdaptivePoller(motor, [group])
+    group.deadline = clock.now
+    poller.poll_group(group)
+    clock.now += 0.005
+    motor.state[0x0002] = 1  # 방향 전환 명령
+    poller._check_commands()
+    assert group.deadline == pytest.approx(100.02)  # 느린 200ms 대신 다음 빠른 주기
+    assert poller.stats()["rpm"]["mode"] == "fast"
+
+
+def test_slow_bus_counts_overruns(clock):
+    motor = FakeMotor(clock, rpm=100, cost=0.5)  # 읽기가 주기(0.2s)보다 오래 걸림
+    group = PollGroup("rpm", (0x0015,), fast_hz=50, slow_hz=5)
+    poller = AdaptivePoller(motor, [group])
+    group.deadline = clock.now
+    for _ in range(3):
+        poller.poll_group(group)
+    assert group.stats["slow"].overruns == 3
+    assert group.deadline == clock.now
@@ -0,0 +1,29 @@
+from grinder.controller import MotorController
+from grinder.sequence import start_steps, stop_steps
+from grinder.simulator import MotorSimulator
+
+
+def test_steps_follow_driver_profile():
+    assert [(step.name, step.address, step.value) for step in start_steps(40, 2, driver="hoder")] == [
+        ("speed", 0x0024, 40), ("direction", 0x0025, 2), ("brake", 0x0026, 0)]
+    assert [(step.name, step.address, step.value) for step in stop_steps(driver="hoder")] == [
+        ("speed", 0x0024, 0), ("brake", 0x0026, 1)]
+    assert [step.watch for step in start_steps(70, 1, confirm_rpm=30)] == [0x0001, 0x0002, 0x0004, 0x0003, 0x0015]
+
+
+def test_hoder_start_and_stop_write_hoder_registers():
+    with MotorSimulator(slave_id=1, baudrate=9600) as sim:
+        motor = MotorController(port=sim.port, driver="hoder")
+        assert motor.connect()
+        try:
+            assert motor.initialize()
+            result = motor.start_motor(40, direction=2)
+            assert result.ok, result
+            registers = sim.model.registers
+            assert (registers[0x0024], registers[0x0025], registers[0x0026]) == (40, 2, 0)
+            assert (registers[0x0001], registers[0x0003], registers[0x0004]) == (0, 0, 1)  # grinder 맵은 그대로
+
+            assert motor.stop_motor().ok
+            assert (registers[0x0024], registers[0x0026]) == (0, 1)
+        finally:
+            motor.client.close()
@@ -0,0 +1,38 @@
+from grinder.telemetry_poller import SampleRing
+
+
+def test_reader_exactly_one_lap_behind_skips_slot_being_written():
+    ring = SampleRing(capacity=4)
+    subscription = ring.subscribe()
+    for sample in range(4):
+        ring.append(sample)
+    # 쓰는 쪽이 4 번 샘플로 0 번 슬롯을 덮어쓴 직후, seq 를 올리기 전
+    ring.buffer[ring.seq % ring.capacity] = 4
+    samples = subscription.poll()
+    assert samples == [1, 2, 3]
+    assert subscription.dropped == 1
+    assert subscription.cursor == 4
+
+
+def test_read_since_keeps_order_across_wraparound():
+    ring = SampleRing(capacity=4)
+    subscription = ring.subscribe()
+    seen = []
+    for sample in range(10):
+        ring.append(sample)
+        if sample % 3 == 2:
+            seen += subscription.poll()
+    seen += subscription.poll()
+    assert seen == sorted(seen)
+    assert len(seen) + subscription.dropped == 10
+    assert seen[-3:] == [7, 8, 9]
+
+
+def test_poll_group_watches_the_driver_rpm_register():
+    from grinder.scheduler import PollGroup
+    from grinder.telemetry import TelemetrySnapshot
+
+    group = PollGroup("rpm", (0x0030,), rpm_register=0x0030)
+    group.observe(TelemetrySnapshot(timestamp=0.0, registers={0x0030: 100}), now=0.0)
+    group.observe(TelemetrySnapshot(timestamp=0.0, registers={0x0030: 500}), now=0.0)
+    assert group.fast_until == group.hold  # RPM 변화로 빠른 주기
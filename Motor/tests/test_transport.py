@@ -0,0 +1,26 @@
+import pytest
+
+from grinder.controller import MotorController
+from grinder.simulator import FaultInjector, MotorSimulator
+from grinder.transport import CRC, TIMEOUT
+
+
+@pytest.mark.parametrize("backend", ["pymodbus", "rtu"])
+def test_dropped_responses_count_as_timeouts_and_reconnect(backend):
+    faults = FaultInjector(drop_rate=1.0)
+    with MotorSimulator(slave_id=100, faults=faults) as sim:
+        motor = MotorController(port=sim.port, backend=backend)
+        assert motor.connect()
+        try:
+            transport = motor.transport
+            for _ in range(transport.timeouts_before_reconnect + 1):
+                assert motor.read_register(0x0015, fresh=True) is None
+            assert transport.errors[TIMEOUT] >= transport.timeouts_before_reconnect
+            assert transport.errors[CRC] == 0
+            assert transport.reconnects >= 1
+
+            faults.drop_rate = 0.0
+            assert motor.read_register(0x0015, fresh=True) is not None
+            assert transport.recovery_times
+        finally:
+            motor.client.close()
@@ -82,6 +82,43 @@ const int V33_OUT_PIN     = A0; // 3.3V 출력(레퍼런스 측정값)
 // 모터 속도(0~255, 아날로그Write 8비트 해상도)
 int motorSpeed = 100;  
 
+// 텔레메트리 출력 형식: 1 -> 바이너리 프레임, 0 -> 기존 ASCII "a,b,c\n"
+#define TELEMETRY_BINARY 1
+const unsigned long SAMPLE_PERIOD_US = 10000; // 10 ms
+
+// 바이너리 프레임 (little-endian, 15 bytes) - Motor/binary_frames.py 와 형식 동일
+//   sync(0xA5 0x5A) | seq(u16) | timestamp_us(u32) | hallA,B,C(u16 x3) | checksum(u8)
+//   checksum = seq ~ hallC 바이트 합 (mod 256)
+struct __attribute__((packed)) TelemetryFrame {
+  uint8_t  sync[2];
+  uint16_t seq;
+  uint32_t timestamp_us;
+  uint16_t hall[3];
+  uint8_t  checksum;
+};
+
+uint16_t frameSeq = 0;
+unsigned long nextSampleUs = 0;
+
+void sendTelemetryFrame(unsigned long timestampUs, int hallA, int hallB, int hallC) {
+  TelemetryFrame frame;
+  frame.sync[0] = 0xA5;
+  frame.sync[1] = 0x5A;
+  frame.seq = frameSeq++;
+  frame.timestamp_us = timestampUs;
+  frame.hall[0] = hallA;
+  frame.hall[1] = hallB;
+  frame.hall[2] = hallC;
+
+  const uint8_t *bytes = (const uint8_t *)&frame;
+  uint8_t sum = 0;
+  for (uint8_t i = 2; i < sizeof(frame) - 1; i++) {
+    sum += bytes[i];
+  }
+  frame.checksum = sum;
+  Serial.write(bytes, sizeof(frame));
+}
+
 void setup() {
   // 디버그용 시리얼 모니터 초기화
   Serial.begin(115200);
@@ -104,6 +141,16 @@ void setup() {
 }
 
 void loop() {
+  // 샘플 주기는 delay 대신 micros() 기준 마감 시간으로 맞춘다 (출력 시간만큼 밀리지 않음)
+  unsigned long now = micros();
+  if ((long)(now - nextSampleUs) < 0) {
+    return;
+  }
+  nextSampleUs += SAMPLE_PERIOD_US;
+  if ((long)(now - nextSampleUs) > 0) {
+    nextSampleUs = now + SAMPLE_PERIOD_US; // 많이 밀렸으면 다시 맞춤
+  }
+
   // 1) 모터 속도 제어 (PWM 출력)
   analogWrite(PWM_SPEED_PIN, motorSpeed);
 
@@ -119,9 +166,13 @@ void loop() {
   // Serial.print("Motor Speed: ");
   // Serial.print(motorSpeed);
   // Serial.print(" | Hall(A,B,C): ");
+#if TELEMETRY_BINARY
+  sendTelemetryFrame(now, hallA, hallB, hallC);
+#else
   Serial.print(hallA); Serial.print(",");
   Serial.print(hallB); Serial.print(",");
   Serial.println(hallC);
+#endif
   // Serial.print(" | Alarm: ");
   // Serial.print(alarm);
   // Serial.print(" | FG: ");
@@ -139,7 +190,7 @@ void loop() {
     motorSpeed = 0;
   }
 
-  delay(10); // 주기(속도 등 확인)
+  // 주기는 loop() 처음의 SAMPLE_PERIOD_US 마감 시간으로 관리
 }
 
 /*******************************************************